@@ -0,0 +1,174 @@
+"""
+Microbenchmark of the compiled path extractors (youtubesearchpython/core/extractor.py) against the interpretive
+`_getValue` walk they replace, on recorded YouTube responses.
+
+Every renderer (video, channel, playlist, shelf, comment, playlist video) found in the responses is extracted with
+its schema both ways, the outputs must be identical, and the time per renderer is reported.
+
+    python benchmarks/bench_component_parse.py --record "hdr 4k" "nature" --pages 5    # record responses
+    python benchmarks/bench_component_parse.py --responses benchmarks/responses/
+
+Without `--responses`, synthetic search pages are generated.
+The video components of the search handler are also built with the projection on `--fields` (search `fields=`).
+"""
+import os
+import sys
+import json
+import time
+import argparse
+
+ROOT = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..')
+sys.path.insert(0, ROOT)
+sys.path.insert(0, os.path.join(ROOT, 'youtube_search_python'))
+from youtubesearchpython.core.extractor import (videoSchema, channelSchema, playlistSchema, shelfSchema, commentSchema,
+                                                playlistVideoSchema, extractVideo, extractChannel, extractPlaylist,
+                                                extractShelf, extractComment, extractPlaylistVideo)
+from youtubesearchpython.handlers.componenthandler import ComponentHandler
+
+RENDERERS = {
+    'videoRenderer': (videoSchema, extractVideo),
+    'channelRenderer': (channelSchema, extractChannel),
+    'playlistRenderer': (playlistSchema, extractPlaylist),
+    'shelfRenderer': (shelfSchema, extractShelf),
+    'commentRenderer': (commentSchema, extractComment),
+    'playlistVideoRenderer': (playlistVideoSchema, extractPlaylistVideo),
+}
+
+#-------------------------------------------------**********-------------------------------------------------#
+def interpretedValue(source, path):
+    # the getValue walk of the component handlers before the compiled extractors
+    value = source
+    for key in path:
+        if type(key) is str:
+            if key in value.keys():
+                value = value[key]
+            else:
+                value = None
+                break
+        elif type(key) is int:
+            if len(value) != 0:
+                value = value[key]
+            else:
+                value = None
+                break
+    return value
+
+
+def interpretedComponent(schema, source):
+    if isinstance(schema, dict):
+        return {key: interpretedComponent(value, source) for key, value in schema.items()}
+    if isinstance(schema, list):
+        return interpretedValue(source, schema)
+    return schema
+
+
+def findRenderers(tree, found):
+    """
+    Collect the renderers of RENDERERS anywhere in a response.
+    """
+    if isinstance(tree, dict):
+        for key, value in tree.items():
+            if key in RENDERERS and isinstance(value, dict):
+                found.setdefault(key, []).append(value)
+            findRenderers(value, found)
+    elif isinstance(tree, list):
+        for value in tree:
+            findRenderers(value, found)
+    return found
+
+
+def syntheticPage(start, n=20):
+    items = []
+    for i in range(start, start + n):
+        videoId = 'vid%08d' % i
+        items.append({'videoRenderer': {
+            'videoId': videoId,
+            'thumbnail': {'thumbnails': [{'url': f'https://i.ytimg.com/vi/{videoId}/hq720.jpg', 'width': 360, 'height': 202},
+                                         {'url': f'https://i.ytimg.com/vi/{videoId}/hq720_2.jpg', 'width': 720, 'height': 404}]},
+            'title': {'runs': [{'text': f'Video {i}'}], 'accessibility': {'accessibilityData': {'label': f'Video {i} by Channel 2 minutes'}}},
+            'longBylineText': {'runs': [{'text': 'Channel', 'navigationEndpoint': {'browseEndpoint': {'browseId': 'UC%d' % (i % 50)}}}]},
+            'publishedTimeText': {'simpleText': '2 years ago'},
+            'lengthText': {'accessibility': {'accessibilityData': {'label': '2 minutes, 7 seconds'}}, 'simpleText': '2:07'},
+            'viewCountText': {'simpleText': '{:,} views'.format(i * 1000)},
+            'navigationEndpoint': {'commandMetadata': {'webCommandMetadata': {'url': f'/watch?v={videoId}'}}, 'trackingParams': 'x' * 40},
+            'ownerText': {'runs': [{'text': 'Channel', 'navigationEndpoint': {'browseEndpoint': {'browseId': 'UC%d' % (i % 50)}}}]},
+            'shortViewCountText': {'simpleText': f'{i}K views'},
+            'richThumbnail': {'movingThumbnailRenderer': {'movingThumbnailDetails': {'thumbnails': [{'url': 'https://i.ytimg.com/an_webp/x.webp', 'width': 320, 'height': 180}]}}},
+            'detailedMetadataSnippets': [{'snippetText': {'runs': [{'text': 'Description of the video'}]}}],
+            'channelThumbnailSupportedRenderers': {'channelThumbnailWithLinkRenderer': {'thumbnail': {'thumbnails': [{'url': 'https://yt3.ggpht.com/c', 'width': 68, 'height': 68}]}}},
+            'trackingParams': 'x' * 80,
+            'badges': [{'metadataBadgeRenderer': {'label': '4K'}}, {'metadataBadgeRenderer': {'label': 'HDR'}}],
+        }})
+    return {'contents': {'twoColumnSearchResultsRenderer': {'primaryContents': {'sectionListRenderer': {'contents': [{'itemSectionRenderer': {'contents': items}}]}}}}}
+
+
+def record(queries, pages, folder):
+    from youtubesearchpython import VideosSearch
+    os.makedirs(folder, exist_ok=True)
+    for query in queries:
+        search = VideosSearch(query)
+        for page in range(pages):
+            path = os.path.join(folder, f"{query.replace(' ', '_')}_{page}.json")
+            with open(path, 'wb') as f:
+                f.write(search.response)
+            print(f"Recorded {path}")
+            if not search.next():
+                break
+
+#-------------------------------------------------**********-------------------------------------------------#
+def main():
+    parser = argparse.ArgumentParser(description='Compiled path extractors vs interpretive _getValue walks')
+    parser.add_argument('--responses', type=str, default=None, help='Folder of recorded responses (.json)')
+    parser.add_argument('--record', type=str, nargs='*', default=None, help='Record the search responses of these queries')
+    parser.add_argument('--pages', type=int, default=5, help='Pages recorded per query')
+    parser.add_argument('--synthetic_pages', type=int, default=50)
+    parser.add_argument('--repeat', type=int, default=20)
+    parser.add_argument('--fields', type=str, default='id,title,duration,link,channel.id', help='Projection of the video components')
+    args = parser.parse_args()
+
+    if args.record:
+        record(args.record, args.pages, args.responses or os.path.join(ROOT, 'benchmarks', 'responses'))
+        return
+
+    found = {}
+    if args.responses:
+        for name in sorted(os.listdir(args.responses)):
+            if name.endswith('.json'):
+                with open(os.path.join(args.responses, name), encoding='utf-8') as f:
+                    findRenderers(json.load(f), found)
+    else:
+        for page in range(args.synthetic_pages):
+            findRenderers(syntheticPage(page * 20), found)
+
+    failed = False
+    print(f"{'renderer':<22} {'count':>6} {'interpreted us':>15} {'compiled us':>12} {'speedup':>8}  output")
+    for key, renderers in found.items():
+        schema, extract = RENDERERS[key]
+        same = all(interpretedComponent(schema, r) == extract(r) for r in renderers)
+        failed = failed or not same
+        timings = []
+        for function in [lambda r: interpretedComponent(schema, r), extract]:
+            start = time.perf_counter()
+            for _ in range(args.repeat):
+                for r in renderers:
+                    function(r)
+            timings.append((time.perf_counter() - start) / (args.repeat * len(renderers)) * 1e6)
+        print(f"{key:<22} {len(renderers):>6} {timings[0]:>15.2f} {timings[1]:>12.2f} {timings[0] / timings[1]:>7.1f}x  {'identical' if same else 'DIFFERENT'}")
+
+    if 'videoRenderer' in found:
+        elements = [{'videoRenderer': r} for r in found['videoRenderer']]
+        full, projected = ComponentHandler(), ComponentHandler()
+        projected.fields = tuple(args.fields.split(','))
+        timings = []
+        for handler in [full, projected]:
+            start = time.perf_counter()
+            for _ in range(args.repeat):
+                for element in elements:
+                    handler._getVideoComponent(element)
+            timings.append((time.perf_counter() - start) / (args.repeat * len(elements)) * 1e6)
+        print(f"video component: {timings[0]:.2f} us, projected on {args.fields}: {timings[1]:.2f} us ({timings[0] / timings[1]:.1f}x)")
+    sys.exit(1 if failed else 0)
+
+#-------------------------------------------------**********-------------------------------------------------#
+if __name__ == "__main__":
+    main()
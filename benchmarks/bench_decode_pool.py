@@ -0,0 +1,96 @@
+"""
+Throughput benchmark of the multi-video HDR decode pool (hdr_stats.batch_stats).
+
+Every configuration (n_workers processes x ffmpeg threads per worker) decodes all the videos and computes their
+statistics. Frames per second and decoded MB per second (raw frames of the source pixel format) are reported.
+Without `--video_root`, `--n_videos` synthetic 10-bit PQ clips are encoded first.
+
+    python benchmarks/bench_decode_pool.py --configs 1x4,2x2,4x1
+    python benchmarks/bench_decode_pool.py --video_root sample_hdr_shorts/ --max_frames 300
+"""
+import os
+import sys
+import time
+import argparse
+import tempfile
+import subprocess
+import imageio_ffmpeg as ffmpeg
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+from hdr_stats import batch_stats
+from pixel_formats import get_pixel_format
+from video_probe import probe
+
+#-------------------------------------------------**********-------------------------------------------------#
+def make_videos(folder, n_videos, size, duration):
+    """
+    Encode `n_videos` 10-bit HEVC clips of a test pattern tagged as PQ / BT.2020.
+    """
+    videos = []
+    for i in range(n_videos):
+        path = os.path.join(folder, f'clip_{i}.mp4')
+        cmd = [
+            ffmpeg.get_ffmpeg_exe(), '-v', 'error', '-y',
+            '-f', 'lavfi', '-i', f'testsrc2=size={size}:rate=24:duration={duration}',
+            '-pix_fmt', 'yuv420p10le', '-c:v', 'libx265', '-preset', 'ultrafast', '-x265-params', 'log-level=none',
+            '-color_trc', 'smpte2084', '-color_primaries', 'bt2020', '-colorspace', 'bt2020nc',
+            path
+        ]
+        subprocess.run(cmd, check=True)
+        videos.append(path)
+    return videos
+
+
+def default_configs():
+    cores = os.cpu_count()
+    configs = [(1, cores), (cores, 1), (max(1, cores // 2), 2 if cores > 1 else 1)]
+    return sorted(set(configs))
+
+
+def run_config(videos, n_workers, threads, max_frames):
+    """
+    Returns:
+    - (frames, decoded bytes, seconds)
+    """
+    start = time.perf_counter()
+    summaries = batch_stats(videos, n_workers=n_workers, threads=threads, max_frames=max_frames)
+    seconds = time.perf_counter() - start
+    frames = decoded = 0
+    for summary in summaries:
+        info = probe(summary['video'])
+        frames += summary['frames']
+        decoded += summary['frames'] * get_pixel_format(info.pix_fmt).frame_bytes(info.width, info.height)
+    return frames, decoded, seconds
+
+#-------------------------------------------------**********-------------------------------------------------#
+def main():
+    parser = argparse.ArgumentParser(description='Throughput of the multi-video HDR decode pool')
+    parser.add_argument('--video_root', type=str, default=None, help='Folder of videos, synthetic clips if not given')
+    parser.add_argument('--n_videos', type=int, default=8, help='Number of synthetic clips')
+    parser.add_argument('--size', type=str, default='1280x720', help='Frame size of the synthetic clips')
+    parser.add_argument('--duration', type=float, default=5, help='Duration of the synthetic clips in seconds')
+    parser.add_argument('--max_frames', type=int, default=None, help='Frames decoded per video')
+    parser.add_argument('--configs', type=str, default=None, help='Comma separated <n_workers>x<threads>, e.g. 1x8,4x2,8x1')
+    args = parser.parse_args()
+
+    if args.configs:
+        configs = [tuple(int(x) for x in c.split('x')) for c in args.configs.split(',')]
+    else:
+        configs = default_configs()
+
+    with tempfile.TemporaryDirectory() as folder:
+        if args.video_root:
+            videos = [os.path.join(args.video_root, v) for v in sorted(os.listdir(args.video_root)) if v.split('.')[-1] in ['mp4', 'mkv', 'mov', 'webm']]
+        else:
+            print(f"Encoding {args.n_videos} clips of {args.size}, {args.duration}s...")
+            videos = make_videos(folder, args.n_videos, args.size, args.duration)
+
+        print(f"{len(videos)} videos, {os.cpu_count()} cores")
+        print(f"{'workers':>7} {'threads':>7} {'frames':>7} {'seconds':>8} {'fps':>8} {'MB/s':>8}")
+        for n_workers, threads in configs:
+            frames, decoded, seconds = run_config(videos, n_workers, threads, args.max_frames)
+            print(f"{n_workers:>7} {threads:>7} {frames:>7} {seconds:>8.2f} {frames / seconds:>8.1f} {decoded / seconds / 1e6:>8.1f}")
+
+#-------------------------------------------------**********-------------------------------------------------#
+if __name__ == "__main__":
+    main()
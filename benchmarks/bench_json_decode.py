@@ -0,0 +1,81 @@
+"""
+Microbenchmark of the decoding of YouTube responses (youtubesearchpython/core/jsonbackend.py).
+
+For every installed JSON backend (orjson, msgspec, json), the responses are decoded once from the raw bytes, as
+the request handlers do now, and compared with the previous handling: `response.text` decoded to str, then
+`json.loads` on it twice (content path, then fallback path).
+
+    python benchmarks/bench_json_decode.py --responses benchmarks/responses/    # see bench_component_parse.py --record
+    python benchmarks/bench_json_decode.py
+
+Without `--responses`, synthetic search pages are generated.
+"""
+import os
+import sys
+import json
+import time
+import argparse
+
+ROOT = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..')
+sys.path.insert(0, ROOT)
+sys.path.insert(0, os.path.join(ROOT, 'youtube_search_python'))
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+from youtubesearchpython.core import jsonbackend
+from bench_component_parse import syntheticPage
+
+#-------------------------------------------------**********-------------------------------------------------#
+def doubleDecode(content):
+    # the request handler before the single decode: text of the response, parsed for each content path
+    text = content.decode('utf-8')
+    json.loads(text)
+    return json.loads(text)
+
+
+def timeit(function, responses, repeat):
+    start = time.perf_counter()
+    for _ in range(repeat):
+        for content in responses:
+            function(content)
+    return (time.perf_counter() - start) / (repeat * len(responses))
+
+#-------------------------------------------------**********-------------------------------------------------#
+def main():
+    parser = argparse.ArgumentParser(description='Decoding of YouTube responses with every installed JSON backend')
+    parser.add_argument('--responses', type=str, default=None, help='Folder of recorded responses (.json)')
+    parser.add_argument('--synthetic_pages', type=int, default=20)
+    parser.add_argument('--repeat', type=int, default=20)
+    args = parser.parse_args()
+
+    if args.responses:
+        responses = []
+        for name in sorted(os.listdir(args.responses)):
+            if name.endswith('.json'):
+                with open(os.path.join(args.responses, name), 'rb') as f:
+                    responses.append(f.read())
+    else:
+        responses = [json.dumps(syntheticPage(page * 20)).encode('utf-8') for page in range(args.synthetic_pages)]
+    size = sum(len(content) for content in responses) / len(responses)
+    print(f"{len(responses)} responses, {size / 1e3:.0f} kB on average")
+
+    reference = [json.loads(content) for content in responses]
+    baseline = timeit(doubleDecode, responses, args.repeat)
+    failed = False
+    print(f"{'decoder':<22} {'ms / response':>14} {'MB/s':>8} {'speedup':>8}  output")
+    print(f"{'text + 2x json.loads':<22} {baseline * 1e3:>14.3f} {size / baseline / 1e6:>8.1f} {1:>7.1f}x")
+    for backend in jsonbackend.jsonBackends[1:]:
+        try:
+            jsonbackend.setJsonBackend(backend)
+        except Exception:
+            print(f"{backend:<22} {'not installed':>14}")
+            continue
+        same = [jsonbackend.loads(content) for content in responses] == reference
+        failed = failed or not same
+        seconds = timeit(jsonbackend.loads, responses, args.repeat)
+        print(f"{backend:<22} {seconds * 1e3:>14.3f} {size / seconds / 1e6:>8.1f} {baseline / seconds:>7.1f}x  {'identical' if same else 'DIFFERENT'}")
+    jsonbackend.setJsonBackend()
+    print(f"default backend: {jsonbackend.getJsonBackend()}")
+    sys.exit(1 if failed else 0)
+
+#-------------------------------------------------**********-------------------------------------------------#
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,107 @@
+"""
+Benchmark of the lean parse mode of the search handler (youtubesearchpython/core/leanparse.py).
+
+Every response is parsed by `RequestHandler._parseSource` with the full decode and in lean mode, where only the items
+of the content path are decoded. The result items and continuation key must be identical; the time and the peak
+memory allocated per response are reported.
+
+    python benchmarks/bench_lean_parse.py --responses benchmarks/responses/    # see bench_component_parse.py --record
+    python benchmarks/bench_lean_parse.py --overhead_kb 400
+
+Without `--responses`, synthetic search pages are generated, with `--overhead_kb` of the subtrees a search response
+carries besides its results (responseContext, topbar, refinements, frameworkUpdates...).
+"""
+import os
+import sys
+import json
+import time
+import argparse
+import tracemalloc
+
+ROOT = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..')
+sys.path.insert(0, ROOT)
+sys.path.insert(0, os.path.join(ROOT, 'youtube_search_python'))
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+from youtubesearchpython.handlers.requesthandler import RequestHandler
+from bench_component_parse import syntheticPage
+
+
+class Page(RequestHandler):
+    def __init__(self, response, lean):
+        self.response = response
+        self.lean = lean
+        self.responseSource = None
+        self.continuationKey = None
+
+#-------------------------------------------------**********-------------------------------------------------#
+def syntheticResponse(page, overheadKb):
+    response = syntheticPage(page * 20)
+    contents = response['contents']['twoColumnSearchResultsRenderer']['primaryContents']['sectionListRenderer']['contents']
+    contents.append({'continuationItemRenderer': {'continuationEndpoint': {'continuationCommand': {'token': 'token%d' % (page + 1)}}}})
+    # subtrees never read by the search handler, about 100 bytes per mutation
+    mutations = [{'entityKey': 'key%06d' % i, 'type': 'ENTITY_MUTATION_TYPE_REPLACE',
+                  'payload': {'macroMarkersListEntity': {'markersList': {'markerType': 'MARKER_TYPE_HEATMAP'}}}}
+                 for i in range(overheadKb * 10)]
+    overhead = {
+        'responseContext': {'serviceTrackingParams': [{'service': 'GFEEDBACK', 'params': [{'key': 'e', 'value': '2380' * 50}]}]},
+        'estimatedResults': '123456',
+        'trackingParams': 'x' * 80,
+        'topbar': {'desktopTopbarRenderer': {'logo': {'topbarLogoRenderer': {'iconImage': {'iconType': 'YOUTUBE_LOGO'}}}}},
+        'refinements': ['hdr %d' % i for i in range(20)],
+        'frameworkUpdates': {'entityBatchUpdate': {'mutations': mutations}},
+    }
+    return json.dumps(dict(overhead, **response)).encode('utf-8')
+
+
+def parse(response, lean):
+    page = Page(response, lean)
+    page._parseSource()
+    return page.responseSource, page.continuationKey
+
+
+def measure(responses, lean, repeat):
+    start = time.perf_counter()
+    for _ in range(repeat):
+        for response in responses:
+            parse(response, lean)
+    seconds = (time.perf_counter() - start) / (repeat * len(responses))
+    peaks = []
+    for response in responses:
+        tracemalloc.start()
+        parse(response, lean)
+        peaks.append(tracemalloc.get_traced_memory()[1])
+        tracemalloc.stop()
+    return seconds, max(peaks)
+
+#-------------------------------------------------**********-------------------------------------------------#
+def main():
+    parser = argparse.ArgumentParser(description='Lean (selective) parse vs full decode of search responses')
+    parser.add_argument('--responses', type=str, default=None, help='Folder of recorded responses (.json)')
+    parser.add_argument('--synthetic_pages', type=int, default=20)
+    parser.add_argument('--overhead_kb', type=int, default=400, help='Size of the unused subtrees of the synthetic pages')
+    parser.add_argument('--repeat', type=int, default=10)
+    args = parser.parse_args()
+
+    if args.responses:
+        responses = []
+        for name in sorted(os.listdir(args.responses)):
+            if name.endswith('.json'):
+                with open(os.path.join(args.responses, name), 'rb') as f:
+                    responses.append(f.read())
+    else:
+        responses = [syntheticResponse(page, args.overhead_kb) for page in range(args.synthetic_pages)]
+    size = sum(len(response) for response in responses) / len(responses)
+    print(f"{len(responses)} responses, {size / 1e3:.0f} kB on average")
+
+    same = all(parse(response, True) == parse(response, False) for response in responses)
+    full = measure(responses, False, args.repeat)
+    lean = measure(responses, True, args.repeat)
+    print(f"{'mode':<6} {'ms / response':>14} {'peak MB':>8}")
+    print(f"{'full':<6} {full[0] * 1e3:>14.3f} {full[1] / 1e6:>8.2f}")
+    print(f"{'lean':<6} {lean[0] * 1e3:>14.3f} {lean[1] / 1e6:>8.2f}")
+    print(f"speedup {full[0] / lean[0]:.1f}x, peak memory {full[1] / lean[1]:.1f}x lower, output {'identical' if same else 'DIFFERENT'}")
+    sys.exit(0 if same else 1)
+
+#-------------------------------------------------**********-------------------------------------------------#
+if __name__ == "__main__":
+    main()
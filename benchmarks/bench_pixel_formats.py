@@ -0,0 +1,120 @@
+"""
+Benchmark of the pixel format registry (pixel_formats.py) used by the HDR frame readers.
+
+For every registered pixel format:
+- synthetic: a long raw stream where every plane of frame i is filled with a value derived from i is read back
+  frame by frame with FrameConverter. Any error in the frame size or the plane offsets shifts the following
+  frames (desync) and is reported with the first wrong frame.
+- ffmpeg: ffmpeg encodes `--ffmpeg_frames` frames of a test pattern to the raw pixel format (also with an odd frame
+  size), the output size must be an exact multiple of the registry frame size and read back to the same frame count.
+
+    python benchmarks/bench_pixel_formats.py --frames 5000 --width 320 --height 180
+"""
+import io
+import os
+import sys
+import time
+import argparse
+import subprocess
+import imageio_ffmpeg as ffmpeg
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+from pixel_formats import PIXEL_FORMATS
+from read_hdr_10bit import FrameConverter
+
+#-------------------------------------------------**********-------------------------------------------------#
+def plane_values(fmt, frame_index):
+    """
+    Value of every plane of a synthetic frame: distinct per frame and per plane.
+    """
+    max_value = (1 << fmt.bit_depth) - 1
+    names = ['rgb'] if fmt.family == 'rgb' else ['y', 'u', 'v']
+    return {name: ((frame_index * 7 + p * 101) % max_value) << fmt.shift for p, name in enumerate(names)}
+
+
+def synthetic_frame(fmt, width, height, frame_index):
+    frame = bytearray(fmt.frame_bytes(width, height))
+    planes = fmt.planes(frame, width, height)
+    for name, value in plane_values(fmt, frame_index).items():
+        planes[name][...] = value
+    return bytes(frame)
+
+
+def check_synthetic(fmt, width, height, n_frames):
+    """
+    Returns:
+    - (frames read, index of the first desynchronized frame or None, seconds)
+    """
+    stream = io.BytesIO(b''.join(synthetic_frame(fmt, width, height, i) for i in range(n_frames)))
+    layout = 'rgb' if fmt.family == 'rgb' else 'planar'
+    converter = FrameConverter(width, height, fmt.name, layout=layout)
+    count, desync = 0, None
+    start = time.perf_counter()
+    while converter.read(stream):
+        if desync is None:
+            for name, value in plane_values(fmt, count).items():
+                plane = converter.planes[name]
+                if plane[0].min() != value or plane[-1].max() != value:
+                    desync = count
+        converter.convert()
+        count += 1
+    return count, desync, time.perf_counter() - start
+
+
+def check_ffmpeg(fmt, width, height, n_frames):
+    """
+    Returns:
+    - (bytes written by ffmpeg, frames read back)
+    """
+    cmd = [
+        ffmpeg.get_ffmpeg_exe(), '-v', 'error',
+        '-f', 'lavfi', '-i', 'testsrc2=size=320x180:rate=25',
+        '-frames:v', str(n_frames),
+        '-vf', f'scale={width}:{height}',
+        '-f', 'rawvideo', '-pix_fmt', fmt.name, '-'
+    ]
+    raw = subprocess.run(cmd, stdout=subprocess.PIPE, stderr=subprocess.DEVNULL).stdout
+    layout = 'rgb' if fmt.family == 'rgb' else 'planar'
+    converter = FrameConverter(width, height, fmt.name, layout=layout)
+    stream = io.BytesIO(raw)
+    count = 0
+    while converter.read(stream):
+        converter.convert()
+        count += 1
+    return len(raw), count
+
+#-------------------------------------------------**********-------------------------------------------------#
+def main():
+    parser = argparse.ArgumentParser(description='Frame size / desync benchmark of the pixel format registry')
+    parser.add_argument('--frames', type=int, default=2000, help='Frames of the synthetic stream')
+    parser.add_argument('--width', type=int, default=320)
+    parser.add_argument('--height', type=int, default=180)
+    parser.add_argument('--ffmpeg_frames', type=int, default=50, help='Frames encoded by ffmpeg (0 to skip)')
+    args = parser.parse_args()
+
+    failed = False
+    print(f"{'pix_fmt':<12} {'frame bytes':>12} {'frames':>7} {'desync':>7} {'fps':>9} {'MB/s':>8}   ffmpeg")
+    for fmt in PIXEL_FORMATS.values():
+        frame_bytes = fmt.frame_bytes(args.width, args.height)
+        count, desync, seconds = check_synthetic(fmt, args.width, args.height, args.frames)
+        ok = count == args.frames and desync is None
+        line = f"{fmt.name:<12} {frame_bytes:>12} {count:>7} {str(desync):>7} {count / seconds:>9.0f} {count * frame_bytes / seconds / 1e6:>8.0f}"
+
+        if args.ffmpeg_frames:
+            results = []
+            # even and odd frame sizes (chroma planes rounded up)
+            for width, height in [(args.width, args.height), (args.width + 1, args.height + 1)]:
+                size, frames = check_ffmpeg(fmt, width, height, args.ffmpeg_frames)
+                exact = size == args.ffmpeg_frames * fmt.frame_bytes(width, height) and frames == args.ffmpeg_frames
+                ok = ok and exact
+                results.append(f"{width}x{height} {'ok' if exact else f'MISMATCH ({size} bytes, {frames} frames)'}")
+            line += "   " + ", ".join(results)
+        print(line)
+        failed = failed or not ok
+
+    print("No desync." if not failed else "DESYNC DETECTED.")
+    sys.exit(1 if failed else 0)
+
+#-------------------------------------------------**********-------------------------------------------------#
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,74 @@
+"""
+Memory benchmark of the compact result records (youtubesearchpython/core/records.py) against the component dicts.
+
+`--n_results` video results are built from synthetic search pages by the search component handler, once as dicts and
+once as records (search `records=True`), and kept in memory as a crawl does for de-duplication and analysis.
+The memory held per result (tracemalloc, after the responses are released) and the build time are reported, and the
+dict views of the records must equal the dicts.
+
+    python benchmarks/bench_result_records.py --n_results 1000000
+"""
+import os
+import sys
+import json
+import time
+import argparse
+import tracemalloc
+
+ROOT = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..')
+sys.path.insert(0, ROOT)
+sys.path.insert(0, os.path.join(ROOT, 'youtube_search_python'))
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+from youtubesearchpython.handlers.componenthandler import ComponentHandler
+from bench_component_parse import syntheticPage
+
+#-------------------------------------------------**********-------------------------------------------------#
+def build(n_results, records, traced):
+    """
+    Returns:
+    - (results, bytes held by the results if traced, seconds spent building them)
+    """
+    handler = ComponentHandler()
+    handler.records = records
+    results = []
+    seconds = 0
+    if traced:
+        tracemalloc.start()
+    for page in range(0, n_results, 20):
+        # every page is decoded from its JSON, the results own their strings as with real responses
+        response = json.loads(json.dumps(syntheticPage(page)))
+        elements = response['contents']['twoColumnSearchResultsRenderer']['primaryContents']['sectionListRenderer']['contents'][0]['itemSectionRenderer']['contents']
+        start = time.perf_counter()
+        for element in elements[:n_results - page]:
+            results.append(handler._getVideoComponent(element))
+        seconds += time.perf_counter() - start
+        del response, elements
+    if not traced:
+        return results, None, seconds
+    held = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return results, held, seconds
+
+#-------------------------------------------------**********-------------------------------------------------#
+def main():
+    parser = argparse.ArgumentParser(description='Memory of the result records vs the component dicts')
+    parser.add_argument('--n_results', type=int, default=100000)
+    args = parser.parse_args()
+
+    # build times without tracemalloc, which slows down every allocation
+    dictSeconds = build(args.n_results, False, False)[2]
+    recordSeconds = build(args.n_results, True, False)[2]
+    dicts, dictBytes, _ = build(args.n_results, False, True)
+    records, recordBytes, _ = build(args.n_results, True, True)
+    same = all(r.to_dict() == d for r, d in zip(records, dicts))
+
+    print(f"{args.n_results} video results")
+    print(f"{'form':<8} {'bytes / result':>15} {'total MB':>9} {'build us':>9}")
+    print(f"{'dict':<8} {dictBytes / args.n_results:>15.0f} {dictBytes / 1e6:>9.1f} {dictSeconds / args.n_results * 1e6:>9.2f}")
+    print(f"{'record':<8} {recordBytes / args.n_results:>15.0f} {recordBytes / 1e6:>9.1f} {recordSeconds / args.n_results * 1e6:>9.2f}")
+    print(f"memory {dictBytes / recordBytes:.1f}x lower, to_dict() {'identical' if same else 'DIFFERENT'}")
+    sys.exit(0 if same else 1)
+
+#-------------------------------------------------**********-------------------------------------------------#
+if __name__ == "__main__":
+    main()
@@ -1,94 +1,126 @@
-""" 
+"""
     Checking the metadata of video file to verify if it is HDR or not.
 
+    Whole folders are scanned in parallel with a single ffprobe per video (video_probe.py). The results are kept in an
+    index file (JSONL, one entry per video keyed by path, mtime and size), so re-runs only probe new or changed videos.
+
     - Shreshth Saini, 2022
 """
 
 
-import subprocess
 import json
 import os
 import argparse
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+from video_probe import probe, file_identity, ProbeCache
 #--------------------------------------------------------------*****--------------------------------------------------------------#
 
 def is_video_hdr(video_path):
     """
     Check if the video at the given path is HDR.
-    
+
     Args:
     - video_path (str): The path to the video file.
-    
+
     Returns:
     - bool: True if the video is HDR, False otherwise.
     """
-    cmd = [
-        "ffprobe", 
-        "-v", "error", 
-        "-show_streams",
-        "-select_streams", "v:0",
-        "-print_format", "json",
-        video_path
-    ]
-
-    result = subprocess.run(cmd, capture_output=True, text=True)
     try:
-        video_info = json.loads(result.stdout)
-    except json.JSONDecodeError:
-        print(f"Failed to decode JSON: {result.stdout}")
-        
+        return probe(video_path).is_hdr
+    except (ValueError, OSError) as e:
+        print(e)
         return False
-    print(video_info)
-    video_stream = video_info["streams"][0]
 
-    # Checking some common HDR indicators in the metadata
-    # This can be extended based on more specific requirements
-    if ("color_transfer" in video_stream and video_stream["color_transfer"] == "smpte2084") or \
-       ("color_space" in video_stream and video_stream["color_space"] in ["bt2020nc", "bt2020c"]) or \
-       ("bits_per_raw_sample" in video_stream and int(video_stream["bits_per_raw_sample"]) > 8):
-        return True
+#--------------------------------------------------------------*****--------------------------------------------------------------#
+def probe_entry(video_path, cache):
+    # unreadable video, file removed during the scan (FileNotFoundError) or ffprobe not found (OSError)
+    try:
+        return probe(video_path, cache)
+    except (ValueError, OSError) as e:
+        print(e)
+        return None
 
-    return False
+
+def scan(video_paths, cache, n_workers=8):
+    """
+    Probe the videos missing from the cache (new or changed) on a pool of `n_workers` threads, one ffprobe each.
+    Every result is appended to the cache as soon as it is ready, an interrupted scan keeps its progress.
+
+    Args:
+    - video_paths (list): paths of the videos.
+    - cache (ProbeCache): the probe index.
+    - n_workers (int): number of ffprobe processes running in parallel.
+
+    Returns:
+    - dict: path -> ProbeResult of every probed video
+    """
+    entries = {}
+    to_probe = []
+    for v in video_paths:
+        try:
+            info = cache.get(file_identity(v))
+        except OSError as e:
+            # removed file or broken symlink, reported as not probed
+            print(e)
+            continue
+        if info is None:
+            to_probe.append(v)
+        else:
+            entries[v] = info
+    print(f"Videos: {len(video_paths)}, cached: {len(entries)}, to probe: {len(to_probe)}")
+
+    # ffprobe runs in its own process, threads are enough to keep n_workers of them busy
+    with ThreadPoolExecutor(max_workers=n_workers) as pool:
+        futures = {pool.submit(probe_entry, v, cache): v for v in to_probe}
+        for future in as_completed(futures):
+            info = future.result()
+            if info is not None:
+                entries[futures[future]] = info
+    return entries
 
 #--------------------------------------------------------------*****--------------------------------------------------------------#
-""" 
+"""
     Main Function
 """
-def main(path):
-    # check if path is folder or a file 
+def main(path, index_file=None, n_workers=8, save_json=False):
+    # check if path is folder or a file
     if os.path.isdir(path):
         vid_list = os.listdir(path)
         video_path = [os.path.join(path,v) for v in vid_list if v.split('.')[-1] in ['mp4', 'mkv', 'mov', 'webm']]
+        index_file = index_file or os.path.join(path, 'hdr_index.jsonl')
     else:
         video_path = [path]
+        index_file = index_file or os.path.join(os.path.dirname(path) or '.', 'hdr_index.jsonl')
 
+    entries = scan(video_path, ProbeCache(index_file), n_workers)
+
+    n_hdr = 0
     for v in video_path:
-        print(f"Checking {v}...")
-        if is_video_hdr(v):
-            print(f"{v} is HDR.")
+        info = entries.get(v)
+        if info is None:
+            print(f"{v} could not be probed.")
+            continue
+        n_hdr += info.is_hdr
+        if info.is_hdr:
+            print(f"{v} is HDR ({info.color_transfer}, {info.color_primaries}, {info.bit_depth}-bit).")
         else:
             print(f"{v} is not HDR.")
 
-        #also print all meta data of video file 
-        cmd = [
-            "ffprobe", 
-            "-v", "error", 
-            "-show_streams",
-            "-select_streams", "v:0",
-            "-print_format", "json",
-            v
-        ]
-        result = subprocess.run(cmd, capture_output=True, text=True)
-        video_info = json.loads(result.stdout)
-        #save in json file in same folder
-        with open(v.split('.')[0] + '.json', 'w') as f:
-            json.dump(video_info, f, indent=4)
+        #also save the meta data of video file in json file in same folder
+        if save_json:
+            with open(v.split('.')[0] + '.json', 'w') as f:
+                json.dump(dict(info.to_dict(), is_hdr=info.is_hdr), f, indent=4)
+    print(f"HDR videos: {n_hdr} / {len(video_path)}, index: {index_file}")
 
 #--------------------------------------------------------------*****--------------------------------------------------------------#
 
 if __name__ == "__main__":
     parser = argparse.ArgumentParser()
     parser.add_argument("--video_root", type=str, default="sample_hdr_shorts/")
+    parser.add_argument("--index_file", type=str, default=None, help="Probe index (JSONL), defaults to hdr_index.jsonl in the video folder")
+    parser.add_argument("--n_workers", type=int, default=8, help="Number of ffprobe processes running in parallel")
+    parser.add_argument("--save_json", action="store_true", help="Also save the metadata of every video in a json file next to it")
     args = parser.parse_args()
     video_root = args.video_root
-    main(video_root)
-
+    main(video_root, args.index_file, args.n_workers, args.save_json)
@@ -0,0 +1,249 @@
+"""
+    Columnar (Arrow / Parquet) export of search, playlist and comment results.
+
+    The nested components of the search handlers are flattened into typed columns: durations in seconds and view
+    counts as integers, channel ids and names as their own columns, thumbnails as lists of URLs. Tables are written
+    as Parquet or Arrow IPC files in row groups, so that downstream jobs read only the columns they need, memory-mapped:
+
+        read_results('searched_csv/videos.arrow', columns=['id', 'link', 'durationSeconds'])
+
+    Requires pyarrow.
+"""
+import os
+import re
+import json
+import argparse
+
+is_pyarrow_installed = False
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+    is_pyarrow_installed = True
+except ImportError:
+    pass
+
+FORMATS = ['parquet', 'arrow']
+
+# Keys of the components of every kind of result, the other keys of a row (e.g. keyword) are extra columns
+COMPONENT_KEYS = {
+    'video': ['type', 'id', 'title', 'publishedTime', 'duration', 'viewCount', 'thumbnails', 'richThumbnail', 'descriptionSnippet', 'channel', 'accessibility', 'link', 'shelfTitle'],
+    'playlist': ['id', 'title', 'thumbnails', 'link', 'channel', 'duration', 'accessibility', 'isPlayable'],
+    'comment': ['id', 'author', 'content', 'published', 'isLiked', 'authorIsChannelOwner', 'voteStatus', 'votes', 'replyCount'],
+}
+# Keys holding dicts or lists, written as their Python repr in csv files
+NESTED_KEYS = {
+    'video': ['viewCount', 'thumbnails', 'richThumbnail', 'descriptionSnippet', 'channel', 'accessibility'],
+    'playlist': ['thumbnails', 'channel', 'accessibility'],
+    'comment': ['author', 'votes'],
+}
+
+#--------------------------------------------------------------*****--------------------------------------------------------------#
+def parse_duration(text):
+    """
+    Duration text of YouTube ('4:40', '1:02:03') -> seconds, None if it is missing or not a duration (e.g. live).
+    """
+    if not isinstance(text, str) or not text:
+        return None
+    seconds = 0
+    for part in text.split(':'):
+        if not part.isdigit():
+            return None
+        seconds = seconds * 60 + int(part)
+    return seconds
+
+
+_COUNT = re.compile(r'(\d[\d,.]*)\s*([KMB]?)\b')
+_MULTIPLIERS = {'': 1, 'K': 1000, 'M': 1000000, 'B': 1000000000}
+
+def parse_count(text):
+    """
+    Count text of YouTube ('1,234,567 views', '1.2M views', 'No views', '57 watching', '3') -> int, None if missing.
+    Short counts ('1.2M') are approximate.
+    """
+    if isinstance(text, int):
+        return text
+    if not isinstance(text, str):
+        return None
+    match = _COUNT.search(text)
+    if match is None:
+        return 0 if text.lower().startswith('no ') else None
+    number, suffix = match.groups()
+    if suffix:
+        return int(float(number.replace(',', '')) * _MULTIPLIERS[suffix])
+    return int(re.sub(r'\D', '', number))
+
+
+def _nested(row, *keys):
+    for key in keys:
+        if not isinstance(row, dict):
+            return None
+        row = row.get(key)
+    return row
+
+def _urls(thumbnails):
+    if not thumbnails:
+        return None
+    if isinstance(thumbnails, dict):
+        thumbnails = [thumbnails]
+    return [t.get('url') for t in thumbnails]
+
+def _text(runs):
+    if not runs:
+        return None
+    return ''.join(run.get('text', '') for run in runs)
+
+#--------------------------------------------------------------*****--------------------------------------------------------------#
+# (column, type, value of the column from a component dict) of every kind of result
+if is_pyarrow_installed:
+    COLUMNS = {
+        # search results (ComponentHandler._getVideoComponent)
+        'video': [
+            ('type', pa.string(), lambda r: r.get('type')),
+            ('id', pa.string(), lambda r: r.get('id')),
+            ('title', pa.string(), lambda r: r.get('title')),
+            ('publishedTime', pa.string(), lambda r: r.get('publishedTime')),
+            ('duration', pa.string(), lambda r: r.get('duration')),
+            ('durationSeconds', pa.int32(), lambda r: parse_duration(r.get('duration'))),
+            ('viewCount', pa.int64(), lambda r: parse_count(_nested(r, 'viewCount', 'text'))),
+            ('channelName', pa.string(), lambda r: _nested(r, 'channel', 'name')),
+            ('channelId', pa.string(), lambda r: _nested(r, 'channel', 'id')),
+            ('channelLink', pa.string(), lambda r: _nested(r, 'channel', 'link')),
+            ('link', pa.string(), lambda r: r.get('link')),
+            ('thumbnails', pa.list_(pa.string()), lambda r: _urls(r.get('thumbnails'))),
+            ('richThumbnail', pa.string(), lambda r: _nested(r, 'richThumbnail', 'url')),
+            ('descriptionSnippet', pa.string(), lambda r: _text(r.get('descriptionSnippet'))),
+            ('shelfTitle', pa.string(), lambda r: r.get('shelfTitle')),
+        ],
+        # videos of a playlist (Playlist.videos)
+        'playlist': [
+            ('id', pa.string(), lambda r: r.get('id')),
+            ('title', pa.string(), lambda r: r.get('title')),
+            ('duration', pa.string(), lambda r: r.get('duration')),
+            ('durationSeconds', pa.int32(), lambda r: parse_duration(r.get('duration'))),
+            ('channelName', pa.string(), lambda r: _nested(r, 'channel', 'name')),
+            ('channelId', pa.string(), lambda r: _nested(r, 'channel', 'id')),
+            ('channelLink', pa.string(), lambda r: _nested(r, 'channel', 'link')),
+            ('link', pa.string(), lambda r: r.get('link')),
+            ('thumbnails', pa.list_(pa.string()), lambda r: _urls(r.get('thumbnails'))),
+            ('isPlayable', pa.bool_(), lambda r: r.get('isPlayable')),
+        ],
+        # comments of a video (Comments.comments['result'])
+        'comment': [
+            ('id', pa.string(), lambda r: r.get('id')),
+            ('authorId', pa.string(), lambda r: _nested(r, 'author', 'id')),
+            ('authorName', pa.string(), lambda r: _nested(r, 'author', 'name')),
+            ('authorThumbnails', pa.list_(pa.string()), lambda r: _urls(_nested(r, 'author', 'thumbnails'))),
+            ('content', pa.string(), lambda r: r.get('content')),
+            ('published', pa.string(), lambda r: r.get('published')),
+            ('isLiked', pa.bool_(), lambda r: r.get('isLiked')),
+            ('authorIsChannelOwner', pa.bool_(), lambda r: r.get('authorIsChannelOwner')),
+            ('voteStatus', pa.string(), lambda r: r.get('voteStatus')),
+            ('votes', pa.int64(), lambda r: parse_count(_nested(r, 'votes', 'simpleText'))),
+            ('replyCount', pa.int64(), lambda r: parse_count(r.get('replyCount'))),
+        ],
+    }
+
+
+def schema(kind='video', extra_columns=()):
+    """
+    Arrow schema of the results of `kind` ('video', 'playlist' or 'comment'), `extra_columns` are string columns.
+    """
+    return pa.schema([(name, type) for name, type, _ in COLUMNS[kind]] + [(c, pa.string()) for c in extra_columns])
+
+
+def to_table(rows, kind='video', extra_columns=()):
+    """
+    Flatten result components (dicts, or records with `to_dict()`) into a typed Arrow table.
+
+    Parameters:
+    - rows: list of components of `kind`
+    - kind: str, 'video' (search results), 'playlist' (videos of a playlist) or 'comment'
+    - extra_columns: list of keys of the rows written as string columns (e.g. the searched keyword)
+    """
+    if not is_pyarrow_installed:
+        raise Exception('ERROR: pyarrow is not installed. pyarrow must be installed for the columnar export.')
+    rows = [row if isinstance(row, dict) else row.to_dict() for row in rows]
+    columns = [pa.array([value(row) for row in rows], type=type) for _, type, value in COLUMNS[kind]]
+    columns += [pa.array([None if row.get(c) is None else str(row.get(c)) for row in rows], type=pa.string()) for c in extra_columns]
+    return pa.Table.from_arrays(columns, schema=schema(kind, extra_columns))
+
+
+def write_table(table, path, output_format='parquet', row_group_size=None):
+    """
+    Write a table as a Parquet file or an Arrow IPC file, in row groups (record batches) of `row_group_size` rows.
+    """
+    if output_format == 'parquet':
+        pq.write_table(table, path, row_group_size=row_group_size)
+    elif output_format == 'arrow':
+        with pa.OSFile(path, 'wb') as sink, pa.ipc.new_file(sink, table.schema) as writer:
+            for batch in table.to_batches(max_chunksize=row_group_size):
+                writer.write_batch(batch)
+    else:
+        raise ValueError(f"Unknown columnar format: {output_format}")
+
+
+def export_results(rows, path, kind='video', output_format=None, row_group_size=65536):
+    """
+    Write results of `kind` to a single Parquet / Arrow file, the format defaults to the extension of `path`.
+    """
+    output_format = output_format or os.path.splitext(path)[1].lstrip('.')
+    write_table(to_table(rows, kind), path, output_format, row_group_size)
+
+
+def read_results(path, columns=None):
+    """
+    Read the selected columns of a Parquet / Arrow file, or of a dataset directory of part files (result_writers.py).
+    Files are memory-mapped: only the pages of the selected columns are read from disk.
+    """
+    if os.path.isdir(path):
+        parts = [os.path.join(path, f) for f in sorted(os.listdir(path)) if f.endswith(('.parquet', '.arrow'))]
+    else:
+        parts = [path]
+    tables = []
+    for part in parts:
+        if part.endswith('.arrow'):
+            table = pa.ipc.open_file(pa.memory_map(part)).read_all()
+            tables.append(table.select(columns) if columns else table)
+        else:
+            tables.append(pq.read_table(part, columns=columns, memory_map=True))
+    if not tables:
+        return None
+    return pa.concat_tables(tables)
+
+#--------------------------------------------------------------*****--------------------------------------------------------------#
+def read_components(path, kind='video'):
+    """
+    Result components of a csv or jsonl file of the search script. The nested values of csv files (NESTED_KEYS) are
+    Python reprs, other values are kept as strings (e.g. a title starting with '[').
+    """
+    import ast
+    import pandas as pd
+    if path.endswith('.jsonl'):
+        with open(path, encoding='utf-8') as f:
+            return [json.loads(line) for line in f if line.strip()]
+    rows = pd.read_csv(path, dtype=str, keep_default_na=False).to_dict('records')
+    for row in rows:
+        for key, value in row.items():
+            if value == '':
+                row[key] = None
+            elif key in NESTED_KEYS[kind]:
+                try:
+                    row[key] = ast.literal_eval(value)
+                except (ValueError, SyntaxError):
+                    # not a repr (e.g. a projected text field), kept as it is
+                    pass
+    return rows
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description='Convert csv / jsonl search results to typed Parquet / Arrow columns')
+    parser.add_argument("--input", type=str, help="Result file of the search script (csv or jsonl)")
+    parser.add_argument("--output", type=str, help="Output file (.parquet or .arrow)")
+    parser.add_argument("--kind", type=str, default="video", choices=["video", "playlist", "comment"])
+    parser.add_argument("--row_group_size", type=int, default=65536)
+    args = parser.parse_args()
+
+    rows = read_components(args.input, args.kind)
+    extra_columns = [c for c in (rows[0] if rows else {}) if c not in COMPONENT_KEYS[args.kind]]
+    write_table(to_table(rows, args.kind, extra_columns), args.output, os.path.splitext(args.output)[1].lstrip('.'), args.row_group_size)
+    print(f"{len(rows)} results written to {args.output}")
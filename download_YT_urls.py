@@ -6,6 +6,13 @@ from tqdm import tqdm
 from joblib import Parallel, delayed
 from glob import glob
 import argparse
+import signal
+
+from seen_store import SeenStore
+from download_engine import FORMAT_CHOICES, get_downloader
+from download_scheduler import PRIORITIES, DownloadScheduler
+from download_manifest import DownloadManifest
+from columnar_export import parse_duration, read_results
 
 #--------------------------------------------------------------*****--------------------------------------------------------------#
 """ 
@@ -47,27 +54,22 @@ def get_best_format(url):
 """ 
     Core function to download the video from the url and save it in the folder
 """
-def download_video(save_folder, d, duration, urls, files, i, format_vid='any'):
+def download_video(save_folder, d, duration, url, format_vid='any', store=None, manifest=None):
     
     # save the video in the folder with id_duration
-    file_name = save_folder + d + "_" + duration[i] + ".%(ext)s"
-    
-    # If file already exists, skip
-    if d in files:
-        print("File already exists: ",d)
-        return
+    file_name = save_folder + d + "_" + duration + ".%(ext)s"
 
     # Download format options from the url from function: avoid MP4 format as it does not contain any metadata
     if format_vid == 'MP4':
-        format = get_best_mp4_format(urls[i])
+        format = get_best_mp4_format(url)
     else: 
-        format = get_best_format(urls[i])
+        format = get_best_format(url)
 
     command = [
         "yt-dlp",
         "-f",
         str(format),
-        urls[i],
+        url,
         "-o",
         file_name
     ]
@@ -88,7 +90,7 @@ def download_video(save_folder, d, duration, urls, files, i, format_vid='any'):
             break
 
     if error_occurred:
-        for filepath in glob(save_folder + d + "_" + duration[i] + "*.*"):
+        for filepath in glob(save_folder + d + "_" + duration + "*.*"):
             try:
                 os.remove(filepath)  
                 print("Downloaded file removed.")
@@ -97,56 +99,137 @@ def download_video(save_folder, d, duration, urls, files, i, format_vid='any'):
 
     if process.returncode == 0:
         print("Downloaded: ",d)
+        saved = [f for f in glob(save_folder + d + "_" + duration + ".*") if not f.endswith(('.part', '.ytdl'))]
+        file_path = saved[0] if saved else file_name
+        # record the download in the manifest and the seen-ID store shared with the search script
+        if manifest is not None:
+            manifest.record(d, file_path, format)
+        if store is not None:
+            store.mark_downloaded(d, file_path)
     else:
         print(f"Download failed: {process.returncode}")
-        print("Error occured: ",urls[i])   
+        print("Error occured: ",url)   
+        if manifest is not None:
+            manifest.record(d, format_id=format, status='failed')
 
     return 
 
 
+def download_videos_api(save_folder, rows, format_vid='any', store=None, manifest=None, n_workers=10, max_rate=None, retries=3, backoff=2.0, priority='shortest'):
+    """ 
+        Download with the yt-dlp Python API through the download scheduler: the video info is extracted once per video 
+        and the format is picked from its formats list. 
+        Failed downloads are retried with exponential backoff, Ctrl+C / SIGTERM keep the partial files for the next run.
+
+        Args:
+        - rows (list): (id, duration, url) of the videos to download.
+    """
+    tasks = []
+    for d, duration, url in rows:
+        seconds = float(duration) if duration != 'None' else None
+        tasks.append({'id': d, 'url': url, 'save_name': d + "_" + duration, 'duration': seconds})
+
+    def download(task):
+        print("\nProcessing: ",task['id'])
+        downloader = get_downloader(save_folder, format_vid, [scheduler.progress_hook])
+        return downloader.download(task['url'], task['save_name'])
+
+    def on_done(task, result):
+        print("Downloaded: ",task['id'])
+        # record the download in the manifest and the seen-ID store shared with the search script
+        if manifest is not None:
+            manifest.record(task['id'], result['filepath'], result.get('format_id'))
+        if store is not None:
+            store.mark_downloaded(task['id'], result['filepath'])
+
+    def on_failed(task, error):
+        print(f"Download failed: {error}")
+        print("Error occured: ",task['url'])
+        # abort the download instead of keeping a video with missing fragments
+        get_downloader(save_folder, format_vid, [scheduler.progress_hook]).remove_partial(task['save_name'])
+        if manifest is not None:
+            manifest.record(task['id'], status='failed')
+
+    scheduler = DownloadScheduler(download, n_workers, max_rate, retries, backoff, priority, on_done, on_failed)
+    # graceful shutdown on SIGTERM as on Ctrl+C
+    signal.signal(signal.SIGTERM, lambda signum, frame: scheduler.shutdown())
+    stats = scheduler.run(tasks)
+    print("Downloaded: {downloaded}, failed: {failed}, retries: {retried}, cancelled: {cancelled}".format(**stats))
+
 #--------------------------------------------------------------*****--------------------------------------------------------------#
 """ 
     Main function to read the csv file and download the videos
 """
 def main():
     parser = argparse.ArgumentParser(description='Download YouTube videos') 
-    parser.add_argument('--csv_file', type=str, help='Path to the CSV file') # /home/ss223464/Desktop/LIVE/SantaFe/Data_Scrapping/searched_csv/CC_HDR_4K__10k_wordlist_10_20_mins_1200.csv
+    parser.add_argument('--csv_file', type=str, help='Path to the CSV file, or to a typed parquet / arrow export of the search script') # /home/ss223464/Desktop/LIVE/SantaFe/Data_Scrapping/searched_csv/CC_HDR_4K__10k_wordlist_10_20_mins_1200.csv
     parser.add_argument('--save_folder', type=str, default= "./Downloaded_videos/", help='Path to the folder to save the videos')
-    parser.add_argument('--format', type=str, default= "any", help='Format of the video to download')
+    parser.add_argument('--format', type=str, default= "any", choices=FORMAT_CHOICES, help='Format of the video to download: best video, best MP4 video or best HDR video (HDR needs the api engine)')
+    parser.add_argument('--engine', type=str, default= "api", choices=['api', 'cli'], help='api: yt-dlp Python API with the download scheduler, cli: yt-dlp command line (two processes per video)')
+    parser.add_argument('--max_rate', type=float, default=None, help='Total download rate of all jobs in MB/s (api engine), unlimited by default')
+    parser.add_argument('--retries', type=int, default=3, help='Retries of a failed download with exponential backoff (api engine)')
+    parser.add_argument('--backoff', type=float, default=2.0, help='Delay before the first retry in seconds, doubled at every retry (api engine)')
+    parser.add_argument('--priority', type=str, default='shortest', choices=PRIORITIES, help='Download order: shortest or longest videos first, or csv order (api engine)')
     parser.add_argument('--n_jobs', type=int, default= 10, help='Number of parallel jobs')
+    parser.add_argument('--checksum', action='store_true', help='Record the sha256 of every downloaded file in the manifest (reads every file back after its download)')
+    parser.add_argument('--seen_db', type=str, default=None, help='SQLite seen-ID store; videos recorded as downloaded are skipped')
     args = parser.parse_args()
 
-    # read the csv file
+    # read the csv file, or only the id, link and durationSeconds columns of a typed parquet / arrow export (memory-mapped)
     file = args.csv_file
-    df = pd.read_csv(file)
-
-    # read ids and urls from the dataframe
-    ids = df['id'].values
-    urls = df['link'].values
-    # extract duration from "duration" column
-    duration = df['duration'].values
-    # convert duration to total seconds
-    # duration = [str(int(i.split(':')[0])*60 + int(i.split(':')[1])) for i in duration] 
-    for i,j in enumerate(duration):
-        try:  
-            duration[i] = str(int(j.split(':')[0])*60 + int(j.split(':')[1]))
-        except:
-            print(i,j)
-            duration[i] = 'None'
+    if file.rstrip('/').endswith(('.parquet', '.arrow')):
+        table = read_results(file.rstrip('/'), columns=['id', 'link', 'durationSeconds'])
+        ids = np.array(table.column('id').to_pylist(), dtype=object)
+        urls = table.column('link').to_pylist()
+        duration = ['None' if i is None else str(i) for i in table.column('durationSeconds').to_pylist()]
+    else:
+        df = pd.read_csv(file)
+
+        # read ids and urls from the dataframe
+        ids = df['id'].values
+        urls = df['link'].values
+        # convert the "duration" column (M:SS or H:MM:SS) to total seconds
+        duration = []
+        for i,j in enumerate(df['duration'].values):
+            seconds = parse_duration(j)
+            if seconds is None:
+                print(i,j)
+            duration.append('None' if seconds is None else str(seconds))
 
     # create the save folder if it does not exist
     if not os.path.exists(args.save_folder):
         os.mkdir(args.save_folder)
     
-    # list of files in the save folder
-    files = os.listdir(args.save_folder)
-    # strip the duration from the file name
-    files = [i.split('_')[0] for i in files]
+    # manifest of the downloads in the save folder
+    manifest = DownloadManifest(args.save_folder, checksum=args.checksum)
+
+    # IDs of the files in the save folder: strip the duration and extension from the file name (IDs may contain '_')
+    # partial downloads (.part) are resumed, not skipped
+    files = set(os.path.splitext(i)[0].rsplit('_', 1)[0] for i in os.listdir(args.save_folder) if not i.endswith(('.part', '.ytdl', '.jsonl')))
     print("Total files already present: ", len(files))
 
+    # videos recorded as downloaded in the manifest
+    print("Already downloaded (manifest): ", len(manifest.downloaded))
+    files |= manifest.downloaded
+
+    # skip the videos recorded as downloaded in the seen-ID store (e.g. saved in another folder)
+    store = None
+    if args.seen_db:
+        store = SeenStore(args.seen_db)
+        downloaded = store.downloaded(ids)
+        print("Already downloaded (seen store): ", len(downloaded))
+        files |= downloaded
+
+    # If file already exists, skip; every task only carries its own row
+    rows = [(d, duration[i], urls[i]) for i, d in enumerate(ids) if d not in files]
+    print("Videos to download: ", len(rows), " skipped: ", len(ids) - len(rows))
+
     # download each video and save as id_shape_duration
-    tasks = [(args.save_folder, d, duration, urls, files, i, args.format) for i, d in enumerate(ids)]
-    Parallel(n_jobs=args.n_jobs)(delayed(download_video)(*t) for t in tqdm(tasks))
+    if args.engine == 'api':
+        max_rate = args.max_rate * 1024 * 1024 if args.max_rate else None
+        download_videos_api(args.save_folder, rows, args.format, store, manifest, args.n_jobs, max_rate, args.retries, args.backoff, args.priority)
+    else:
+        Parallel(n_jobs=args.n_jobs)(delayed(download_video)(args.save_folder, d, dur, url, args.format, store, manifest) for d, dur, url in tqdm(rows))
 
 #--------------------------------------------------------------*****--------------------------------------------------------------#
 if __name__ == '__main__':
@@ -0,0 +1,104 @@
+"""
+    In-process download engine of the download script, built on the yt-dlp Python API.
+
+    The video metadata is extracted once per video and the format is picked from the structured `formats`
+    list, instead of running `yt-dlp -F` and a second `yt-dlp` download process for every video.
+    Every worker (process or thread) reuses a single `YoutubeDL` instance.
+
+    Format choices:
+    - any: best video format
+    - MP4: best video format with the mp4 container (sometimes MP4 does not contain any metadata)
+    - HDR: best HDR video format (HDR10, HLG, ...), the best video format if the video has no HDR format
+"""
+import os
+import threading
+from glob import glob, escape
+
+import yt_dlp
+
+FORMAT_CHOICES = ['any', 'MP4', 'HDR']
+
+#--------------------------------------------------------------*****--------------------------------------------------------------#
+def select_format(formats, format_vid='any'):
+    """
+    Pick the format to download from the `formats` list of yt-dlp (sorted from worst to best).
+
+    Args:
+    - formats (list): format dicts of the video info.
+    - format_vid (str): 'any', 'MP4' or 'HDR'.
+
+    Returns the selected format dict, or None if the video has no matching format.
+    """
+    # drop audio only formats and storyboards
+    videos = [f for f in formats if f.get('vcodec') != 'none']
+    if format_vid == 'MP4':
+        videos = [f for f in videos if f.get('ext') == 'mp4']
+    elif format_vid == 'HDR':
+        hdr = [f for f in videos if f.get('dynamic_range') not in (None, 'SDR')]
+        videos = hdr or videos
+    return videos[-1] if videos else None
+
+
+class Downloader:
+    """
+    Wrapper of one `YoutubeDL` instance, videos are saved as `save_folder/<save_name>.<ext>`.
+
+    Args:
+    - save_folder (str): folder to save the videos.
+    - format_vid (str): format choice, see `select_format`.
+    - progress_hooks (list, optional): yt-dlp progress hooks, e.g. the rate limit of the download scheduler.
+    """
+    def __init__(self, save_folder, format_vid='any', progress_hooks=()):
+        if format_vid not in FORMAT_CHOICES:
+            raise ValueError(f"Unknown format: {format_vid}")
+        self.save_folder = save_folder
+        self.format_vid = format_vid
+        self.ydl = yt_dlp.YoutubeDL({
+            'format': self._format_selector,
+            'outtmpl': os.path.join(save_folder, '%(save_name)s.%(ext)s'),
+            # abort the download instead of saving a video with missing fragments
+            'skip_unavailable_fragments': False,
+            'quiet': True,
+            'no_warnings': True,
+            'noprogress': True,
+            # an interrupted download keeps its .part file and is continued by the next attempt
+            'continuedl': True,
+            'progress_hooks': list(progress_hooks),
+        })
+
+    def _format_selector(self, ctx):
+        selected = select_format(ctx['formats'], self.format_vid)
+        return [selected] if selected else []
+
+    def download(self, url, save_name):
+        """
+        Download the video at `url` and return its requested download info (`filepath`, `format_id`, ...).
+        Raises yt_dlp.utils.DownloadError on failure, the partial files are kept to resume the download.
+        """
+        # extract only: the formats are selected once, by process_ie_result
+        info = self.ydl.extract_info(url, download=False, process=False)
+        info['save_name'] = save_name
+        info = self.ydl.process_ie_result(info, download=True)
+        return info['requested_downloads'][0]
+
+    def remove_partial(self, save_name):
+        """
+        Remove the files left by a failed download of `save_name` (e.g. missing fragments).
+        """
+        for filepath in glob(os.path.join(escape(self.save_folder), escape(save_name) + '.*')):
+            os.remove(filepath)
+
+
+_local = threading.local()
+
+def get_downloader(save_folder, format_vid='any', progress_hooks=()):
+    """
+    Downloader of the current worker, created on first use and reused for every following video.
+    Module state is per process (joblib workers) and thread-local state is per thread.
+    `progress_hooks` are only used when the downloader is created.
+    """
+    downloaders = _local.__dict__.setdefault('downloaders', {})
+    key = (save_folder, format_vid)
+    if key not in downloaders:
+        downloaders[key] = Downloader(save_folder, format_vid, progress_hooks)
+    return downloaders[key]
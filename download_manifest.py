@@ -0,0 +1,96 @@
+"""
+    Download manifest of the download script, `manifest.jsonl` in the save folder.
+
+    Append-only JSONL file with one entry per download attempt:
+        {"id": ..., "path": saved file, "format": format id, "bytes": file size, "status": "downloaded" or "failed",
+         "checksum": sha256 of the file (None unless checksums are enabled), "timestamp": ...}
+    The last entry of an ID is its state. The IDs are loaded once into sets, so checking whether a video is
+    already downloaded is O(1) for any number of files in the folder.
+"""
+import os
+import time
+import json
+import hashlib
+import threading
+
+#--------------------------------------------------------------*****--------------------------------------------------------------#
+def file_checksum(path, chunk_size=1 << 20):
+    """
+    sha256 of the file, read in chunks of `chunk_size` bytes.
+    """
+    h = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(chunk_size), b''):
+            h.update(chunk)
+    return h.hexdigest()
+
+
+class DownloadManifest:
+    """
+    Args:
+    - save_folder (str): folder of the downloaded videos, the manifest is saved in it.
+    - name (str): file name of the manifest.
+    - checksum (bool): record the sha256 of every downloaded file. The file is read back after its download, on the
+      download worker, so this is off by default.
+    """
+    def __init__(self, save_folder, name='manifest.jsonl', checksum=False):
+        self.path = os.path.join(save_folder, name)
+        self.checksum = checksum
+        self.downloaded = set()
+        self.failed = set()
+        self._lock = threading.Lock()
+        if os.path.exists(self.path):
+            end = 0
+            with open(self.path, 'rb') as f:
+                for line in f:
+                    if not line.endswith(b'\n'):
+                        # last line cut by a crash
+                        break
+                    end += len(line)
+                    try:
+                        entry = json.loads(line)
+                    except json.JSONDecodeError:
+                        continue
+                    self._update(entry['id'], entry['status'])
+            if end < os.path.getsize(self.path):
+                # drop the cut line, so that the next entry starts on a line of its own
+                with open(self.path, 'r+b') as f:
+                    f.truncate(end)
+
+    def _update(self, video_id, status):
+        if status == 'downloaded':
+            self.downloaded.add(video_id)
+            self.failed.discard(video_id)
+        else:
+            self.failed.add(video_id)
+            self.downloaded.discard(video_id)
+
+    def __contains__(self, video_id):
+        return video_id in self.downloaded
+
+    def record(self, video_id, path=None, format_id=None, status='downloaded'):
+        """
+        Append the result of a download. The size (and checksum if enabled) is computed from `path` for a downloaded file.
+        Safe to call from several threads, and from several processes (every entry is a single append).
+        """
+        size = checksum = None
+        if status == 'downloaded' and path and os.path.exists(path):
+            size = os.path.getsize(path)
+            if self.checksum:
+                checksum = file_checksum(path)
+        entry = {'id': video_id, 'path': path, 'format': format_id, 'bytes': size, 'status': status, 'checksum': checksum, 'timestamp': time.time()}
+        with self._lock:
+            with open(self.path, 'a', encoding='utf-8') as f:
+                f.write(json.dumps(entry) + '\n')
+            self._update(video_id, status)
+
+    def __getstate__(self):
+        # joblib workers only append to the file, the sets are not sent with every task
+        return {'path': self.path, 'checksum': self.checksum}
+
+    def __setstate__(self, state):
+        self.path = state['path']
+        self.checksum = state['checksum']
+        self.downloaded = set()
+        self.failed = set()
+        self._lock = threading.Lock()
@@ -0,0 +1,203 @@
+"""
+    Download scheduler of the download script: a bounded pool of worker threads sharing one bandwidth budget.
+
+    - Tasks are started in priority order (e.g. shortest videos first for quick throughput).
+    - Failed tasks are retried with exponential backoff, without blocking a worker while they wait.
+    - The total download rate of all workers is capped by a token bucket fed from the yt-dlp progress hooks.
+    - `shutdown` (Ctrl+C / SIGTERM) cancels the running downloads at their next progress update, their `.part` files
+      are kept and resumed by the next run.
+"""
+import math
+import time
+import heapq
+import threading
+
+from yt_dlp.utils import DownloadCancelled
+
+PRIORITIES = ['shortest', 'longest', 'order']
+
+#--------------------------------------------------------------*****--------------------------------------------------------------#
+class TokenBucket:
+    """
+    Global rate limit shared by all workers.
+
+    Args:
+    - rate (float): bytes per second.
+    - burst (float, optional): bytes that can be consumed at once without waiting. Defaults to one second of `rate`.
+    """
+    def __init__(self, rate, burst=None):
+        self.rate = rate
+        self.burst = burst or rate
+        self.tokens = self.burst
+        self.last = time.monotonic()
+        self._lock = threading.Lock()
+
+    def consume(self, n):
+        """
+        Take `n` bytes from the budget, sleeping until they are available. The budget may go negative,
+        the following callers then wait for the debt to be paid back.
+        """
+        with self._lock:
+            now = time.monotonic()
+            self.tokens = min(self.burst, self.tokens + (now - self.last) * self.rate)
+            self.last = now
+            self.tokens -= n
+            wait = -self.tokens / self.rate if self.tokens < 0 else 0
+        if wait > 0:
+            time.sleep(wait)
+
+
+class DownloadScheduler:
+    """
+    Args:
+    - download (callable): download(task) downloads one task and returns its result, raises on failure.
+    - n_workers (int): number of concurrent downloads.
+    - max_rate (float, optional): total download rate of all workers in bytes per second, unlimited if None.
+    - retries (int): number of retries of a failed task.
+    - backoff (float): delay before the first retry in seconds, doubled at every following retry.
+    - priority (str): 'shortest' or 'longest' duration first, or 'order' of the tasks.
+    - on_done (callable, optional): on_done(task, result) called after a successful download.
+    - on_failed (callable, optional): on_failed(task, error) called once all the retries of a task failed.
+
+    Tasks are dicts with at least an `id` and a `duration` in seconds (None or NaN when unknown, started last) key.
+    """
+    def __init__(self, download, n_workers=10, max_rate=None, retries=3, backoff=2.0, priority='shortest', on_done=None, on_failed=None):
+        if priority not in PRIORITIES:
+            raise ValueError(f"Unknown priority: {priority}")
+        self.download = download
+        self.n_workers = n_workers
+        self.bucket = TokenBucket(max_rate) if max_rate else None
+        self.retries = retries
+        self.backoff = backoff
+        self.priority = priority
+        self.on_done = on_done
+        self.on_failed = on_failed
+        self.stats = {'downloaded': 0, 'failed': 0, 'retried': 0, 'cancelled': 0}
+        self._ready = []
+        self._delayed = []
+        self._active = 0
+        self._seq = 0
+        self._cond = threading.Condition()
+        self._stop = threading.Event()
+        self._progress = threading.local()
+
+    def _key(self, task):
+        if self.priority == 'order':
+            return (0, 0)
+        # the tasks of unknown duration come last
+        duration = task.get('duration')
+        if duration is None or math.isnan(duration):
+            return (1, 0)
+        return (0, duration if self.priority == 'shortest' else -duration)
+
+    def _push(self, task, not_before=None):
+        # the sequence number keeps the order of the tasks with the same priority
+        self._seq += 1
+        if not_before is None:
+            heapq.heappush(self._ready, (self._key(task), self._seq, task))
+        else:
+            heapq.heappush(self._delayed, (not_before, self._seq, task))
+
+    def _next_task(self):
+        with self._cond:
+            while not self._stop.is_set():
+                now = time.monotonic()
+                while self._delayed and self._delayed[0][0] <= now:
+                    _, _, task = heapq.heappop(self._delayed)
+                    self._push(task)
+                if self._ready:
+                    self._active += 1
+                    return heapq.heappop(self._ready)[2]
+                if not self._delayed and self._active == 0:
+                    # nothing left to run or retry
+                    self._cond.notify_all()
+                    return None
+                self._cond.wait(self._delayed[0][0] - now if self._delayed else None)
+            return None
+
+    def _worker(self):
+        while True:
+            task = self._next_task()
+            if task is None:
+                return
+            try:
+                result = self.download(task)
+            except Exception as e:
+                self._failed(task, e)
+            else:
+                self._count('downloaded')
+                if self.on_done is not None:
+                    self.on_done(task, result)
+            finally:
+                with self._cond:
+                    self._active -= 1
+                    self._cond.notify_all()
+
+    def _count(self, key):
+        with self._cond:
+            self.stats[key] += 1
+
+    def _failed(self, task, error):
+        if self._stop.is_set():
+            self._count('cancelled')
+            return
+        attempt = task.get('attempt', 0)
+        if attempt < self.retries:
+            delay = self.backoff * 2 ** attempt
+            print(f"Retry {attempt + 1}/{self.retries} in {delay:.0f}s: {task['id']} ({error})")
+            with self._cond:
+                self.stats['retried'] += 1
+                self._push(dict(task, attempt=attempt + 1), time.monotonic() + delay)
+            return
+        self._count('failed')
+        if self.on_failed is not None:
+            self.on_failed(task, error)
+
+    def progress_hook(self, d):
+        """
+        yt-dlp progress hook: charges the downloaded bytes to the bandwidth budget and cancels the download on shutdown.
+        """
+        if self._stop.is_set():
+            raise DownloadCancelled('Download scheduler shut down')
+        if self.bucket is None:
+            return
+        last = self._progress.__dict__.setdefault('last', {})
+        if d.get('status') != 'downloading':
+            last.pop(d.get('filename'), None)
+            return
+        downloaded = d.get('downloaded_bytes') or 0
+        # bytes received since the previous update of this file (a resumed .part file starts at its size)
+        previous = last.get(d.get('filename'), downloaded)
+        last[d.get('filename')] = downloaded
+        if downloaded > previous:
+            self.bucket.consume(downloaded - previous)
+
+    def shutdown(self):
+        """
+        Stop starting new tasks and cancel the running downloads.
+        """
+        self._stop.set()
+        with self._cond:
+            self._cond.notify_all()
+
+    def run(self, tasks):
+        """
+        Download all `tasks` and return the stats. Ctrl+C shuts the scheduler down gracefully.
+        """
+        with self._cond:
+            for task in tasks:
+                self._push(task)
+        workers = [threading.Thread(target=self._worker, daemon=True) for _ in range(self.n_workers)]
+        for worker in workers:
+            worker.start()
+        try:
+            for worker in workers:
+                # join with a timeout so that Ctrl+C reaches the main thread
+                while worker.is_alive():
+                    worker.join(0.5)
+        except KeyboardInterrupt:
+            print("Shutting down, waiting for the running downloads to stop...")
+            self.shutdown()
+            for worker in workers:
+                worker.join()
+        return self.stats
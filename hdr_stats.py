@@ -0,0 +1,230 @@
+"""
+Streaming statistics of HDR videos, computed in a single pass over the frames of the readers (read_hdr_10bit.py).
+
+Frames are consumed one at a time, memory does not depend on the number of frames:
+- min / max and histogram of the code values of every plane (Y, U, V) of the decoded frames
+- fraction of the samples whose code value does not fit in 8 bits (above 255)
+- PQ (SMPTE ST 2084) MaxCLL and MaxFALL of every frame and of the whole video (CTA-861.3)
+
+    python hdr_stats.py --video_root sample_hdr_shorts/ --out_dir hdr_stats/
+
+writes `<video>_frames.csv` (one row per frame) and `<video>_stats.json` (summary and histograms) per video.
+The videos are processed in parallel on a process pool (`--n_workers`, `--threads` ffmpeg threads per worker).
+"""
+import os
+import csv
+import json
+import argparse
+import numpy as np
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+from read_hdr_10bit import iter_frames, probe_stream
+from video_probe import probe
+from pixel_formats import get_pixel_format
+
+#-------------------------------------------------**********-------------------------------------------------#
+# SMPTE ST 2084 constants
+PQ_M1 = 2610 / 16384
+PQ_M2 = 2523 / 4096 * 128
+PQ_C1 = 3424 / 4096
+PQ_C2 = 2413 / 4096 * 32
+PQ_C3 = 2392 / 4096 * 32
+PQ_LUT_SIZE = 4096
+
+def pq_eotf(e):
+    """
+    PQ EOTF: normalized non-linear signal in [0, 1] -> absolute luminance in cd/m2 (nits).
+    """
+    p = np.power(np.clip(e, 0, 1), 1 / PQ_M2)
+    return 10000 * np.power(np.maximum(p - PQ_C1, 0) / (PQ_C2 - PQ_C3 * p), 1 / PQ_M1)
+
+
+class HDRStats:
+    """
+    Single-pass statistics accumulator of decoded frames (iter_frames with code_values=True).
+
+    The histograms, min / max and the fraction above 8 bits are computed on the code values of the decoded planes
+    (Y, U, V, or R, G, B of rgb videos), before any range conversion or upsampling. A code value above 255 does not fit
+    in 8 bits, the MAX_8BIT_VALUE threshold of verify_frames (255 of 1023).
+
+    Parameters:
+    - bit_depth: int, bit depth of the code values (of the source video)
+    - channels: names of the planes of the code values
+    - pq: bool, compute MaxCLL / MaxFALL, the frames must be PQ-encoded R'G'B' (iter_frames layout='rgb')
+    - frame_writer: csv.writer, optional, a row of per-frame statistics is written for every frame (FRAME_COLUMNS)
+    """
+    FRAME_COLUMNS = ['frame', 'min', 'max', 'fraction_above_8bit', 'max_cll', 'max_fall']
+
+    def __init__(self, bit_depth=10, channels=('y', 'u', 'v'), pq=True, frame_writer=None):
+        self.bit_depth = bit_depth
+        self.channels = list(channels)
+        self.pq = pq
+        self.frame_writer = frame_writer
+        self.n_codes = 1 << bit_depth
+        self.histogram = np.zeros((len(self.channels), self.n_codes), np.int64)
+        self.frames = 0
+        self.max_cll = 0.0
+        self.max_fall = 0.0
+        # the PQ luminance of the maxRGB of every pixel is read from a table of PQ_LUT_SIZE levels
+        self._pq_lut = pq_eotf(np.linspace(0, 1, PQ_LUT_SIZE))
+        self._shape = None
+
+    def _allocate(self, shape):
+        # per-frame buffers, allocated once for the frame size
+        self._shape = shape
+        self._maxrgb = np.empty(shape[:-1], np.float32)
+        self._levels = np.empty(shape[:-1], np.int32)
+
+    def update(self, codes, frame=None):
+        """
+        Add a frame to the statistics.
+
+        Parameters:
+        - codes: code-value planes of the frame, one per channel (FrameConverter.code_values)
+        - frame: float R'G'B' frame (H x W x 3 in [0, 1]), needed for MaxCLL / MaxFALL only
+
+        Returns:
+        - dict, statistics of the frame (FRAME_COLUMNS), min and max are code values
+        """
+        histogram = np.stack([np.bincount(plane.ravel(), minlength=self.n_codes) for plane in codes])
+        self.histogram += histogram
+
+        # min / max and 8-bit ceiling from the histogram, without another pass over the frame
+        values = np.flatnonzero(histogram.sum(axis=0))
+        row = {
+            'frame': self.frames,
+            'min': int(values[0]),
+            'max': int(values[-1]),
+            'fraction_above_8bit': histogram[:, 256:].sum() / histogram.sum(),
+            'max_cll': None,
+            'max_fall': None,
+        }
+
+        if self.pq:
+            if frame.shape != self._shape:
+                self._allocate(frame.shape)
+            # MaxCLL: brightest pixel, MaxFALL: average of the frame, both on the maxRGB of the pixels
+            # pairwise maximum of the channel views, much faster than a reduction over the last (size 3) axis
+            np.maximum(frame[..., 0], frame[..., 1], out=self._maxrgb)
+            for c in range(2, frame.shape[-1]):
+                np.maximum(self._maxrgb, frame[..., c], out=self._maxrgb)
+            np.multiply(self._maxrgb, PQ_LUT_SIZE - 1, out=self._maxrgb)
+            np.rint(self._maxrgb, out=self._maxrgb)
+            np.copyto(self._levels, self._maxrgb, casting='unsafe')
+            levels = np.bincount(self._levels.ravel(), minlength=PQ_LUT_SIZE)
+            row['max_cll'] = float(self._pq_lut[np.flatnonzero(levels)[-1]])
+            row['max_fall'] = float(levels @ self._pq_lut / self._levels.size)
+            self.max_cll = max(self.max_cll, row['max_cll'])
+            self.max_fall = max(self.max_fall, row['max_fall'])
+
+        self.frames += 1
+        if self.frame_writer is not None:
+            self.frame_writer.writerow([row[c] for c in self.FRAME_COLUMNS])
+        return row
+
+    def summary(self, histograms=False):
+        """
+        Statistics of all the frames.
+
+        Parameters:
+        - histograms: bool, include the code-value histogram of every channel
+        """
+        summary = {'frames': self.frames, 'bit_depth': self.bit_depth}
+        if self.frames:
+            total = self.histogram.sum(axis=1)
+            for c, name in enumerate(self.channels):
+                codes = np.flatnonzero(self.histogram[c])
+                summary[name] = {
+                    'min': int(codes[0]),
+                    'max': int(codes[-1]),
+                    'fraction_above_8bit': self.histogram[c, 256:].sum() / total[c],
+                }
+            summary['fraction_above_8bit'] = self.histogram[:, 256:].sum() / total.sum()
+        if self.pq:
+            summary['max_cll'] = self.max_cll
+            summary['max_fall'] = self.max_fall
+        if histograms:
+            summary['histograms'] = {name: self.histogram[c].tolist() for c, name in enumerate(self.channels)}
+        return summary
+
+#-------------------------------------------------**********-------------------------------------------------#
+def video_stats(video_path, out_dir=None, every_nth_frame=1, max_frames=None, threads=None):
+    """
+    Statistics of a video in a single streaming pass.
+
+    Parameters:
+    - video_path: str, path to the video file
+    - out_dir: str, optional, folder of the reports `<video>_frames.csv` and `<video>_stats.json`
+    - every_nth_frame, max_frames, threads: see iter_frames
+
+    Returns:
+    - dict, summary of the statistics (see HDRStats.summary)
+    """
+    info = probe(video_path)
+    pq = info.color_transfer == 'smpte2084'
+    fmt = get_pixel_format(probe_stream(video_path)[2])
+    channels = ('r', 'g', 'b') if fmt.family == 'rgb' else ('y', 'u', 'v')
+    frames = iter_frames(video_path, info.color_range or 'tv', normalize=True, layout='rgb', reuse_buffer=True,
+                         every_nth_frame=every_nth_frame, max_frames=max_frames, threads=threads, code_values=True)
+
+    if out_dir is None:
+        stats = HDRStats(fmt.bit_depth, channels, pq=pq)
+        for frame, codes in frames:
+            stats.update(codes, frame)
+        return dict(stats.summary(), video=video_path, color_transfer=info.color_transfer)
+
+    os.makedirs(out_dir, exist_ok=True)
+    name = os.path.splitext(os.path.basename(video_path))[0]
+    with open(os.path.join(out_dir, name + '_frames.csv'), 'w', newline='') as f:
+        writer = csv.writer(f)
+        writer.writerow(HDRStats.FRAME_COLUMNS)
+        stats = HDRStats(fmt.bit_depth, channels, pq=pq, frame_writer=writer)
+        for frame, codes in frames:
+            stats.update(codes, frame)
+    summary = dict(stats.summary(histograms=True), video=video_path, color_transfer=info.color_transfer)
+    with open(os.path.join(out_dir, name + '_stats.json'), 'w') as f:
+        json.dump(summary, f)
+    del summary['histograms']
+    return summary
+
+def batch_stats(video_paths, out_dir=None, n_workers=None, threads=None, every_nth_frame=1, max_frames=None):
+    """
+    Statistics of several videos, decoded in parallel on a pool of `n_workers` processes (see video_stats).
+
+    Every worker runs its own ffmpeg with `threads` decoding threads, by default the cores are shared between the
+    workers (cpu_count // n_workers) instead of every ffmpeg starting one thread per core.
+
+    Returns:
+    - list of the summaries of the videos, in completion order. Failed videos are printed and skipped.
+    """
+    n_workers = n_workers or os.cpu_count()
+    threads = threads or max(1, os.cpu_count() // n_workers)
+    summaries = []
+    with ProcessPoolExecutor(max_workers=n_workers) as pool:
+        futures = {pool.submit(video_stats, v, out_dir, every_nth_frame, max_frames, threads): v for v in video_paths}
+        for future in as_completed(futures):
+            try:
+                summaries.append(future.result())
+            except Exception as e:
+                print(f"Failed to process {futures[future]}: {e}")
+    return summaries
+
+#-------------------------------------------------**********-------------------------------------------------#
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--video_root", type=str, default="sample_hdr_shorts/", help="Video file or folder of videos")
+    parser.add_argument("--out_dir", type=str, default="hdr_stats/", help="Folder of the per-video reports")
+    parser.add_argument("--every_nth_frame", type=int, default=1)
+    parser.add_argument("--max_frames", type=int, default=None)
+    parser.add_argument("--n_workers", type=int, default=None, help="Videos processed in parallel, defaults to the number of cores")
+    parser.add_argument("--threads", type=int, default=None, help="ffmpeg decoding threads per worker, defaults to cores / n_workers")
+    args = parser.parse_args()
+
+    if os.path.isdir(args.video_root):
+        videos = [os.path.join(args.video_root, v) for v in sorted(os.listdir(args.video_root)) if v.split('.')[-1] in ['mp4', 'mkv', 'mov', 'webm']]
+    else:
+        videos = [args.video_root]
+    for summary in batch_stats(videos, args.out_dir, args.n_workers, args.threads, args.every_nth_frame, args.max_frames):
+        video_path = summary['video']
+        print(f"{video_path}: {summary['frames']} frames, above 8-bit: {summary.get('fraction_above_8bit', 0):.3f}, "
+              f"MaxCLL: {summary.get('max_cll')}, MaxFALL: {summary.get('max_fall')}")
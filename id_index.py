@@ -0,0 +1,112 @@
+"""
+    Index of the video IDs already collected, used to drop duplicated search results.
+
+    IDs are kept in a Python set (O(1) lookups). The index is loaded once at startup, either from the
+    previous result files in `searched_csv/` or from an append-only ID file, and updated incrementally
+    after every saved page. The SQLite seen-ID store (seen_store.py) can be used instead of the set.
+"""
+import os
+import json
+import numpy as np
+import pandas as pd
+
+from seen_store import SeenStore
+
+#--------------------------------------------------------------*****--------------------------------------------------------------#
+def read_ids(path):
+    """
+    Read only the `id` column of a result file written by the search script (csv, jsonl, parquet or arrow dataset).
+    """
+    if path.endswith('.csv'):
+        return pd.read_csv(path, usecols=['id'])['id'].dropna().tolist()
+    if path.endswith('.jsonl'):
+        ids = []
+        with open(path, encoding='utf-8') as f:
+            for line in f:
+                try:
+                    ids.append(json.loads(line)['id'])
+                except json.JSONDecodeError:
+                    # empty line, or last line cut by a crash
+                    continue
+        return ids
+    if path.endswith('.parquet'):
+        return pd.read_parquet(path, columns=['id'])['id'].dropna().tolist()
+    if path.endswith('.arrow'):
+        from columnar_export import read_results
+        table = read_results(path, columns=['id'])
+        return [] if table is None else table.column('id').drop_null().to_pylist()
+    return []
+
+
+class IDIndex:
+    """
+    Set of collected video IDs, optionally backed by an append-only file with one ID per line.
+
+    Args:
+    - path (str, optional): backing ID file. Loaded if it exists, added IDs are appended to it by `flush`.
+    """
+    def __init__(self, path=None):
+        self.path = path
+        self.ids = set()
+        self.pending = []
+        if path and os.path.exists(path):
+            with open(path, encoding='utf-8') as f:
+                self.ids.update(line.strip() for line in f if line.strip())
+
+    def __len__(self):
+        return len(self.ids)
+
+    def __contains__(self, video_id):
+        return video_id in self.ids
+
+    def contains(self, ids):
+        """
+        Boolean mask of `ids` already present in the index.
+        """
+        ids = list(ids)
+        return np.fromiter((i in self.ids for i in ids), dtype=bool, count=len(ids))
+
+    def add(self, ids, keyword=None):
+        """
+        Add IDs to the index. They are written to the backing file on the next `flush`, call it once the
+        corresponding results are saved so that the file never holds IDs of lost results.
+        """
+        ids = [i for i in dict.fromkeys(ids) if i not in self.ids]
+        self.ids.update(ids)
+        if self.path:
+            self.pending += ids
+
+    def flush(self):
+        if self.pending:
+            with open(self.path, 'a', encoding='utf-8') as f:
+                f.write(''.join(i + '\n' for i in self.pending))
+            self.pending = []
+
+
+def load_folder(index, searched_csv_root):
+    """
+    Add the IDs of every result file found in `searched_csv_root` (not recursive) to the index.
+    """
+    for name in os.listdir(searched_csv_root):
+        path = os.path.join(searched_csv_root, name)
+        if os.path.isfile(path) or name.endswith(('.parquet', '.arrow')):
+            index.add(read_ids(path))
+    index.flush()
+
+
+def open_index(searched_csv_root, path=None, seen_db=None, filter_criterion=None, rescan=False):
+    """
+    Create the index of collected IDs: the SQLite seen-ID store `seen_db`, or a set backed by the ID file `path`.
+    The previous result files are only parsed when the store or the ID file does not exist yet, or with `rescan`
+    (resuming after a crash: results may have been written after the last flush of the index).
+    """
+    if seen_db:
+        index = SeenStore(seen_db, filter_criterion)
+        rescan = rescan or len(index) == 0
+    else:
+        rescan = rescan or not (path and os.path.exists(path))
+        index = IDIndex(path)
+    if rescan:
+        load_folder(index, searched_csv_root)
+    print('IDs already collected: ', len(index))
+    return index
@@ -0,0 +1,119 @@
+"""
+Registry of the raw pixel formats read by the HDR scripts (read_hdr_10bit.py).
+
+Every format describes its plane layout, chroma subsampling, bit depth and endianness, from which the exact
+size of a raw frame and zero-copy NumPy views of its planes are computed.
+
+    fmt = get_pixel_format('yuv420p10le')
+    fmt.frame_bytes(3840, 2160)           # 24883200
+    planes = fmt.planes(raw, 3840, 2160)  # {'y': (2160, 3840), 'u': (1080, 1920), 'v': (1080, 1920)} views of raw
+"""
+import numpy as np
+
+#-------------------------------------------------**********-------------------------------------------------#
+class PixelFormat:
+    """
+    Raw frame layout of an ffmpeg pixel format.
+
+    Parameters:
+    - name: str, ffmpeg pixel format name
+    - family: str, 'yuv' (planar), 'nv' (semi-planar: Y plane then interleaved UV plane) or 'rgb' (packed)
+    - bit_depth: int, significant bits per sample
+    - subsampling: (int, int), horizontal and vertical chroma subsampling (2, 2) for 4:2:0
+    - big_endian: bool, byte order of the 16-bit samples
+    - shift: int, samples are stored in the high bits of their 16-bit word (p010), values are `sample >> shift`
+    """
+    def __init__(self, name, family, bit_depth, subsampling=(1, 1), big_endian=False, shift=0):
+        self.name = name
+        self.family = family
+        self.bit_depth = bit_depth
+        self.subsampling = subsampling
+        self.big_endian = big_endian
+        self.shift = shift
+        if bit_depth + shift <= 8:
+            self.dtype = np.dtype(np.uint8)
+        else:
+            self.dtype = np.dtype('>u2' if big_endian else '<u2')
+
+    def __repr__(self):
+        return f"PixelFormat({self.name})"
+
+    def chroma_shape(self, width, height):
+        # ffmpeg rounds the chroma plane size up for odd dimensions
+        sx, sy = self.subsampling
+        return -(-height // sy), -(-width // sx)
+
+    def plane_shapes(self, width, height):
+        """
+        Returns:
+        - list of (plane name, shape) in the order of the planes in a raw frame
+        """
+        if self.family == 'rgb':
+            return [('rgb', (height, width, 3))]
+        ch, cw = self.chroma_shape(width, height)
+        if self.family == 'nv':
+            return [('y', (height, width)), ('uv', (ch, cw, 2))]
+        return [('y', (height, width)), ('u', (ch, cw)), ('v', (ch, cw))]
+
+    def frame_samples(self, width, height):
+        return sum(int(np.prod(shape)) for _, shape in self.plane_shapes(width, height))
+
+    def frame_bytes(self, width, height):
+        """
+        Exact size of a raw frame in bytes.
+        """
+        return self.frame_samples(width, height) * self.dtype.itemsize
+
+    def planes(self, buffer, width, height):
+        """
+        Zero-copy views of the planes of a raw frame.
+
+        Parameters:
+        - buffer: bytes-like object (bytes, bytearray, memmap, ...) holding at least one frame
+
+        Returns:
+        - dict of plane name -> np.ndarray view: 'y', 'u', 'v' for YUV formats (the 'u' and 'v' views of semi-planar
+          formats are strided views of the 'uv' plane) and 'rgb' for RGB formats
+        """
+        samples = np.frombuffer(buffer, dtype=self.dtype, count=self.frame_samples(width, height))
+        planes = {}
+        start = 0
+        for name, shape in self.plane_shapes(width, height):
+            size = int(np.prod(shape))
+            planes[name] = samples[start:start + size].reshape(shape)
+            start += size
+        if self.family == 'nv':
+            planes['u'] = planes['uv'][..., 0]
+            planes['v'] = planes['uv'][..., 1]
+        return planes
+
+
+#-------------------------------------------------**********-------------------------------------------------#
+PIXEL_FORMATS = {}
+
+def register_pixel_format(fmt):
+    PIXEL_FORMATS[fmt.name] = fmt
+    return fmt
+
+for _name, _depth, _subsampling in [('yuv420p', 8, (2, 2)), ('yuvj420p', 8, (2, 2)),
+                                   ('yuv420p10', 10, (2, 2)), ('yuv420p12', 12, (2, 2)),
+                                   ('yuv422p10', 10, (2, 1)), ('yuv444p10', 10, (1, 1))]:
+    if _depth == 8:
+        register_pixel_format(PixelFormat(_name, 'yuv', _depth, _subsampling))
+    else:
+        register_pixel_format(PixelFormat(_name + 'le', 'yuv', _depth, _subsampling))
+        register_pixel_format(PixelFormat(_name + 'be', 'yuv', _depth, _subsampling, big_endian=True))
+
+register_pixel_format(PixelFormat('p010le', 'nv', 10, (2, 2), shift=6))
+register_pixel_format(PixelFormat('p010be', 'nv', 10, (2, 2), big_endian=True, shift=6))
+register_pixel_format(PixelFormat('rgb48le', 'rgb', 16))
+register_pixel_format(PixelFormat('rgb48be', 'rgb', 16, big_endian=True))
+
+
+def get_pixel_format(pix_fmt):
+    """
+    PixelFormat of an ffmpeg pixel format name, raises ValueError for unsupported formats.
+    """
+    if pix_fmt not in PIXEL_FORMATS:
+        raise ValueError(f"Unsupported pixel format: {pix_fmt}. Supported: {', '.join(PIXEL_FORMATS)}")
+    return PIXEL_FORMATS[pix_fmt]
@@ -3,6 +3,7 @@ Python Script to read HDR 10-bit video files and return a list of NumPy arrays r
 Since, some of the videos can be in HDR 10-bit format, we need to read them in a different way than the normal 8-bit videos.
 
 NOTE: MP4 videos are normalized and whereas webm videos are not normalized. 
+Long videos should be read with `iter_frames`, which yields one frame (or batch) at a time in constant memory.
 
 In case of 8-bit videos, we can use the following code to read the video:
     import imageio
@@ -30,7 +31,9 @@ import os
 import imageio_ffmpeg as ffmpeg
 import numpy as np 
 import subprocess
-import json
+
+from pixel_formats import get_pixel_format
+from video_probe import probe
 
 #-------------------------------------------------**********-------------------------------------------------# 
 def check_video_range(video_path):
@@ -44,64 +47,69 @@ def check_video_range(video_path):
     - str, either 'tv' or 'pc' based on the range used in the video file, or 'unknown' if the range could not be determined
     """
     try:
-        # Run ffprobe to get video stream information in JSON format
-        cmd = [
-            'ffprobe', 
-            '-v', 'quiet', 
-            '-print_format', 'json', 
-            '-show_streams', 
-            video_path
-        ]
-        result = subprocess.run(cmd, stdout=subprocess.PIPE, stderr=subprocess.PIPE)
-        
-        # Parse the JSON output from ffprobe
-        ffprobe_output = json.loads(result.stdout)
-        
-        # Get the color range from the first video stream
-        streams = ffprobe_output.get('streams', [])
-        for stream in streams:
-            if stream.get('codec_type') == 'video':
-                color_range = stream.get('color_range')
-                if color_range:
-                    return color_range
-                else:
-                    return 'unknown'
-        return 'unknown'
+        # Color range of the first video stream, probed once per file (video_probe.py)
+        return probe(video_path).color_range or 'unknown'
     except Exception as e:
         print(f"An error occurred: {e}")
         return 'unknown'
 
 #-------------------------------------------------**********-------------------------------------------------#
+MAX_8BIT_VALUE = 255 / 1023
+
+def frame_range(frames):
+    """
+    Number of frames and running min / max of the pixel values, frames are consumed one at a time.
+
+    Returns:
+    - (count, min_value, max_value), or None if a frame is not float32
+    """
+    count = 0
+    min_value, max_value = np.inf, -np.inf
+    for frame in frames:
+        # Check the data type of the frames
+        if frame.dtype != np.float32:
+            return None
+        # Running range of pixel values
+        min_value = min(min_value, frame.min())
+        max_value = max(max_value, frame.max())
+        count += 1
+    return count, min_value, max_value
+
+
 def verify_frames(frames):
     """
-    Verify if a list of NumPy arrays correctly represents an HDR 10-bit video.
+    Verify if a sequence of NumPy arrays correctly represents an HDR 10-bit video.
 
     Parameters:
-    - frames: list of NumPy arrays, each representing a frame in the video
+    - frames: list or iterator of NumPy arrays (e.g. iter_frames), each representing a frame in the video.
+      Frames are consumed one at a time, memory stays constant for any number of frames.
 
     Returns:
     - bool, True if the frames correctly represent an HDR 10-bit video, False otherwise
     """
-    if not frames:
-        print("No frames to verify.")
+    result = frame_range(frames)
+    if result is None:
+        print("Incorrect data type.")
         return False
+    return check_frame_range(*result)
 
-    # Check the data type of the frames
-    if frames[0].dtype != np.float32:
-        print("Incorrect data type.")
+
+def check_frame_range(count, min_value, max_value):
+    """
+    Check the number of frames and the range of pixel values returned by frame_range, see verify_frames.
+    """
+    if count == 0:
+        print("No frames to verify.")
         return False
+    print(f"Read {count} frames from the video.")
 
     # Check the range of pixel values
-    min_value = np.min([np.min(frame) for frame in frames])
-    max_value = np.max([np.max(frame) for frame in frames])
-    
     if min_value < 0 or max_value > 1:
         print(f"Incorrect pixel value range: min={min_value}, max={max_value}")
         return False
     
     # Check if there are any values above the 8-bit maximum
-    max_8bit_value = 255 / 1023
-    if max_value <= max_8bit_value:
+    if max_value <= MAX_8BIT_VALUE:
         print(f"No values above 8-bit maximum: max value={max_value}")
         return False
 
@@ -110,211 +118,485 @@ def verify_frames(frames):
 
 #-------------------------------------------------**********-------------------------------------------------#
 #-------------------------------------------------**********-------------------------------------------------#
-def read_mp4_10bit(video_path, range='tv'):
-    # Get video metadata
-    command_probe = [
-        "ffprobe",
-        "-v", "error",
-        "-select_streams", "v:0",
-        "-show_entries", "stream=width,height,pix_fmt",
-        "-of", "json",
-        video_path
-    ]
-    
-    result = subprocess.run(command_probe, stdout=subprocess.PIPE, stderr=subprocess.PIPE, universal_newlines=True)
-    video_info = json.loads(result.stdout)
-    video_stream = video_info['streams'][0]
-    width = int(video_stream['width'])
-    height = int(video_stream['height'])
-    
-    # Set FFmpeg codec parameters for 10-bit video
-    pix_fmt = video_stream.get('pix_fmt', 'yuv420p10le') # Adjust as necessary based on your video's pixel format
-
-    # Define the scaling factors based on the range type
-    if range == 'tv':
-        offset = 64
-        scale = 1 / (940 - 64)
-    else:  # full range
-        offset = 0
-        scale = 1 / (1023 - 0)
-    # Read video frames and convert them to a NumPy array
-    
-    # Determine bytes per pixel based on the pixel format
-    # Determine bytes per pixel and bit depth based on the pixel format
-    if pix_fmt in ['yuv420p', 'yuvj420p']:
-        bytes_per_pixel = 1.5
-        bit_depth = 8
-    elif pix_fmt in ['yuv420p10le', 'yuv420p10be']:
-        bytes_per_pixel = 3
-        bit_depth = 10
-    elif pix_fmt in ['rgb48le', 'rgb48be']:
-        bytes_per_pixel = 6
-        bit_depth = 16
-
-    cmd = [
-        ffmpeg.get_ffmpeg_exe(),
-        '-i', video_path,
-        '-f', 'image2pipe',
-        '-pix_fmt', pix_fmt,
-        '-vcodec', 'rawvideo', '-'
-    ]
-    pipe = subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=subprocess.PIPE)
-    frames = []
-    count = 0
-    while True:
-        # Read raw frame data
-        raw_frame = pipe.stdout.read(width * height * bytes_per_pixel)
-        if not raw_frame:
-            break
-        
-        # Convert raw frame data to a NumPy array
-        dtype = np.uint8 if bit_depth == 8 else np.uint16
-        image = np.frombuffer(raw_frame, dtype=dtype)
-
-        # Reshape the NumPy array to separate the Y, U, and V planes
-        y_plane = image[:width*height].reshape((height, width))
-        u_plane = image[width*height:width*height + (width//2)*(height//2)].reshape((height//2, width//2)).repeat(2,axis=0).repeat(2,axis=1)
-        v_plane = image[width*height + (width//2)*(height//2):].reshape((height//2, width//2)).repeat(2,axis=0).repeat(2,axis=1)
-
-        # Stack the Y, U, and V planes to create a 3D array (you might need to upsample the U and V planes)
-        image = np.stack((y_plane, u_plane, v_plane), axis=-1)
-
-        # Normalize the pixel values based on the determined range
-        image = image.astype(np.float32)
-        image = (image - offset) * scale
-        image = np.clip(image, 0, 1)
-        
-        frames.append(image)
-        
-        count +=1
-        print("Frames Processed : ", count)
-    
-    return frames    
+def probe_stream(video_path):
+    """
+    Get the width, height and pixel format of the first video stream (memoized probe, see video_probe.py).
 
+    Parameters:
+    - video_path: str, path to the video file
 
-#-------------------------------------------------**********-------------------------------------------------#
-def read_webm_10bit(video_path):
-    """Read a 10-bit HDR video file and return a list of NumPy arrays representing each frame.
+    Returns:
+    - (width, height, pix_fmt)
+    """
+    info = probe(video_path)
+    return info.width, info.height, info.pix_fmt or 'yuv420p10le'
 
-    Args:
-    video_path (str): The path to the HDR video file.
 
-    Returns:
-    list of np.ndarray: A list of NumPy arrays representing each frame in the video.
+LAYOUTS = ['yuv444', 'planar', 'rgb']
+
+class FrameConverter:
     """
-    # Get video properties using FFprobe
-    command_probe = [
-        "ffprobe",
-        "-v", "error",
-        "-select_streams", "v:0",
-        "-show_entries", "stream=width,height,pix_fmt",
-        "-of", "csv=p=0",
-        video_path
-    ]
-    
-    result = subprocess.run(command_probe, stdout=subprocess.PIPE, stderr=subprocess.PIPE, universal_newlines=True)
-    width, height, pix_fmt = result.stdout.strip().split(',')
-    width, height = int(width), int(height)
-    print(f"Video resolution: {width}x{height}", "pix fmt: ",pix_fmt)
-    # Define FFmpeg command to extract raw video frames
-    command = [
-        "ffmpeg",
-        '-i', video_path,
+    Convert raw frames to NumPy arrays with preallocated buffers: a frame is read in place with readinto, 
+    the chroma planes are upsampled with a single broadcast write and normalized with in-place ufuncs,
+    so no full-frame array is allocated per frame. Frame sizes and plane views come from the pixel format registry.
+
+    Parameters:
+    - width, height: int, frame size
+    - pix_fmt: str, ffmpeg pixel format of the raw frames (see pixel_formats.PIXEL_FORMATS)
+    - range: str, 'tv' for limited range, any other value ('pc', 'unknown') is read as full range, as read_mp4_10bit does.
+      rgb frames are always full range.
+    - layout: str, output layout
+        'yuv444': H x W x 3 interleaved YUV, chroma upsampled (the frames of read_mp4_10bit)
+        'planar': (Y, U, V) planes at their native resolution
+        'rgb': H x W x 3 BT.2020 non-constant luminance R'G'B' (still PQ / HLG encoded), rgb48 videos are read as is
+    - normalize: bool, float32 values in [0, 1], otherwise the raw code values (yuv444 and planar layouts).
+      YUV channels are all normalized with the luma range, as read_mp4_10bit does.
+
+    The returned arrays are overwritten by the next frame: copy them to keep them.
+    """
+    def __init__(self, width, height, pix_fmt, range='tv', layout='yuv444', normalize=True):
+        if layout not in LAYOUTS:
+            raise ValueError(f"Unknown layout: {layout}")
+        self.fmt = get_pixel_format(pix_fmt)
+        self.rgb_input = self.fmt.family == 'rgb'
+        if self.rgb_input and layout != 'rgb':
+            raise ValueError(f"{pix_fmt} frames can only be read with the rgb layout")
+        if layout == 'rgb' and not normalize:
+            raise ValueError("The rgb layout is always normalized")
+        self.sx, self.sy = self.fmt.subsampling
+        if layout != 'planar' and (width % self.sx or height % self.sy):
+            raise ValueError(f"The {layout} layout needs a frame size divisible by the chroma subsampling of {pix_fmt}")
+        self.width = width
+        self.height = height
+        self.layout = layout
+        self.normalize = normalize
+
+        # raw frame buffer and zero-copy views of its planes
+        self.frame_bytes = self.fmt.frame_bytes(width, height)
+        self.raw = bytearray(self.frame_bytes)
+        self.planes = self.fmt.planes(self.raw, width, height)
+
+        # Define the scaling factors based on the range type and bit depth
+        # (p010 samples are stored in the high bits: the code values are scaled instead of shifted)
+        bit_depth, shift = self.fmt.bit_depth, self.fmt.shift
+        if range == 'tv' and not self.rgb_input:
+            self.offset = 16 << (bit_depth - 8 + shift)
+            self.scale = 1 / (219 << (bit_depth - 8 + shift))
+            self.chroma_scale = 1 / (224 << (bit_depth - 8 + shift))
+        else:
+            self.offset = 0
+            self.scale = 1 / (((1 << bit_depth) - 1) << shift)
+            self.chroma_scale = self.scale
+        self.chroma_mid = 1 << (bit_depth - 1 + shift)
+
+        # output and intermediate buffers
+        raw_dtype = self.fmt.dtype.newbyteorder('=')
+        out_dtype = np.float32 if normalize else raw_dtype
+        chroma_shape = self.fmt.chroma_shape(width, height)
+        if layout == 'planar':
+            self.out = (np.empty((height, width), out_dtype), np.empty(chroma_shape, out_dtype), np.empty(chroma_shape, out_dtype))
+        else:
+            self.out = np.empty((height, width, 3), out_dtype)
+        if layout == 'rgb' and not self.rgb_input:
+            self.luma = np.empty((height, width), np.float32)
+        if not self.rgb_input:
+            self.chroma = np.empty((2,) + chroma_shape, np.float32)
+            self.tmp = np.empty((2,) + chroma_shape, np.float32)
+            if shift:
+                self.chroma_raw = np.empty((2,) + chroma_shape, raw_dtype)
+        self.codes = None
+
+    def read(self, stream):
+        """
+        Read the next raw frame from `stream` into the frame buffer. Returns False at the end of the stream.
+        """
+        view = memoryview(self.raw)
+        filled = 0
+        while filled < self.frame_bytes:
+            n = stream.readinto(view[filled:])
+            if not n:
+                return False
+            filled += n
+        return True
+
+    def convert(self, out=None):
+        """
+        Convert the frame in the frame buffer into `out` (the converter buffer by default) and return it.
+        """
+        out = self.out if out is None else out
+        if self.layout == 'planar':
+            return self._planar(out)
+        if self.layout == 'rgb':
+            return self._rgb(out)
+        return self._yuv444(out)
+
+    def code_values(self):
+        """
+        Code values of the frame in the frame buffer: the (Y, U, V) planes, or the (R, G, B) channels of rgb frames.
+        Views of the frame buffer, except for the formats storing the samples in the high bits (p010) which are
+        shifted into preallocated planes. They are overwritten by the next frame.
+        """
+        if self.rgb_input:
+            rgb = self.planes['rgb']
+            return rgb[..., 0], rgb[..., 1], rgb[..., 2]
+        planes = self.planes['y'], self.planes['u'], self.planes['v']
+        if not self.fmt.shift:
+            return planes
+        if self.codes is None:
+            self.codes = tuple(np.empty(p.shape, self.fmt.dtype.newbyteorder('=')) for p in planes)
+        for plane, dst in zip(planes, self.codes):
+            np.right_shift(plane, self.fmt.shift, out=dst)
+        return self.codes
+
+    def _blocks(self, array):
+        # view of the sy x sx blocks of pixels sharing a chroma sample
+        return array.reshape((self.height // self.sy, self.sy, self.width // self.sx, self.sx) + array.shape[2:])
+
+    def _planar(self, out):
+        for plane, dst in zip((self.planes['y'], self.planes['u'], self.planes['v']), out):
+            if self.normalize:
+                np.subtract(plane, self.offset, out=dst, dtype=np.float32)
+                np.multiply(dst, self.scale, out=dst)
+                np.clip(dst, 0, 1, out=dst)
+            elif self.fmt.shift:
+                np.right_shift(plane, self.fmt.shift, out=dst)
+            else:
+                np.copyto(dst, plane)
+        return out
+
+    def _yuv444(self, out):
+        y, u, v = self.planes['y'], self.planes['u'], self.planes['v']
+        # one broadcast write per chroma plane
+        blocks = self._blocks(out)
+        if not self.normalize:
+            if self.fmt.shift:
+                np.right_shift(y, self.fmt.shift, out=out[..., 0])
+                u = np.right_shift(u, self.fmt.shift, out=self.chroma_raw[0])
+                v = np.right_shift(v, self.fmt.shift, out=self.chroma_raw[1])
+            else:
+                out[..., 0] = y
+            blocks[..., 1] = u[:, None, :, None]
+            blocks[..., 2] = v[:, None, :, None]
+            return out
+        np.subtract(y, self.offset, out=out[..., 0], dtype=np.float32)
+        np.subtract(u, self.offset, out=self.chroma[0], dtype=np.float32)
+        np.subtract(v, self.offset, out=self.chroma[1], dtype=np.float32)
+        blocks[..., 1] = self.chroma[0][:, None, :, None]
+        blocks[..., 2] = self.chroma[1][:, None, :, None]
+        np.multiply(out, self.scale, out=out)
+        np.clip(out, 0, 1, out=out)
+        return out
+
+    def _rgb(self, out):
+        if self.rgb_input:
+            np.multiply(self.planes['rgb'], self.scale, out=out, dtype=np.float32)
+            return out
+        luma, (cb, cr), (t0, t1) = self.luma, self.chroma, self.tmp
+        np.subtract(self.planes['y'], self.offset, out=luma, dtype=np.float32)
+        np.multiply(luma, self.scale, out=luma)
+        np.subtract(self.planes['u'], self.chroma_mid, out=cb, dtype=np.float32)
+        np.multiply(cb, self.chroma_scale, out=cb)
+        np.subtract(self.planes['v'], self.chroma_mid, out=cr, dtype=np.float32)
+        np.multiply(cr, self.chroma_scale, out=cr)
+
+        # BT.2020 non-constant luminance: R = Y + 1.4746 Cr, G = Y - 0.16455 Cb - 0.57135 Cr, B = Y + 1.8814 Cb
+        # chroma terms are computed at chroma resolution and broadcast over the luma blocks
+        blocks = self._blocks(out)
+        luma_blocks = self._blocks(luma)
+        np.multiply(cr, 1.4746, out=t0)
+        np.add(luma_blocks, t0[:, None, :, None], out=blocks[..., 0])
+        np.multiply(cb, -0.16455, out=t0)
+        np.multiply(cr, -0.57135, out=t1)
+        np.add(t0, t1, out=t0)
+        np.add(luma_blocks, t0[:, None, :, None], out=blocks[..., 1])
+        np.multiply(cb, 1.8814, out=t0)
+        np.add(luma_blocks, t0[:, None, :, None], out=blocks[..., 2])
+        np.clip(out, 0, 1, out=out)
+        return out
+
+
+def iter_frames(video_path, range='tv', normalize=True, batch_size=None, max_frames=None, every_nth_frame=1, layout='yuv444', reuse_buffer=False,
+                start_time=None, duration=None, threads=None, code_values=False):
+    """
+    Read the frames of a video one at a time through an ffmpeg pipe. Only the current frame (or batch) is kept 
+    in memory, and the ffmpeg process is stopped as soon as the generator is exhausted, closed or garbage collected.
+
+    Parameters:
+    - video_path: str, path to the video file
+    - range: str, range used to normalize the frames: 'tv' for limited range, any other value ('pc', 'unknown') is
+      read as full range, as read_mp4_10bit does. rgb frames are always full range.
+    - normalize: bool, return float32 frames normalized to [0, 1], otherwise the raw code values
+    - batch_size: int, yield arrays of `batch_size` frames (N x H x W x 3) instead of single frames, the last batch may be smaller
+    - max_frames: int, stop after this number of frames (ffmpeg stops decoding)
+    - every_nth_frame: int, keep one frame every `every_nth_frame` frames (ffmpeg select filter, the other frames
+      are neither piped nor converted)
+    - layout: str, 'yuv444', 'planar' or 'rgb', see FrameConverter
+    - reuse_buffer: bool, yield the same preallocated array for every frame (or batch) instead of a copy.
+      No memory is allocated per frame, but a frame is only valid until the next one is read.
+    - start_time: float, seconds, start reading at this time (ffmpeg input seeking, the frames before the
+      preceding keyframe are not decoded)
+    - duration: float, seconds, stop reading after this duration
+    - threads: int, decoding threads of ffmpeg (ffmpeg default: one per core). Set it when several videos are
+      decoded in parallel, so that the cores are not oversubscribed
+    - code_values: bool, yield (frame, code values) pairs, the code values are the decoded planes of the frame before
+      any conversion (see FrameConverter.code_values). Not available with batches.
+
+    Yields:
+    - np.ndarray, H x W x 3 YUV frame (chroma upsampled) or RGB frame, or (Y, U, V) planes for the planar layout
+    """
+    width, height, pix_fmt = probe_stream(video_path)
+    converter = FrameConverter(width, height, pix_fmt, range, layout, normalize)
+    if batch_size and layout == 'planar':
+        raise ValueError("Batches are not available with the planar layout")
+    if batch_size and code_values:
+        raise ValueError("Code values are not available with batches")
+
+    cmd = [ffmpeg.get_ffmpeg_exe(), '-v', 'error']
+    if threads:
+        cmd += ['-threads', str(threads)]
+    if start_time:
+        cmd += ['-ss', str(start_time)]
+    if duration:
+        cmd += ['-t', str(duration)]
+    cmd += ['-i', video_path]
+    if every_nth_frame > 1:
+        # passthrough: keep the selected frames only, without duplicating them to the input frame rate
+        cmd += ['-vf', f'select=not(mod(n\\,{every_nth_frame}))', '-fps_mode', 'passthrough']
+    if max_frames is not None:
+        cmd += ['-frames:v', str(max_frames)]
+    cmd += [
         '-f', 'image2pipe',
         '-pix_fmt', pix_fmt,  # maintain the original pixel format
-        '-vcodec', 'rawvideo',
-        '-'
+        '-vcodec', 'rawvideo', '-'
     ]
+    # stderr is not read: a pipe would fill up and block ffmpeg
+    pipe = subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=subprocess.DEVNULL)
+    try:
+        batch = None
+        filled = 0
+        count = 0
+        while max_frames is None or count < max_frames:
+            # Read raw frame data in place, a short read is the end of the stream
+            if not converter.read(pipe.stdout):
+                break
+            count += 1
+
+            if batch_size is None:
+                frame = converter.convert()
+                if not reuse_buffer:
+                    frame = tuple(p.copy() for p in frame) if layout == 'planar' else frame.copy()
+                if code_values:
+                    codes = converter.code_values()
+                    yield frame, (codes if reuse_buffer else tuple(p.copy() for p in codes))
+                else:
+                    yield frame
+                continue
+
+            # convert straight into the batch
+            if batch is None:
+                batch = np.empty((batch_size,) + converter.out.shape, converter.out.dtype)
+            converter.convert(out=batch[filled])
+            filled += 1
+            if filled == batch_size:
+                yield batch
+                filled = 0
+                if not reuse_buffer:
+                    batch = None
+        if filled:
+            yield batch[:filled]
+    finally:
+        # pipe teardown: ffmpeg may still be writing when the consumer stops early
+        pipe.stdout.close()
+        if pipe.poll() is None:
+            pipe.kill()
+        pipe.wait()
 
-    # Run FFmpeg command and capture output
-    pipe = subprocess.Popen(command, stdout=subprocess.PIPE, stderr=subprocess.PIPE)
+#-------------------------------------------------**********-------------------------------------------------#
+def sample_frames(video_path, range='tv', n_samples=16, frames_per_sample=1, normalize=True, layout='yuv444'):
+    """
+    Yield a temporal sample of the video: `frames_per_sample` frames at `n_samples` times spread evenly over its
+    duration. Every sample is read by a seeking ffmpeg, only the frames from the preceding keyframe are decoded.
 
-    frames = []
+    Parameters:
+    - video_path: str, path to the video file
+    - n_samples: int, number of sampled positions
+    - frames_per_sample: int, consecutive frames read at every position
+    - range, normalize, layout: see iter_frames
 
-    # Calculate the number of bytes per frame
-    bytes_per_frame = width * height * 3#1.5  # Adjust this based on the pixel format
+    Yields:
+    - np.ndarray frames, as iter_frames. The whole video is read when its duration is unknown.
+    """
+    total = probe(video_path).duration
+    if not total:
+        yield from iter_frames(video_path, range, normalize, layout=layout)
+        return
+    for i in np.arange(n_samples):
+        start_time = float(total * (i + 0.5) / n_samples)
+        yield from iter_frames(video_path, range, normalize, max_frames=frames_per_sample, layout=layout, start_time=start_time)
 
-    count = 0
-    # Read each frame from the FFmpeg pipe
-    while True:
-        # Read raw data
-        raw_image = pipe.stdout.read(bytes_per_frame)
-        if not raw_image:
-            break
 
-        # Convert raw data to NumPy array
-        image = np.frombuffer(raw_image, dtype='uint16')  # Adjust dtype based on the bit depth
+def verify_video(video_path, range='tv', n_samples=16, frames_per_sample=1, escalate=True):
+    """
+    Verify a video on a temporal sample of its frames (see sample_frames) instead of decoding all of them.
+
+    A sample with values above the 8-bit maximum, or out of range, is conclusive. A sample without any value above 
+    the 8-bit maximum is ambiguous (e.g. dark scenes only): with `escalate` the full video is then verified.
+
+    Returns:
+    - bool, see verify_frames
+    """
+    result = frame_range(sample_frames(video_path, range, n_samples, frames_per_sample))
+    if result is None:
+        print("Incorrect data type.")
+        return False
+    count, min_value, max_value = result
+    ambiguous = count == 0 or (min_value >= 0 and max_value <= MAX_8BIT_VALUE)
+    if ambiguous and escalate:
+        print("The sample is ambiguous, verifying the full video.")
+        return verify_frames(iter_frames(video_path, range, normalize=True))
+    return check_frame_range(count, min_value, max_value)
+
 
-        # Reshape the NumPy array to separate the Y, U, and V planes
-        y_plane = image[:width*height].reshape((height, width))
-        u_plane = image[width*height:width*height + (width//2)*(height//2)].reshape((height//2, width//2)).repeat(2,axis=0).repeat(2,axis=1)
-        v_plane = image[width*height + (width//2)*(height//2):].reshape((height//2, width//2)).repeat(2,axis=0).repeat(2,axis=1)
+#-------------------------------------------------**********-------------------------------------------------#
+def read_mp4_10bit(video_path, range='tv', max_frames=None, every_nth_frame=1, start_time=None, duration=None):
+    """
+    Read a 10-bit video file and return a list of normalized NumPy arrays representing each frame.
+    Every frame is kept in memory (about 100 MB per 4K frame): use iter_frames to process long videos.
+    """
+    return list(iter_frames(video_path, range, normalize=True, max_frames=max_frames, every_nth_frame=every_nth_frame,
+                            start_time=start_time, duration=duration))
 
-        # Stack the Y, U, and V planes to create a 3D array (you might need to upsample the U and V planes)
-        image = np.stack((y_plane, u_plane, v_plane), axis=-1)
 
-        #frames.append(image) #causes memory issue. use yield instead  
-        #check the max and min range of the frame
-        print("Max: ",np.max(image)," Min: ",np.min(image))
-        count +=1
-        print("Frames Processed : ", count)
+#-------------------------------------------------**********-------------------------------------------------#
+def read_webm_10bit(video_path, max_frames=None, every_nth_frame=1, start_time=None, duration=None):
+    """Read a 10-bit HDR video file and return a list of NumPy arrays representing each frame.
 
-    return frames
+    Args:
+    video_path (str): The path to the HDR video file.
+    max_frames (int, optional): Stop after this number of frames.
+    every_nth_frame (int, optional): Keep one frame every `every_nth_frame` frames.
+    start_time (float, optional): Start reading at this time in seconds.
+    duration (float, optional): Stop reading after this duration in seconds.
+
+    Returns:
+    list of np.ndarray: A list of NumPy arrays (raw code values) representing each frame in the video.
+    Every frame is kept in memory: use iter_frames to process long videos.
+    """
+    return list(iter_frames(video_path, normalize=False, max_frames=max_frames, every_nth_frame=every_nth_frame,
+                            start_time=start_time, duration=duration))
 
 #-------------------------------------------------**********-------------------------------------------------#
-def read_yuv_video(filename, width, height):
+class YUVReader:
+    """
+    Random-access reader of a raw YUV (or RGB) video file, backed by np.memmap.
+
+    The file is never read as a whole: frames are zero-copy views of the mapped file, loaded on access by the
+    OS page cache, so any frame of a multi-GB file is reached in O(1).
+
+    Parameters:
+    - filename: path to the raw video file.
+    - width: width of the frames.
+    - height: height of the frames.
+    - pix_fmt: pixel format of the file (see pixel_formats.PIXEL_FORMATS), 10-bit 4:2:0 by default.
+
+    Indexing:
+    - reader[i]: (y, u, v) plane views of frame i ((rgb,) for RGB formats)
+    - reader[i:j:k]: (y, u, v) views of shape frames x plane height x plane width, still zero-copy
+    - reader[[i, j, ...]]: (y, u, v) arrays of the selected frames (copied)
+
+    Example:
+        reader = YUVReader('ref_2160p.yuv', 3840, 2160)
+        y, u, v = reader[len(reader) // 2]
     """
-    Read a 10-bit YUV HDR video file.
+    def __init__(self, filename, width, height, pix_fmt='yuv420p10le'):
+        self.filename = filename
+        self.width = width
+        self.height = height
+        self.fmt = get_pixel_format(pix_fmt)
+        self.frame_bytes = self.fmt.frame_bytes(width, height)
+        # Calculate the number of frames based on file size, a truncated last frame is ignored
+        self.num_frames = os.path.getsize(filename) // self.frame_bytes
+        self.data = np.memmap(filename, dtype=np.uint8, mode='r') if self.num_frames else None
+
+        # byte offset and shape of every plane inside a frame
+        self.plane_offsets = []
+        offset = 0
+        for name, shape in self.fmt.plane_shapes(width, height):
+            self.plane_offsets.append((name, offset, shape))
+            offset += int(np.prod(shape)) * self.fmt.dtype.itemsize
+        names = [name for name, _ in self.fmt.plane_shapes(width, height)]
+        self.plane_names = ['y', 'u', 'v'] if names == ['y', 'uv'] else names
+
+    def __len__(self):
+        return self.num_frames
+
+    def __iter__(self):
+        for i in range(self.num_frames):
+            yield self[i]
+
+    def _planes(self, start, count, step):
+        # strided views over `count` frames starting at frame `start`, every `step` frames
+        itemsize = self.fmt.dtype.itemsize
+        planes = {}
+        for name, offset, shape in self.plane_offsets:
+            if count == 0:
+                planes[name] = np.empty((0,) + shape, dtype=self.fmt.dtype)
+                continue
+            strides = [itemsize]
+            for dim in reversed(shape[1:]):
+                strides.insert(0, strides[0] * dim)
+            planes[name] = np.ndarray((count,) + shape, dtype=self.fmt.dtype, buffer=self.data,
+                                      offset=start * self.frame_bytes + offset, strides=(self.frame_bytes * step,) + tuple(strides))
+        if 'uv' in planes:
+            planes['u'] = planes['uv'][..., 0]
+            planes['v'] = planes['uv'][..., 1]
+        return tuple(planes[name] for name in self.plane_names)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            start, stop, step = index.indices(self.num_frames)
+            return self._planes(start, len(range(start, stop, step)), step)
+        if isinstance(index, (list, tuple, np.ndarray)):
+            frames = [self[int(i)] for i in index]
+            return tuple(np.stack(planes) for planes in zip(*frames))
+        index = int(index)
+        if index < 0:
+            index += self.num_frames
+        if not 0 <= index < self.num_frames:
+            raise IndexError(f"Frame {index} out of range ({self.num_frames} frames)")
+        return tuple(plane[0] for plane in self._planes(index, 1, 1))
+
+
+def read_yuv_video(filename, width, height, pix_fmt='yuv420p10le'):
+    """
+    Read a raw YUV HDR video file (10-bit 4:2:0 by default).
     
     Parameters:
     - filename: path to the YUV file.
     - width: width of the YUV frames.
     - height: height of the YUV frames.
+    - pix_fmt: pixel format of the YUV file (see pixel_formats.PIXEL_FORMATS).
     
     Returns:
-    - y, u, v: Y, U, and V components as 3D numpy arrays.
+    - y, u, v: Y, U, and V components as 3D numpy arrays (frames x plane height x plane width).
+      They are memory-mapped views of the file: nothing is read until the frames are accessed.
     """
-    
-    # Calculate frame size for 10-bit
-    frame_size = width * height * 2 + (width // 2 * height // 2) * 2 * 2
-    
-    # Calculate the number of frames based on file size
-    num_frames = os.path.getsize(filename) // frame_size
-    
-    frames = []
-    with open(filename, 'rb') as f:
-        for i in range(num_frames):
-            # Read Y component
-            y_video = np.frombuffer(f.read(width * height * 2), dtype=np.uint16).reshape((height, width))
-            
-            # Read U component
-            u_video = np.frombuffer(f.read(width // 2 * height // 2 * 2), dtype=np.uint16).reshape((height // 2, width // 2))
-            
-            # Read V component
-            v_video = np.frombuffer(f.read(width // 2 * height // 2 * 2), dtype=np.uint16).reshape((height // 2, width // 2))
-
-            # Stack the Y, U, and V components and append frame in frames list
-            frames.append(np.stack((y_video, u_video, v_video), axis=-1))
-            
-        
-    return frames
+    return YUVReader(filename, width, height, pix_fmt)[:]
 
 
 #-------------------------------------------------**********-------------------------------------------------#
-def main(video_path, range_type='tv', format='any'):
+def main(video_path, range_type='tv', format='any', max_frames=None, n_samples=16):
+    # `format` is kept for the existing callers and ignored: mp4 and webm videos are read by the same frame iterator
     range_type = check_video_range(video_path)
     print(f"The video uses {range_type} range.")
     
-    if format == 'mp4':
-        # Read video frames
-        frames = read_mp4_10bit(video_path, range_type)
-    else:
-        frames = read_webm_10bit(video_path)
-
-    if frames is not None:
-                print(f"Read {len(frames)} frames from the video.")
-                # Verify the frames
-                verify_frames(frames)
+    if n_samples and max_frames is None:
+        # Sampled verification, the full video is only decoded when the sample is ambiguous
+        verify_video(video_path, range_type, n_samples)
+        return
+    # Frames are streamed to the verification, one at a time
+    frames = iter_frames(video_path, range_type, normalize=True, max_frames=max_frames)
+    verify_frames(frames)
 
 #-------------------------------------------------**********-------------------------------------------------#
 if __name__ == "__main__":
@@ -0,0 +1,182 @@
+"""
+    Append-only writers for search results.
+
+    Rows are buffered and flushed to disk every `flush_every` rows, so memory stays flat regardless of
+    the number of keywords in a batch and a crash loses at most one flush window.
+
+    Supported formats: csv, jsonl and parquet (requires pyarrow), parquet with typed columns and Arrow IPC
+    (see columnar_export.py).
+"""
+import os
+import csv
+import json
+
+is_pyarrow_installed = False
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+    is_pyarrow_installed = True
+except ImportError:
+    pass
+
+from columnar_export import COMPONENT_KEYS, to_table, write_table
+
+# Columns of a video result of `CustomSearch` plus the searched keyword
+RESULT_COLUMNS = ['type', 'id', 'title', 'publishedTime', 'duration', 'viewCount', 'thumbnails', 'richThumbnail', 'descriptionSnippet', 'channel', 'accessibility', 'link', 'shelfTitle', 'keyword']
+
+#--------------------------------------------------------------*****--------------------------------------------------------------#
+class ResultWriter:
+    """
+    Base class: buffers rows and hands them to `_write_rows` every `flush_every` rows.
+    Rows are dicts or result records (VideoRecord...), records are kept compact in the buffer and converted with
+    `to_dict()` when they are written.
+
+    Args:
+    - path (str): output file (a directory for parquet), rows are appended if it already exists.
+    - columns (list): columns written for every row, missing keys are written empty and extra keys are ignored.
+    - flush_every (int): number of buffered rows before writing to disk.
+    """
+    def __init__(self, path, columns=RESULT_COLUMNS, flush_every=1000):
+        self.path = path
+        self.columns = list(columns)
+        self.flush_every = flush_every
+        self.buffer = []
+        self.count = 0
+
+    def write(self, rows, **values):
+        """ `values` are columns added to every row of `rows`, e.g. keyword=... """
+        for row in rows:
+            self.buffer.append((row, values))
+            if len(self.buffer) >= self.flush_every:
+                self.flush()
+
+    def flush(self):
+        if self.buffer:
+            self._write_rows([_to_dict(row, values) for row, values in self.buffer])
+            self.count += len(self.buffer)
+            self.buffer = []
+
+    def close(self):
+        self.flush()
+
+    def _write_rows(self, rows):
+        raise NotImplementedError
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+
+class CSVResultWriter(ResultWriter):
+    """ Nested values (viewCount, thumbnails, channel, ...) are written as their Python repr, like DataFrame.to_csv does """
+    def _write_rows(self, rows):
+        write_header = not os.path.exists(self.path) or os.path.getsize(self.path) == 0
+        with open(self.path, 'a', newline='', encoding='utf-8') as f:
+            writer = csv.DictWriter(f, fieldnames=self.columns, extrasaction='ignore')
+            if write_header:
+                writer.writeheader()
+            writer.writerows(rows)
+            f.flush()
+            os.fsync(f.fileno())
+
+
+class JSONLResultWriter(ResultWriter):
+    """ One JSON object per line, nested values are kept as they are """
+    def _write_rows(self, rows):
+        with open(self.path, 'a', encoding='utf-8') as f:
+            for row in rows:
+                f.write(json.dumps({c: row.get(c) for c in self.columns}) + '\n')
+            f.flush()
+            os.fsync(f.fileno())
+
+
+class ParquetResultWriter(ResultWriter):
+    """
+    `path` is a parquet dataset directory: every flush is written as a new part file, so a crash never
+    leaves a file without its footer. Nested values are stored as JSON strings.
+    Read it back with pd.read_parquet(path).
+    """
+    def __init__(self, path, columns=RESULT_COLUMNS, flush_every=1000):
+        if not is_pyarrow_installed:
+            raise Exception('ERROR: pyarrow is not installed. pyarrow must be installed to write parquet files.')
+        super().__init__(path, columns, flush_every)
+        self.schema = pa.schema([(c, pa.string()) for c in self.columns])
+        os.makedirs(self.path, exist_ok=True)
+        self.part = len([f for f in os.listdir(self.path) if f.endswith('.parquet')])
+
+    def _write_rows(self, rows):
+        data = {c: [_to_string(row.get(c)) for row in rows] for c in self.columns}
+        part_path = os.path.join(self.path, 'part-%05d.parquet' % self.part)
+        # write under a temporary name first, a part file is either complete or absent
+        pq.write_table(pa.table(data, schema=self.schema), part_path + '.tmp')
+        os.replace(part_path + '.tmp', part_path)
+        self.part += 1
+
+
+class ColumnarResultWriter(ResultWriter):
+    """
+    `path` is a dataset directory of part files with typed columns (columnar_export.py): durationSeconds,
+    viewCount, channelId, thumbnails URL lists... The columns of `columns` that are not keys of the video
+    components (e.g. keyword) are added as string columns. Every flush is a new part file, written in row
+    groups of `row_group_size` rows.
+    Read selected columns back, memory-mapped, with columnar_export.read_results(path, columns).
+    """
+    output_format = None
+
+    def __init__(self, path, columns=RESULT_COLUMNS, flush_every=1000, row_group_size=None):
+        if not is_pyarrow_installed:
+            raise Exception('ERROR: pyarrow is not installed. pyarrow must be installed to write parquet or arrow files.')
+        super().__init__(path, columns, flush_every)
+        self.extra_columns = [c for c in self.columns if c not in COMPONENT_KEYS['video']]
+        self.row_group_size = row_group_size
+        os.makedirs(self.path, exist_ok=True)
+        self.part = len([f for f in os.listdir(self.path) if f.endswith('.' + self.output_format)])
+
+    def _write_rows(self, rows):
+        part_path = os.path.join(self.path, 'part-%05d.%s' % (self.part, self.output_format))
+        # write under a temporary name first, a part file is either complete or absent
+        write_table(to_table(rows, 'video', self.extra_columns), part_path + '.tmp', self.output_format, self.row_group_size)
+        os.replace(part_path + '.tmp', part_path)
+        self.part += 1
+
+
+class TypedParquetResultWriter(ColumnarResultWriter):
+    output_format = 'parquet'
+
+
+class ArrowResultWriter(ColumnarResultWriter):
+    output_format = 'arrow'
+
+
+def _to_dict(row, values):
+    if not isinstance(row, dict):
+        row = row.to_dict()
+    return dict(row, **values) if values else row
+
+def _to_string(value):
+    if value is None or isinstance(value, str):
+        return value
+    return json.dumps(value)
+
+#--------------------------------------------------------------*****--------------------------------------------------------------#
+WRITERS = {
+    'csv': CSVResultWriter,
+    'jsonl': JSONLResultWriter,
+    'parquet': ParquetResultWriter,
+    'arrow': ArrowResultWriter,
+}
+
+def open_writer(path, output_format='csv', columns=RESULT_COLUMNS, flush_every=1000, typed=False):
+    """
+    Create the writer for `output_format` ('csv', 'jsonl', 'parquet' or 'arrow').
+    With `typed`, parquet is written with the typed columns of columnar_export.py instead of JSON strings.
+    """
+    if output_format not in WRITERS:
+        raise ValueError(f"Unknown output format: {output_format}")
+    if typed and output_format not in ('parquet', 'arrow'):
+        raise ValueError(f"Typed columns are only written to parquet or arrow, not {output_format}")
+    if typed and output_format == 'parquet':
+        return TypedParquetResultWriter(path, columns, flush_every)
+    return WRITERS[output_format](path, columns, flush_every)
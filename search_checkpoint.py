@@ -0,0 +1,93 @@
+"""
+    Checkpoint journal of the search script, used by `--resume` to continue an interrupted search.
+
+    Append-only JSONL file with one entry per fetched page:
+        {"keyword": ..., "page": pages fetched, "count": results received, "continuationKey": token of the next page,
+         "ids": IDs saved from the page, "done": keyword complete}
+    The last entry of a keyword is its state. Entries are written only once the results of their page are on disk,
+    so resuming never skips a page whose results were lost. Pages are fetched at least once: a crash after the rows of
+    a page are written but before its entry is, fetches the page again on resume. The search script rebuilds its ID
+    index from the result files on resume (id_index.open_index with rescan), so the rows of that page are dropped
+    as duplicates instead of being saved twice.
+"""
+import os
+import json
+
+#--------------------------------------------------------------*****--------------------------------------------------------------#
+class CheckpointJournal:
+    """
+    Args:
+    - path (str): journal file.
+    - resume (bool): load the states of a previous run; otherwise the journal starts empty.
+    """
+    def __init__(self, path, resume=False):
+        self.path = path
+        self.states = {}
+        self.pending = []
+        if resume and os.path.exists(path):
+            end = 0
+            with open(path, 'rb') as f:
+                for line in f:
+                    if not line.endswith(b'\n'):
+                        # last line cut by a crash
+                        break
+                    end += len(line)
+                    try:
+                        entry = json.loads(line)
+                    except json.JSONDecodeError:
+                        continue
+                    self.states[entry['keyword']] = _without_ids(entry)
+            if end < os.path.getsize(path):
+                # drop the cut line, so that the next entry starts on a line of its own
+                with open(path, 'r+b') as f:
+                    f.truncate(end)
+        else:
+            open(path, 'w').close()
+
+    def state(self, keyword):
+        """
+        Saved state of `keyword` (page, count, continuationKey, done) or None if it was never searched.
+        """
+        return self.states.get(keyword)
+
+    def is_done(self, keyword):
+        state = self.states.get(keyword)
+        return state is not None and state['done']
+
+    def saved_ids(self):
+        """
+        Iterate over the IDs saved in the journal.
+        """
+        if os.path.exists(self.path):
+            with open(self.path, encoding='utf-8') as f:
+                for line in f:
+                    try:
+                        yield from json.loads(line)['ids']
+                    except json.JSONDecodeError:
+                        continue
+
+    def record(self, keyword, page, count, continuation_key, ids, done, rows=0):
+        """
+        Record the state of `keyword` after a page. `rows` is the number of result rows emitted up to this page,
+        the entry is written by the first `flush` once that many rows are on disk.
+        """
+        entry = {'keyword': keyword, 'page': page, 'count': count, 'continuationKey': continuation_key, 'ids': list(ids), 'done': done}
+        self.states[keyword] = _without_ids(entry)
+        self.pending.append((rows, entry))
+
+    def flush(self, rows_written=None):
+        """
+        Append the pending entries whose rows are written (`rows_written`, all entries if None) to the journal.
+        """
+        ready = [entry for rows, entry in self.pending if rows_written is None or rows <= rows_written]
+        if ready:
+            with open(self.path, 'a', encoding='utf-8') as f:
+                f.write(''.join(json.dumps(entry) + '\n' for entry in ready))
+                f.flush()
+                os.fsync(f.fileno())
+            self.pending = self.pending[len(ready):]
+
+
+def _without_ids(entry):
+    # the IDs are only kept in the journal file, the in-memory state stays small for any number of results
+    return {k: v for k, v in entry.items() if k != 'ids'}
@@ -0,0 +1,107 @@
+"""
+    Persistent store of the video IDs already searched and downloaded, shared across runs and processes.
+
+    SQLite database in WAL mode: lookups go through the primary key index (O(log n)), several processes can
+    read and write it at the same time and writes are atomic, so a crash never leaves a half written record.
+
+    Tables:
+    - searched: id, keyword, filter, timestamp of every saved search result
+    - downloaded: id, path, timestamp of every downloaded video
+"""
+import os
+import time
+import sqlite3
+import threading
+import numpy as np
+
+#--------------------------------------------------------------*****--------------------------------------------------------------#
+class SeenStore:
+    """
+    Seen-ID store, usable as the ID index of the search script (same `contains` / `add` / `flush` interface as IDIndex).
+
+    Args:
+    - path (str): SQLite database file, created if it does not exist.
+    - filter_criterion (str, optional): recorded with every searched ID.
+    """
+    def __init__(self, path, filter_criterion=None):
+        self.path = path
+        self.filter_criterion = filter_criterion
+        self.pending = {}
+        self._lock = threading.Lock()
+        self._conn = None
+        self._pid = None
+        with self._connect() as conn:
+            conn.execute("CREATE TABLE IF NOT EXISTS searched (id TEXT PRIMARY KEY, keyword TEXT, filter TEXT, timestamp REAL)")
+            conn.execute("CREATE TABLE IF NOT EXISTS downloaded (id TEXT PRIMARY KEY, path TEXT, timestamp REAL)")
+
+    def _connect(self):
+        # one connection per process, a connection must not be used after a fork (joblib / multiprocessing workers)
+        if self._conn is None or self._pid != os.getpid():
+            self._conn = sqlite3.connect(self.path, timeout=60, check_same_thread=False)
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute("PRAGMA synchronous=NORMAL")
+            self._pid = os.getpid()
+        return self._conn
+
+    def __getstate__(self):
+        # only the path is sent to worker processes, they open their own connection
+        return {'path': self.path, 'filter_criterion': self.filter_criterion}
+
+    def __setstate__(self, state):
+        self.__init__(state['path'], state['filter_criterion'])
+
+    def __len__(self):
+        # pending IDs may already be saved by another process sharing the store, they are only counted once
+        pending = len(self.pending) - len(self._select('searched', list(self.pending))) if self.pending else 0
+        with self._lock:
+            return self._connect().execute("SELECT COUNT(*) FROM searched").fetchone()[0] + pending
+
+    def __contains__(self, video_id):
+        return bool(self.contains([video_id])[0])
+
+    def _select(self, table, ids):
+        found = set()
+        with self._lock:
+            conn = self._connect()
+            # stay below the SQLite limit of bound parameters
+            for i in range(0, len(ids), 500):
+                chunk = ids[i:i + 500]
+                query = "SELECT id FROM %s WHERE id IN (%s)" % (table, ','.join('?' * len(chunk)))
+                found.update(row[0] for row in conn.execute(query, chunk))
+        return found
+
+    def contains(self, ids):
+        """
+        Boolean mask of `ids` already searched (saved or pending).
+        """
+        ids = [str(i) for i in ids]
+        found = self._select('searched', ids)
+        return np.fromiter((i in found or i in self.pending for i in ids), dtype=bool, count=len(ids))
+
+    def add(self, ids, keyword=None):
+        """
+        Add searched IDs. They are written to the database on the next `flush`.
+        """
+        for i in ids:
+            self.pending.setdefault(i, keyword)
+
+    def flush(self):
+        if not self.pending:
+            return
+        now = time.time()
+        rows = [(i, keyword, self.filter_criterion, now) for i, keyword in self.pending.items()]
+        with self._lock:
+            with self._connect() as conn:
+                conn.executemany("INSERT OR IGNORE INTO searched (id, keyword, filter, timestamp) VALUES (?, ?, ?, ?)", rows)
+        self.pending = {}
+
+    def downloaded(self, ids):
+        """
+        Subset of `ids` already downloaded.
+        """
+        return self._select('downloaded', [str(i) for i in ids])
+
+    def mark_downloaded(self, video_id, path=None):
+        with self._lock:
+            with self._connect() as conn:
+                conn.execute("INSERT OR REPLACE INTO downloaded (id, path, timestamp) VALUES (?, ?, ?)", (video_id, path, time.time()))
@@ -0,0 +1,12 @@
+"""
+Offline tests of the scripts at the root of the repository (no network, the HDR readers use the ffmpeg binary of
+imageio-ffmpeg on tiny generated videos).
+
+    python -m pytest tests
+"""
+import os
+import sys
+
+ROOT = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..')
+sys.path.insert(0, ROOT)
+sys.path.insert(0, os.path.join(ROOT, 'youtube_search_python'))
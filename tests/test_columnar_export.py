@@ -0,0 +1,73 @@
+import csv
+
+import pytest
+
+pytest.importorskip('pyarrow')
+from columnar_export import parse_duration, parse_count, read_components, to_table, export_results, read_results
+from result_writers import RESULT_COLUMNS, open_writer
+
+#--------------------------------------------------------------*****--------------------------------------------------------------#
+VIDEO = {
+    'type': 'video',
+    'id': 'abc',
+    'title': '[4K HDR] Iceland drone',
+    'publishedTime': '2 years ago',
+    'duration': '1:02:03',
+    'viewCount': {'text': '1,234,567 views', 'short': '1.2M views'},
+    'thumbnails': [{'url': 'https://i.ytimg.com/a.jpg', 'width': 360, 'height': 202}, {'url': 'https://i.ytimg.com/b.jpg', 'width': 720, 'height': 404}],
+    'richThumbnail': None,
+    'descriptionSnippet': [{'text': 'drone '}, {'text': 'footage'}],
+    'channel': {'name': 'Chan', 'id': 'UC0', 'thumbnails': None, 'link': 'https://www.youtube.com/channel/UC0'},
+    'accessibility': {'title': 'Iceland', 'duration': '1 hour, 2 minutes'},
+    'link': 'https://www.youtube.com/watch?v=abc',
+    'shelfTitle': None,
+}
+
+
+@pytest.mark.parametrize('text, seconds', [('4:40', 280), ('0:07', 7), ('1:02:03', 3723), ('LIVE', None), ('', None), (None, None)])
+def test_parse_duration(text, seconds):
+    assert parse_duration(text) == seconds
+
+
+@pytest.mark.parametrize('text, count', [('1,234,567 views', 1234567), ('1.2M views', 1200000), ('12K', 12000), ('No views', 0),
+                                         ('57 watching', 57), ('3', 3), (5, 5), (None, None)])
+def test_parse_count(text, count):
+    assert parse_count(text) == count
+
+
+def test_to_table_types():
+    row = to_table([dict(VIDEO, keyword='iceland')], 'video', ['keyword']).to_pylist()[0]
+    assert row['durationSeconds'] == 3723
+    assert row['viewCount'] == 1234567
+    assert row['channelId'] == 'UC0'
+    assert row['thumbnails'] == ['https://i.ytimg.com/a.jpg', 'https://i.ytimg.com/b.jpg']
+    assert row['descriptionSnippet'] == 'drone footage'
+    assert row['keyword'] == 'iceland'
+
+
+def test_read_components_csv_title_with_bracket(tmp_path):
+    # nested values are written as Python reprs, as by the csv writer of the search script
+    path = str(tmp_path / 'results.csv')
+    with open(path, 'w', newline='', encoding='utf-8') as f:
+        writer = csv.DictWriter(f, fieldnames=RESULT_COLUMNS)
+        writer.writeheader()
+        writer.writerow(dict(VIDEO, keyword='[HDR] iceland'))
+    row = read_components(path)[0]
+    assert row['title'] == '[4K HDR] Iceland drone'
+    assert row['keyword'] == '[HDR] iceland'
+    assert row['thumbnails'] == VIDEO['thumbnails']
+    assert row['channel'] == VIDEO['channel']
+
+
+@pytest.mark.parametrize('name', ['results.parquet', 'results.arrow'])
+def test_export_read_selected_columns(tmp_path, name):
+    path = str(tmp_path / name)
+    export_results([VIDEO, dict(VIDEO, id='def', duration=None)], path)
+    table = read_results(path, columns=['id', 'durationSeconds'])
+    assert table.column_names == ['id', 'durationSeconds']
+    assert table.to_pylist() == [{'id': 'abc', 'durationSeconds': 3723}, {'id': 'def', 'durationSeconds': None}]
+
+
+def test_typed_writer_requires_columnar_format(tmp_path):
+    with pytest.raises(ValueError):
+        open_writer(str(tmp_path / 'results.csv'), 'csv', typed=True)
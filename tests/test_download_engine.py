@@ -0,0 +1,66 @@
+import pytest
+
+pytest.importorskip('yt_dlp')
+from download_engine import select_format, Downloader, FORMAT_CHOICES
+
+# formats of yt-dlp, sorted from worst to best
+FORMATS = [
+    {'format_id': '139', 'ext': 'm4a', 'vcodec': 'none', 'acodec': 'mp4a.40.5'},
+    {'format_id': 'sb0', 'ext': 'mhtml', 'vcodec': 'none', 'acodec': 'none'},
+    {'format_id': '137', 'ext': 'mp4', 'vcodec': 'avc1.640028', 'dynamic_range': 'SDR'},
+    {'format_id': '337', 'ext': 'webm', 'vcodec': 'vp09.02.51.10.01.09.16.09.00', 'dynamic_range': 'HDR10'},
+    {'format_id': '701', 'ext': 'mp4', 'vcodec': 'av01.0.13M.10.0.110.09.16.09.0', 'dynamic_range': 'HDR10'},
+    {'format_id': '248', 'ext': 'webm', 'vcodec': 'vp9', 'dynamic_range': 'SDR'},
+]
+
+
+@pytest.mark.parametrize('format_vid, format_id', [('any', '248'), ('MP4', '701'), ('HDR', '701')])
+def test_select_format(format_vid, format_id):
+    assert select_format(FORMATS, format_vid)['format_id'] == format_id
+
+
+def test_select_format_without_hdr_or_mp4():
+    sdr = [f for f in FORMATS if f.get('dynamic_range') in (None, 'SDR')]
+    # no HDR format: the best video format
+    assert select_format(sdr, 'HDR')['format_id'] == '248'
+    webm = [f for f in FORMATS if f['ext'] != 'mp4']
+    assert select_format(webm, 'MP4') is None
+    # audio only
+    assert select_format(FORMATS[:2], 'any') is None
+    assert select_format([], 'any') is None
+
+
+def test_unknown_format(tmp_path):
+    assert FORMAT_CHOICES == ['any', 'MP4', 'HDR']
+    with pytest.raises(ValueError):
+        Downloader(str(tmp_path), 'mkv')
+
+
+class FakeYDL:
+    # records the calls of Downloader.download
+    def __init__(self):
+        self.calls = []
+
+    def extract_info(self, url, download=True, process=True):
+        self.calls.append(('extract_info', download, process))
+        return {'id': 'abc', 'formats': FORMATS}
+
+    def process_ie_result(self, info, download=True):
+        self.calls.append(('process_ie_result', download, info['save_name']))
+        return dict(info, requested_downloads=[{'filepath': info['save_name'] + '.mp4', 'format_id': '701'}])
+
+
+def test_download_selects_the_format_once(tmp_path):
+    downloader = Downloader(str(tmp_path), 'HDR')
+    downloader.ydl = FakeYDL()
+    assert downloader.download('https://www.youtube.com/watch?v=abc', 'abc') == {'filepath': 'abc.mp4', 'format_id': '701'}
+    # metadata only, the formats are resolved by process_ie_result
+    assert downloader.ydl.calls == [('extract_info', False, False), ('process_ie_result', True, 'abc')]
+    assert downloader._format_selector({'formats': FORMATS}) == [FORMATS[4]]
+
+
+def test_remove_partial(tmp_path):
+    for name in ['a[1].mp4.part', 'a[1].mp4.ytdl', 'b.mp4']:
+        (tmp_path / name).write_bytes(b'x')
+    Downloader(str(tmp_path)).remove_partial('a[1]')
+    assert sorted(p.name for p in tmp_path.iterdir()) == ['b.mp4']
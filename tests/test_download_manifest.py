@@ -0,0 +1,56 @@
+import json
+import pickle
+
+from download_manifest import DownloadManifest, file_checksum
+
+
+def test_record_and_reload(tmp_path):
+    video = tmp_path / 'a.mp4'
+    video.write_bytes(b'0123456789')
+    manifest = DownloadManifest(str(tmp_path))
+    manifest.record('a', str(video), '701')
+    manifest.record('b', status='failed')
+    manifest.record('c', status='failed')
+    manifest.record('c', str(tmp_path / 'missing.mp4'))
+    assert 'a' in manifest and 'b' not in manifest
+    # the last entry of an ID is its state
+    assert manifest.downloaded == {'a', 'c'} and manifest.failed == {'b'}
+
+    reloaded = DownloadManifest(str(tmp_path))
+    assert reloaded.downloaded == {'a', 'c'} and reloaded.failed == {'b'}
+    with open(tmp_path / 'manifest.jsonl', encoding='utf-8') as f:
+        entry = json.loads(f.readline())
+    assert (entry['id'], entry['format'], entry['bytes'], entry['status'], entry['checksum']) == ('a', '701', 10, 'downloaded', None)
+
+
+def test_truncated_last_line(tmp_path):
+    manifest = DownloadManifest(str(tmp_path))
+    manifest.record('a')
+    with open(tmp_path / 'manifest.jsonl', 'a', encoding='utf-8') as f:
+        f.write('{"id": "b", "status": "downl')
+    reloaded = DownloadManifest(str(tmp_path))
+    assert reloaded.downloaded == {'a'}
+    # the cut line is dropped, the next entry is not appended to it
+    reloaded.record('c')
+    assert DownloadManifest(str(tmp_path)).downloaded == {'a', 'c'}
+
+
+def test_checksums_are_opt_in(tmp_path):
+    video = tmp_path / 'a.mp4'
+    video.write_bytes(b'0123456789')
+    DownloadManifest(str(tmp_path), 'plain.jsonl').record('a', str(video))
+    DownloadManifest(str(tmp_path), 'checked.jsonl', checksum=True).record('a', str(video))
+    with open(tmp_path / 'plain.jsonl', encoding='utf-8') as f:
+        assert json.loads(f.read())['checksum'] is None
+    with open(tmp_path / 'checked.jsonl', encoding='utf-8') as f:
+        assert json.loads(f.read())['checksum'] == file_checksum(str(video)) == \
+            '84d89877f0d4041efb6bf91a16f0248f2fd573e6af05c19f96bedb9f882f7882'
+
+
+def test_pickled_manifest_only_appends(tmp_path):
+    manifest = DownloadManifest(str(tmp_path), checksum=True)
+    manifest.record('a')
+    worker = pickle.loads(pickle.dumps(manifest))
+    assert worker.downloaded == set() and worker.checksum
+    worker.record('b')
+    assert DownloadManifest(str(tmp_path)).downloaded == {'a', 'b'}
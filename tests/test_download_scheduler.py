@@ -0,0 +1,133 @@
+import threading
+
+import pytest
+
+pytest.importorskip('yt_dlp')
+import download_scheduler
+from download_scheduler import DownloadScheduler, TokenBucket, DownloadCancelled
+
+
+class Clock:
+    """
+    Fake `time` module: sleeping advances the clock instantly.
+    """
+    def __init__(self):
+        self.now = 0.0
+        self.sleeps = []
+
+    def monotonic(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+
+def tasks(*durations):
+    return [{'id': 'v%d' % i, 'duration': d} for i, d in enumerate(durations)]
+
+
+@pytest.mark.parametrize('priority, order', [
+    ('shortest', ['v2', 'v3', 'v0', 'v1', 'v4']),
+    ('longest', ['v0', 'v3', 'v2', 'v1', 'v4']),
+    ('order', ['v0', 'v1', 'v2', 'v3', 'v4']),
+])
+def test_priority_order(priority, order):
+    started = []
+    scheduler = DownloadScheduler(lambda task: started.append(task['id']), n_workers=1, priority=priority)
+    stats = scheduler.run(tasks(30, None, 10, 20, float('nan')))
+    # unknown durations (None, NaN) are started last, in their order
+    assert started == order
+    assert stats['downloaded'] == 5
+
+
+def test_unknown_priority():
+    with pytest.raises(ValueError):
+        DownloadScheduler(print, priority='random')
+
+
+def test_retries_with_backoff():
+    attempts = []
+    lock = threading.Lock()
+
+    def download(task):
+        with lock:
+            attempts.append((task['id'], task.get('attempt', 0), download_scheduler.time.monotonic()))
+        if task['id'] == 'v0' and task.get('attempt', 0) < 2:
+            raise OSError('connection reset')
+        return task['id']
+
+    done = []
+    scheduler = DownloadScheduler(download, n_workers=1, retries=3, backoff=0.05, priority='order',
+                                  on_done=lambda task, result: done.append(result))
+    stats = scheduler.run(tasks(10, 20))
+    assert stats == {'downloaded': 2, 'failed': 0, 'retried': 2, 'cancelled': 0}
+    # the worker is not blocked by the backoff: v1 runs before the first retry of v0
+    assert [(i, a) for i, a, _ in attempts] == [('v0', 0), ('v1', 0), ('v0', 1), ('v0', 2)]
+    # the delay doubles at every retry
+    times = [t for i, _, t in attempts if i == 'v0']
+    assert times[1] - times[0] >= 0.05
+    assert times[2] - times[1] >= 0.1
+    assert sorted(done) == ['v0', 'v1']
+
+
+def test_failed_after_the_last_retry():
+    failed = []
+
+    def download(task):
+        raise OSError('HTTP Error 403')
+
+    scheduler = DownloadScheduler(download, n_workers=2, retries=2, backoff=0.01,
+                                  on_failed=lambda task, error: failed.append((task['id'], task['attempt'], str(error))))
+    stats = scheduler.run(tasks(10))
+    assert stats == {'downloaded': 0, 'failed': 1, 'retried': 2, 'cancelled': 0}
+    assert failed == [('v0', 2, 'HTTP Error 403')]
+
+
+def test_token_bucket_caps_the_rate(monkeypatch):
+    clock = Clock()
+    monkeypatch.setattr(download_scheduler, 'time', clock)
+    bucket = TokenBucket(1000)
+    # the burst is consumed at once, then the debt is paid back at the rate
+    bucket.consume(1000)
+    assert clock.sleeps == []
+    bucket.consume(500)
+    assert clock.sleeps == [pytest.approx(0.5)]
+    for _ in range(10):
+        bucket.consume(1000)
+    # 11500 bytes in 11.5 s: 1000 bytes/s after the first burst
+    assert clock.now == pytest.approx(10.5)
+
+
+def test_progress_hook_charges_the_new_bytes(monkeypatch):
+    clock = Clock()
+    monkeypatch.setattr(download_scheduler, 'time', clock)
+    scheduler = DownloadScheduler(print, max_rate=1000)
+    consumed = []
+    monkeypatch.setattr(scheduler.bucket, 'consume', consumed.append)
+    # a resumed .part file starts at its size: only the bytes received afterwards are charged
+    for downloaded in [5000, 5600, 6000]:
+        scheduler.progress_hook({'status': 'downloading', 'filename': 'a.part', 'downloaded_bytes': downloaded})
+    scheduler.progress_hook({'status': 'finished', 'filename': 'a.part'})
+    scheduler.progress_hook({'status': 'downloading', 'filename': 'a.part', 'downloaded_bytes': 100})
+    assert consumed == [600, 400]
+
+
+def test_shutdown_cancels_the_running_downloads():
+    started = threading.Event()
+    scheduler = None
+
+    def download(task):
+        started.set()
+        # a download reports its progress until it is cancelled
+        while True:
+            scheduler.progress_hook({'status': 'downloading', 'filename': task['id'], 'downloaded_bytes': 0})
+            threading.Event().wait(0.01)
+
+    scheduler = DownloadScheduler(download, n_workers=1, priority='order')
+    threading.Thread(target=lambda: started.wait() and scheduler.shutdown(), daemon=True).start()
+    stats = scheduler.run(tasks(10, 20, 30))
+    # the running download is cancelled and not retried, the queued ones are not started
+    assert stats == {'downloaded': 0, 'failed': 0, 'retried': 0, 'cancelled': 1}
+    with pytest.raises(DownloadCancelled):
+        scheduler.progress_hook({'status': 'downloading'})
@@ -0,0 +1,79 @@
+import io
+import csv
+import json
+import subprocess
+from types import SimpleNamespace
+
+import numpy as np
+import pytest
+
+imageio_ffmpeg = pytest.importorskip('imageio_ffmpeg')
+import hdr_stats
+import read_hdr_10bit
+from hdr_stats import HDRStats, pq_eotf
+
+
+def planes(y, u=512, v=512, shape=(2, 4)):
+    # code values of a yuv420p10le frame, Y given per pixel, U / V constant
+    chroma = (shape[0] // 2, shape[1] // 2)
+    return np.asarray(y, np.uint16).reshape(shape), np.full(chroma, u, np.uint16), np.full(chroma, v, np.uint16)
+
+
+def test_code_value_statistics():
+    stats = HDRStats(10, pq=False)
+    row = stats.update(planes([64, 64, 255, 255, 256, 300, 940, 1023]))
+    assert row['min'] == 64 and row['max'] == 1023
+    # 4 luma samples above 255, the 4 chroma samples (512) too
+    assert row['fraction_above_8bit'] == pytest.approx(8 / 12)
+    assert stats.histogram[0, 255] == 2 and stats.histogram[1, 512] == 2
+
+    # a frame that fits in 8 bits: values up to 255 only
+    row = stats.update(planes([16] * 8, 128, 255))
+    assert row['fraction_above_8bit'] == 0 and row['max'] == 255
+
+    summary = stats.summary(histograms=True)
+    assert summary['frames'] == 2
+    assert summary['y'] == {'min': 16, 'max': 1023, 'fraction_above_8bit': 4 / 16}
+    assert summary['u'] == {'min': 128, 'max': 512, 'fraction_above_8bit': 0.5}
+    assert summary['fraction_above_8bit'] == pytest.approx(8 / 24)
+    assert len(summary['histograms']['v']) == 1024
+
+
+def test_pq_and_frame_rows():
+    out = io.StringIO()
+    stats = HDRStats(10, pq=True, frame_writer=csv.writer(out))
+    frame = np.zeros((2, 4, 3), np.float32)
+    frame[0, 0, 1] = 1.0
+    row = stats.update(planes([64] * 8), frame)
+    # the brightest pixel is at the PQ peak (10000 nits), the 7 other pixels are black
+    assert row['max_cll'] == pytest.approx(10000)
+    assert row['max_fall'] == pytest.approx(10000 / 8)
+    assert stats.summary()['max_cll'] == pytest.approx(10000)
+    assert out.getvalue().split(',')[0] == '0'
+
+
+def test_pq_eotf():
+    assert pq_eotf(0) == 0
+    assert pq_eotf(1) == pytest.approx(10000)
+    # 100 nits is about 0.508 of the PQ signal
+    assert pq_eotf(0.5081) == pytest.approx(100, rel=0.01)
+
+
+def test_video_stats(tmp_path, monkeypatch):
+    y, u, v = planes([64, 64, 255, 255, 256, 300, 940, 1023])
+    path = str(tmp_path / 'frames.nut')
+    cmd = [imageio_ffmpeg.get_ffmpeg_exe(), '-v', 'error', '-y', '-f', 'rawvideo', '-pix_fmt', 'yuv420p10le',
+           '-s', '4x2', '-i', '-', '-c:v', 'rawvideo', path]
+    subprocess.run(cmd, input=(y.tobytes() + u.tobytes() + v.tobytes()) * 2, check=True)
+    info = SimpleNamespace(color_transfer='smpte2084', color_range='tv', bit_depth=10)
+    monkeypatch.setattr(hdr_stats, 'probe', lambda video_path: info)
+    monkeypatch.setattr(hdr_stats, 'probe_stream', lambda video_path: (4, 2, 'yuv420p10le'))
+    monkeypatch.setattr(read_hdr_10bit, 'probe_stream', lambda video_path: (4, 2, 'yuv420p10le'))
+
+    summary = hdr_stats.video_stats(path, str(tmp_path / 'stats'))
+    assert summary['frames'] == 2
+    assert summary['y']['min'] == 64 and summary['y']['max'] == 1023
+    assert summary['fraction_above_8bit'] == pytest.approx(8 / 12)
+    assert summary['max_cll'] > 0
+    with open(tmp_path / 'stats' / 'frames_stats.json') as f:
+        assert json.load(f)['histograms']['y'][255] == 4
@@ -0,0 +1,58 @@
+import json
+
+import pytest
+
+from id_index import IDIndex, read_ids, load_folder, open_index
+from result_writers import open_writer
+
+
+def test_add_flush_reload(tmp_path):
+    path = str(tmp_path / 'ids.txt')
+    index = IDIndex(path)
+    index.add(['a', 'b', 'a'])
+    index.add(['b', 'c'])
+    assert len(index) == 3
+    assert 'a' in index and 'd' not in index
+    assert list(index.contains(['a', 'd', 'c'])) == [True, False, True]
+    # the IDs reach the file on flush only
+    assert IDIndex(path).ids == set()
+    index.flush()
+    index.flush()
+    with open(path, encoding='utf-8') as f:
+        assert f.read().split() == ['a', 'b', 'c']
+    assert IDIndex(path).ids == {'a', 'b', 'c'}
+
+
+def test_in_memory_index():
+    index = IDIndex()
+    index.add(['a'])
+    index.flush()
+    assert len(index) == 1
+
+
+@pytest.mark.parametrize('output_format', ['csv', 'jsonl', 'parquet', 'arrow'])
+def test_read_ids(tmp_path, output_format):
+    if output_format in ('parquet', 'arrow'):
+        pytest.importorskip('pyarrow')
+    path = str(tmp_path / ('results.' + output_format))
+    with open_writer(path, output_format, flush_every=2) as writer:
+        writer.write([{'type': 'video', 'id': i, 'title': '[HDR] ' + i} for i in ['a', 'b', 'c']], keyword='k')
+    assert read_ids(path) == ['a', 'b', 'c']
+
+
+def test_load_folder_and_open_index(tmp_path):
+    root = tmp_path / 'searched_csv'
+    root.mkdir()
+    with open(root / 'a.jsonl', 'w', encoding='utf-8') as f:
+        f.write(json.dumps({'id': 'a'}) + '\n' + json.dumps({'id': 'b'}) + '\n')
+    (root / 'a.csv').write_text('id,title\nc,x\n', encoding='utf-8')
+    (root / 'keywords').mkdir()
+    index = IDIndex()
+    load_folder(index, str(root))
+    assert index.ids == {'a', 'b', 'c'}
+
+    # the ID file is created from the folder once, later runs only read the file
+    ids_path = str(tmp_path / 'ids.txt')
+    assert open_index(str(root), ids_path).ids == {'a', 'b', 'c'}
+    (root / 'b.csv').write_text('id\nd\n', encoding='utf-8')
+    assert open_index(str(root), ids_path).ids == {'a', 'b', 'c'}
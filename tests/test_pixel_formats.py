@@ -0,0 +1,57 @@
+import numpy as np
+import pytest
+
+from pixel_formats import get_pixel_format, PIXEL_FORMATS
+
+WIDTH, HEIGHT = 8, 4
+
+
+def test_yuv420p10le_planes():
+    fmt = get_pixel_format('yuv420p10le')
+    assert fmt.dtype == np.dtype('<u2') and fmt.bit_depth == 10
+    assert fmt.frame_bytes(WIDTH, HEIGHT) == WIDTH * HEIGHT * 3 // 2 * 2
+    raw = bytearray(np.arange(WIDTH * HEIGHT * 3 // 2, dtype='<u2').tobytes())
+    planes = fmt.planes(raw, WIDTH, HEIGHT)
+    y, u, v = planes['y'], planes['u'], planes['v']
+    assert y.shape == (HEIGHT, WIDTH) and u.shape == v.shape == (HEIGHT // 2, WIDTH // 2)
+    # contiguous planes, one after the other in the frame
+    assert y.strides == (WIDTH * 2, 2) and u.strides == (WIDTH // 2 * 2, 2)
+    assert y[0, 0] == 0 and u[0, 0] == WIDTH * HEIGHT and v[0, 0] == WIDTH * HEIGHT * 5 // 4
+    # zero-copy views of the buffer
+    raw[0:2] = b'\x01\x00'
+    assert y[0, 0] == 1
+
+
+def test_p010le_planes():
+    fmt = get_pixel_format('p010le')
+    assert fmt.shift == 6 and fmt.family == 'nv'
+    assert fmt.frame_bytes(WIDTH, HEIGHT) == get_pixel_format('yuv420p10le').frame_bytes(WIDTH, HEIGHT)
+    chroma = np.stack([np.full((HEIGHT // 2, WIDTH // 2), 100), np.full((HEIGHT // 2, WIDTH // 2), 200)], axis=-1)
+    raw = np.full((HEIGHT, WIDTH), 940 << 6, '<u2').tobytes() + (chroma << 6).astype('<u2').tobytes()
+    planes = fmt.planes(raw, WIDTH, HEIGHT)
+    y, u, v = planes['y'], planes['u'], planes['v']
+    assert u.shape == v.shape == (HEIGHT // 2, WIDTH // 2)
+    # u and v are interleaved in the uv plane: every other sample
+    assert u.strides == v.strides == (WIDTH * 2, 4)
+    assert (y >> fmt.shift == 940).all() and (u >> fmt.shift == 100).all() and (v >> fmt.shift == 200).all()
+
+
+def test_big_endian_and_rgb():
+    fmt = get_pixel_format('yuv420p10be')
+    assert fmt.planes(np.full(WIDTH * HEIGHT * 3 // 2, 1023, '>u2').tobytes(), WIDTH, HEIGHT)['v'][0, 0] == 1023
+    fmt = get_pixel_format('rgb48le')
+    assert fmt.frame_bytes(WIDTH, HEIGHT) == WIDTH * HEIGHT * 6
+    assert fmt.planes(bytes(fmt.frame_bytes(WIDTH, HEIGHT)), WIDTH, HEIGHT)['rgb'].shape == (HEIGHT, WIDTH, 3)
+
+
+def test_odd_frame_size():
+    # ffmpeg rounds the chroma planes up
+    fmt = get_pixel_format('yuv420p')
+    assert fmt.chroma_shape(5, 3) == (2, 3)
+    assert fmt.frame_bytes(5, 3) == 5 * 3 + 2 * 2 * 3
+
+
+def test_unsupported_format():
+    assert 'yuv420p10le' in PIXEL_FORMATS
+    with pytest.raises(ValueError):
+        get_pixel_format('gray10le')
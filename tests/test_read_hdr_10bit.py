@@ -0,0 +1,129 @@
+import io
+import subprocess
+
+import numpy as np
+import pytest
+
+imageio_ffmpeg = pytest.importorskip('imageio_ffmpeg')
+import read_hdr_10bit
+from read_hdr_10bit import iter_frames, FrameConverter, YUVReader
+
+WIDTH, HEIGHT = 4, 2
+# code values of a 4x2 yuv420p10le frame, below black (0), black (64), white (940) and above white (1023)
+Y = np.array([[64, 940, 502, 1023], [0, 64, 940, 512]], '<u2')
+U = np.array([[512, 600]], '<u2')
+V = np.array([[400, 512]], '<u2')
+
+
+@pytest.fixture
+def video(tmp_path, monkeypatch):
+    """
+    Lossless video of 3 identical frames, encoded with the ffmpeg binary of imageio-ffmpeg (ffprobe is not needed).
+    """
+    path = str(tmp_path / 'frames.nut')
+    cmd = [imageio_ffmpeg.get_ffmpeg_exe(), '-v', 'error', '-y', '-f', 'rawvideo', '-pix_fmt', 'yuv420p10le',
+           '-s', f'{WIDTH}x{HEIGHT}', '-i', '-', '-c:v', 'rawvideo', path]
+    subprocess.run(cmd, input=(Y.tobytes() + U.tobytes() + V.tobytes()) * 3, check=True)
+    monkeypatch.setattr(read_hdr_10bit, 'probe_stream', lambda video_path: (WIDTH, HEIGHT, 'yuv420p10le'))
+    return path
+
+
+def test_code_values(video):
+    frames = list(iter_frames(video, normalize=False))
+    assert len(frames) == 3
+    assert (frames[0][..., 0] == Y).all()
+    assert (frames[0][..., 1] == U.repeat(2, axis=0).repeat(2, axis=1)).all()
+    assert (frames[0][..., 2] == V.repeat(2, axis=0).repeat(2, axis=1)).all()
+
+
+def test_limited_range(video):
+    frame = next(iter_frames(video, 'tv'))
+    assert frame.dtype == np.float32
+    assert np.allclose(frame[..., 0], np.clip((Y.astype(float) - 64) / 876, 0, 1))
+
+
+@pytest.mark.parametrize('range', ['pc', 'unknown', None])
+def test_other_ranges_are_full_range(video, range):
+    # as read_mp4_10bit: only 'tv' is limited range, an unknown range is read as full range
+    frame = next(iter_frames(video, range))
+    assert np.allclose(frame[..., 0], Y / 1023)
+
+
+def test_batches_and_max_frames(video):
+    batches = list(iter_frames(video, batch_size=2))
+    assert [len(b) for b in batches] == [2, 1]
+    assert len(list(iter_frames(video, max_frames=2))) == 2
+
+
+def test_code_values_of_the_frames(video):
+    frame, (y, u, v) = next(iter_frames(video, layout='rgb', code_values=True))
+    assert frame.shape == (HEIGHT, WIDTH, 3)
+    assert (y == Y).all() and (u == U).all() and (v == V).all()
+    with pytest.raises(ValueError):
+        next(iter_frames(video, batch_size=2, code_values=True))
+
+#-------------------------------------------------**********-------------------------------------------------#
+def test_converter_planar_layout(video):
+    y, u, v = next(iter_frames(video, normalize=False, layout='planar'))
+    assert (y == Y).all() and (u == U).all() and (v == V).all()
+    # the frames are copies unless the buffer is reused
+    frames = list(iter_frames(video, layout='planar'))
+    assert frames[0][0] is not frames[1][0]
+    frames = list(iter_frames(video, layout='planar', reuse_buffer=True))
+    assert frames[0][0] is frames[1][0]
+
+
+def test_converter_reads_p010_high_bits():
+    # p010le: Y plane, then interleaved UV plane, 10-bit samples stored in the high bits
+    raw = (Y << 6).tobytes() + (np.stack([U, V], axis=-1) << 6).astype('<u2').tobytes()
+    converter = FrameConverter(WIDTH, HEIGHT, 'p010le', 'pc', layout='planar', normalize=False)
+    assert converter.read(io.BytesIO(raw))
+    y, u, v = converter.convert()
+    assert (y == Y).all() and (u == U).all() and (v == V).all()
+    assert all((codes == plane).all() for codes, plane in zip(converter.code_values(), (Y, U, V)))
+    assert not converter.read(io.BytesIO(raw[:-1]))
+
+
+def test_converter_rgb_frames_are_full_range():
+    rgb = np.full((HEIGHT, WIDTH, 3), 65535, '<u2')
+    converter = FrameConverter(WIDTH, HEIGHT, 'rgb48le', 'tv', layout='rgb')
+    converter.read(io.BytesIO(rgb.tobytes()))
+    assert np.allclose(converter.convert(), 1)
+    with pytest.raises(ValueError):
+        FrameConverter(WIDTH, HEIGHT, 'rgb48le', layout='yuv444')
+
+#-------------------------------------------------**********-------------------------------------------------#
+def test_yuv_reader(tmp_path):
+    # 5 frames whose samples all hold the frame number
+    frame_samples = WIDTH * HEIGHT * 3 // 2
+    path = str(tmp_path / 'frames.yuv')
+    with open(path, 'wb') as f:
+        for i in range(5):
+            f.write(np.full(frame_samples, i, '<u2').tobytes())
+        # truncated last frame, ignored
+        f.write(b'\0' * 10)
+
+    reader = YUVReader(path, WIDTH, HEIGHT)
+    assert len(reader) == 5
+    y, u, v = reader[3]
+    assert y.shape == (HEIGHT, WIDTH) and u.shape == v.shape == (HEIGHT // 2, WIDTH // 2)
+    assert (y == 3).all() and (v == 3).all()
+    assert reader[-1][0][0, 0] == 4
+    y, u, v = reader[1:5:2]
+    assert y.shape == (2, HEIGHT, WIDTH)
+    assert list(y[:, 0, 0]) == [1, 3] and list(v[:, 0, 0]) == [1, 3]
+    assert reader[4:2][0].shape == (0, HEIGHT, WIDTH)
+    y, u, v = reader[[0, 4]]
+    assert list(u[:, 0, 0]) == [0, 4]
+    assert len(list(reader)) == 5
+    with pytest.raises(IndexError):
+        reader[5]
+
+
+def test_yuv_reader_semi_planar(tmp_path):
+    path = str(tmp_path / 'frames.yuv')
+    raw = Y.tobytes() + np.stack([U, V], axis=-1).astype('<u2').tobytes()
+    with open(path, 'wb') as f:
+        f.write(raw * 2)
+    y, u, v = YUVReader(path, WIDTH, HEIGHT, 'p010le')[1]
+    assert (y == Y).all() and (u == U).all() and (v == V).all()
@@ -0,0 +1,133 @@
+import os
+import importlib.util
+
+import pytest
+
+from search_checkpoint import CheckpointJournal
+from id_index import open_index, read_ids
+from result_writers import open_writer
+
+ROOT = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..')
+
+
+def test_record_flush_resume(tmp_path):
+    path = str(tmp_path / 'checkpoint.jsonl')
+    journal = CheckpointJournal(path)
+    journal.record('hdr', 1, 20, 'token1', ['a', 'b'], False)
+    journal.record('hdr', 2, 40, 'token2', ['c'], False)
+    journal.record('4k', 1, 3, None, ['d'], True)
+    assert journal.state('hdr') == {'keyword': 'hdr', 'page': 2, 'count': 40, 'continuationKey': 'token2', 'done': False}
+    journal.flush()
+
+    resumed = CheckpointJournal(path, resume=True)
+    assert resumed.state('hdr') == journal.state('hdr')
+    assert resumed.is_done('4k') and not resumed.is_done('hdr')
+    assert resumed.state('nature') is None
+    assert list(resumed.saved_ids()) == ['a', 'b', 'c', 'd']
+
+
+def test_entries_wait_for_their_rows(tmp_path):
+    path = str(tmp_path / 'checkpoint.jsonl')
+    journal = CheckpointJournal(path)
+    journal.record('hdr', 1, 20, 'token1', ['a'], False, rows=20)
+    journal.record('hdr', 2, 40, 'token2', ['b'], False, rows=40)
+    journal.flush(rows_written=25)
+    # the second page is not on disk yet, resuming starts again from it
+    assert CheckpointJournal(path, resume=True).state('hdr')['page'] == 1
+    journal.flush(rows_written=40)
+    assert CheckpointJournal(path, resume=True).state('hdr')['page'] == 2
+
+
+def test_truncated_last_line(tmp_path):
+    path = str(tmp_path / 'checkpoint.jsonl')
+    journal = CheckpointJournal(path)
+    journal.record('hdr', 1, 20, 'token1', ['a'], False)
+    journal.flush()
+    with open(path, 'a', encoding='utf-8') as f:
+        f.write('{"keyword": "hdr", "page": 2')
+    resumed = CheckpointJournal(path, resume=True)
+    assert resumed.state('hdr')['page'] == 1
+    assert list(resumed.saved_ids()) == ['a']
+    # the cut line is dropped, the next entry is not appended to it
+    resumed.record('hdr', 2, 40, 'token2', ['b'], False)
+    resumed.flush()
+    assert CheckpointJournal(path, resume=True).state('hdr')['page'] == 2
+
+
+def test_without_resume_the_journal_starts_over(tmp_path):
+    path = str(tmp_path / 'checkpoint.jsonl')
+    journal = CheckpointJournal(path)
+    journal.record('hdr', 1, 20, 'token1', ['a'], True)
+    journal.flush()
+    restarted = CheckpointJournal(path)
+    assert restarted.state('hdr') is None
+    assert list(restarted.saved_ids()) == []
+
+#--------------------------------------------------------------*****--------------------------------------------------------------#
+def load_search_script():
+    spec = importlib.util.spec_from_file_location('yt_search_batches', os.path.join(ROOT, 'yt-search_batches.py'))
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+class FakeSearch:
+    """
+    CustomSearch of 20 results per page, the continuation token is the number of the next page.
+    """
+    def __init__(self, query, searchPreferences, limit=20, continuationKey=None, **kwargs):
+        self.query = query
+        self.page = int(continuationKey or 0)
+        self.continuationKey = str(self.page + 1)
+
+    def result(self):
+        return {'result': [{'type': 'video', 'id': '%s-%d-%d' % (self.query, self.page, i), 'title': 'x'} for i in range(20)]}
+
+    def next(self):
+        self.page += 1
+        self.continuationKey = str(self.page + 1)
+
+
+class Crash(Exception):
+    pass
+
+
+def run_search(script, root, resume, rescan, crash_at=None):
+    # the journal crashes on its `crash_at`-th flush: the rows of the page are written, its entry and IDs are not
+    journal = CheckpointJournal(os.path.join(root, 'keywords', 'checkpoint.jsonl'), resume=resume)
+    if crash_at is not None:
+        flush, calls = journal.flush, []
+        def crashing_flush(rows_written=None):
+            calls.append(rows_written)
+            if len(calls) == crash_at:
+                raise Crash()
+            flush(rows_written)
+        journal.flush = crashing_flush
+    id_index = open_index(root, os.path.join(root, 'ids.txt'), rescan=rescan)
+    writer = open_writer(os.path.join(root, 'results.csv'), 'csv', flush_every=1)
+    try:
+        script.search_batch(['hdr'], '', 60, 'HDR', writer, id_index, journal)
+    except Crash:
+        return
+    writer.flush()
+    id_index.flush()
+    journal.flush()
+
+
+@pytest.mark.parametrize('rescan, duplicates', [(True, 0), (False, 20)])
+def test_resume_after_a_crash_between_the_rows_and_the_journal(tmp_path, monkeypatch, rescan, duplicates):
+    script = load_search_script()
+    monkeypatch.setattr(script, 'CustomSearch', FakeSearch)
+    root = str(tmp_path)
+    os.makedirs(os.path.join(root, 'keywords'))
+    run_search(script, root, resume=False, rescan=False, crash_at=2)
+    # the second page is on disk, but neither in the journal nor in the ID file
+    assert len(read_ids(os.path.join(root, 'results.csv'))) == 40
+    assert CheckpointJournal(os.path.join(root, 'keywords', 'checkpoint.jsonl'), resume=True).state('hdr')['page'] == 1
+
+    # resuming searches the second page again, its results are only saved once when the index is rebuilt (rescan)
+    run_search(script, root, resume=True, rescan=rescan)
+    ids = read_ids(os.path.join(root, 'results.csv'))
+    assert set(ids) == {'hdr-%d-%d' % (page, i) for page in range(3) for i in range(20)}
+    assert len(ids) - len(set(ids)) == duplicates
+    assert CheckpointJournal(os.path.join(root, 'keywords', 'checkpoint.jsonl'), resume=True).is_done('hdr')
@@ -0,0 +1,51 @@
+import pickle
+
+from seen_store import SeenStore
+
+
+def test_add_flush_reopen(tmp_path):
+    path = str(tmp_path / 'seen.db')
+    store = SeenStore(path, 'CreativeCommons')
+    store.add(['a', 'b'], keyword='hdr')
+    # pending IDs are already seen
+    assert list(store.contains(['a', 'c'])) == [True, False]
+    assert len(store) == 2
+    store.flush()
+    reopened = SeenStore(path)
+    assert len(reopened) == 2
+    assert 'b' in reopened and 'c' not in reopened
+    row = reopened._connect().execute("SELECT keyword, filter FROM searched WHERE id = 'a'").fetchone()
+    assert row == ('hdr', 'CreativeCommons')
+
+
+def test_shared_store_counts_ids_once(tmp_path):
+    path = str(tmp_path / 'seen.db')
+    first, second = SeenStore(path), SeenStore(path)
+    first.add(['a', 'b'])
+    second.add(['b', 'c'])
+    second.flush()
+    assert second.contains(['a', 'b', 'c']).tolist() == [False, True, True]
+    assert first.contains(['a', 'b', 'c']).tolist() == [True, True, True]
+    # 'b' is pending in the first store and saved by the second one
+    assert len(first) == 3
+    first.flush()
+    assert len(first) == len(second) == 3
+
+
+def test_downloaded(tmp_path):
+    path = str(tmp_path / 'seen.db')
+    store = SeenStore(path)
+    store.mark_downloaded('a', '/videos/a_10.mp4')
+    store.mark_downloaded('a', '/videos/a_10.webm')
+    assert SeenStore(path).downloaded(['a', 'b']) == {'a'}
+    assert store._connect().execute("SELECT path FROM downloaded").fetchall() == [('/videos/a_10.webm',)]
+
+
+def test_pickled_store_opens_its_own_connection(tmp_path):
+    store = SeenStore(str(tmp_path / 'seen.db'), 'CreativeCommons')
+    store.add(['a'])
+    copy = pickle.loads(pickle.dumps(store))
+    assert copy.filter_criterion == 'CreativeCommons'
+    assert copy._conn is not store._conn
+    # pending IDs are not sent to the workers
+    assert len(copy) == 0
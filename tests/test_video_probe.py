@@ -0,0 +1,130 @@
+import os
+import json
+import subprocess
+from types import SimpleNamespace
+
+import pytest
+
+import video_probe
+from video_probe import ProbeCache, ProbeResult, probe, run_ffprobe, file_identity, _bit_depth
+
+FFPROBE_OUTPUT = {
+    'streams': [{
+        'codec_name': 'vp9', 'width': 3840, 'height': 2160, 'pix_fmt': 'yuv420p10le', 'color_range': 'tv',
+        'color_space': 'bt2020nc', 'color_transfer': 'smpte2084', 'color_primaries': 'bt2020',
+        'avg_frame_rate': '30000/1001', 'r_frame_rate': '30000/1001',
+    }],
+    'format': {'duration': '10.010000'},
+    'frames': [{'side_data_list': [
+        {'side_data_type': 'Mastering display metadata', 'max_luminance': '10000000/10000', 'min_luminance': '50/10000'},
+        {'side_data_type': 'Content light level metadata', 'max_content': 1000, 'max_average': 400},
+    ]}],
+}
+
+
+@pytest.mark.parametrize('stream, bit_depth', [
+    ({'bits_per_raw_sample': '10', 'pix_fmt': 'yuv420p'}, 10),
+    ({'pix_fmt': 'yuv420p10le'}, 10),
+    ({'pix_fmt': 'p010le'}, 10),
+    ({'pix_fmt': 'rgb48be'}, 16),
+    # not in the registry: depth before the endianness suffix
+    ({'pix_fmt': 'gray12le'}, 12),
+    ({'pix_fmt': 'yuva444p16be'}, 16),
+    ({'pix_fmt': 'yuv420p'}, 8),
+    ({'pix_fmt': 'nv12'}, 8),
+    ({}, 8),
+])
+def test_bit_depth(stream, bit_depth):
+    assert _bit_depth(stream) == bit_depth
+
+
+@pytest.fixture
+def ffprobe(monkeypatch):
+    # canned ffprobe runs, the probed paths are recorded
+    calls = []
+
+    def run(cmd, **kwargs):
+        calls.append(cmd[-1])
+        return SimpleNamespace(stdout=json.dumps(FFPROBE_OUTPUT), stderr='')
+    monkeypatch.setattr(subprocess, 'run', run)
+    monkeypatch.setattr(video_probe, '_memo', {})
+    return calls
+
+
+@pytest.fixture
+def video(tmp_path):
+    path = tmp_path / 'video.webm'
+    path.write_bytes(b'0' * 100)
+    return str(path)
+
+
+def test_run_ffprobe(ffprobe, video):
+    info = run_ffprobe(video)
+    assert (info.width, info.height, info.pix_fmt, info.bit_depth) == (3840, 2160, 'yuv420p10le', 10)
+    assert (info.color_range, info.color_transfer) == ('tv', 'smpte2084') and info.is_hdr
+    # webm: the frame count is estimated from the duration
+    assert info.duration == pytest.approx(10.01) and info.fps == pytest.approx(30000 / 1001)
+    assert info.frame_count == 300
+    assert info.mastering_display == {'max_luminance': '10000000/10000', 'min_luminance': '50/10000'}
+    assert (info.max_cll, info.max_fall) == (1000, 400)
+    assert (info.mtime, info.size) == file_identity(video)[1:]
+
+
+def test_run_ffprobe_unreadable(monkeypatch, video):
+    monkeypatch.setattr(subprocess, 'run', lambda cmd, **kwargs: SimpleNamespace(stdout='', stderr='Invalid data found'))
+    with pytest.raises(ValueError, match='Invalid data found'):
+        run_ffprobe(video)
+    monkeypatch.setattr(subprocess, 'run', lambda cmd, **kwargs: SimpleNamespace(stdout='{"streams": []}', stderr=''))
+    with pytest.raises(ValueError):
+        run_ffprobe(video)
+
+
+def test_memo_is_invalidated_by_mtime_and_size(ffprobe, video):
+    info = probe(video)
+    assert probe(video) is info
+    assert len(ffprobe) == 1
+    # same size, new mtime
+    os.utime(video, (0, 0))
+    probe(video)
+    assert len(ffprobe) == 2
+    # new size
+    with open(video, 'ab') as f:
+        f.write(b'0')
+    os.utime(video, (0, 0))
+    assert probe(video).size == 101
+    assert len(ffprobe) == 3
+    with pytest.raises(FileNotFoundError):
+        probe(video + '.missing')
+
+
+def test_cache_is_shared_between_runs(ffprobe, video, tmp_path):
+    cache_path = str(tmp_path / 'probe.jsonl')
+    info = probe(video, cache=ProbeCache(cache_path))
+    # a new process: empty memo, the cache file is read back
+    video_probe._memo.clear()
+    cached = probe(video, cache=ProbeCache(cache_path))
+    assert len(ffprobe) == 1
+    assert cached.to_dict() == info.to_dict()
+
+    video_probe._memo.clear()
+    os.utime(video, (0, 0))
+    cache = ProbeCache(cache_path)
+    assert cache.get(file_identity(video)) is None
+    probe(video, cache=cache)
+    assert len(ffprobe) == 2
+    # the last entry of a file wins
+    assert ProbeCache(cache_path).get(file_identity(video)).mtime == 0
+
+
+def test_cache_truncated_last_line(tmp_path, video):
+    cache_path = str(tmp_path / 'probe.jsonl')
+    info = ProbeResult(path=video, mtime=1.0, size=100, width=16, height=8)
+    ProbeCache(cache_path).add(info)
+    with open(cache_path, 'a', encoding='utf-8') as f:
+        f.write('{"path": "other.mp4", "mti')
+    cache = ProbeCache(cache_path)
+    assert cache.get((os.path.abspath(video), 1.0, 100)).width == 16
+    assert cache.get((os.path.abspath(video), 2.0, 100)) is None
+    # the cut line is dropped, the next entry is not appended to it
+    cache.add(ProbeResult(path=video, mtime=2.0, size=100, width=32, height=8))
+    assert ProbeCache(cache_path).get((os.path.abspath(video), 2.0, 100)).width == 32
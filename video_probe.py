@@ -0,0 +1,231 @@
+"""
+Probe service of the HDR scripts (check_hdr.py, read_hdr_10bit.py): one ffprobe per video for all their metadata.
+
+Results are memoized in-process, and optionally kept in a persistent sidecar cache (JSONL) shared between runs.
+Both are keyed by the identity of the file (path, mtime and size), a modified video is probed again.
+
+    info = probe('video.mp4')                                 # ffprobe
+    info = probe('video.mp4')                                 # memo, no ffprobe
+    info.width, info.height, info.pix_fmt, info.color_transfer, info.is_hdr
+    info = probe('video.mp4', cache=ProbeCache('probe.jsonl'))
+"""
+import os
+import re
+import json
+import subprocess
+import threading
+
+from pixel_formats import PIXEL_FORMATS, get_pixel_format
+
+#-------------------------------------------------**********-------------------------------------------------#
+class ProbeResult:
+    """
+    Metadata of the first video stream of a file.
+
+    Parameters:
+    - path: str, path to the video file
+    - mtime, size: identity of the probed file
+    - codec: str, codec name
+    - width, height: int, frame size
+    - pix_fmt: str, ffmpeg pixel format
+    - bit_depth: int, bits per sample
+    - color_range: str, 'tv', 'pc' or None
+    - color_space, color_transfer, color_primaries: str or None, e.g. 'bt2020nc', 'smpte2084', 'bt2020'
+    - frame_count: int, number of frames (container count, or estimated from the duration), None if unknown
+    - duration: float, seconds, None if unknown
+    - fps: float, average frame rate, None if unknown
+    - mastering_display: dict, HDR10 mastering display metadata (primaries and luminance) or None
+    - max_cll, max_fall: int, content light level metadata or None
+    """
+    FIELDS = ['path', 'mtime', 'size', 'codec', 'width', 'height', 'pix_fmt', 'bit_depth', 'color_range', 'color_space',
+              'color_transfer', 'color_primaries', 'frame_count', 'duration', 'fps', 'mastering_display', 'max_cll', 'max_fall']
+    __slots__ = FIELDS
+
+    def __init__(self, **fields):
+        for name in self.FIELDS:
+            setattr(self, name, fields.get(name))
+
+    def __repr__(self):
+        return f"ProbeResult({self.path}, {self.width}x{self.height}, {self.pix_fmt}, {self.color_transfer})"
+
+    @property
+    def is_hdr(self):
+        # Checking some common HDR indicators in the metadata
+        # This can be extended based on more specific requirements
+        return self.color_transfer in ['smpte2084', 'arib-std-b67'] or \
+               self.color_space in ['bt2020nc', 'bt2020c'] or \
+               self.bit_depth > 8
+
+    def to_dict(self):
+        return {name: getattr(self, name) for name in self.FIELDS}
+
+    @classmethod
+    def from_dict(cls, d):
+        return cls(**d)
+
+
+def file_identity(video_path):
+    """
+    (absolute path, mtime, size) of the file, raises FileNotFoundError.
+    """
+    stat = os.stat(video_path)
+    return os.path.abspath(video_path), stat.st_mtime, stat.st_size
+
+
+def _bit_depth(stream):
+    # bits_per_raw_sample, or the depth of the pixel format: from the registry (pixel_formats.py), else the depth
+    # before the endianness suffix of the name (gray10le, yuva444p16be, ...); formats without it are 8-bit
+    if 'bits_per_raw_sample' in stream:
+        return int(stream['bits_per_raw_sample'])
+    pix_fmt = stream.get('pix_fmt') or ''
+    if pix_fmt in PIXEL_FORMATS:
+        return get_pixel_format(pix_fmt).bit_depth
+    match = re.search(r'(\d+)[lb]e$', pix_fmt)
+    return int(match.group(1)) if match else 8
+
+
+def _rate(rate):
+    # ffprobe rates are fractions, '0/0' when unknown
+    num, _, den = (rate or '0/0').partition('/')
+    return float(num) / float(den) if den and float(den) else None
+
+
+def _number(value, cast=float):
+    return cast(value) if value not in (None, 'N/A') else None
+
+
+def run_ffprobe(video_path):
+    """
+    Run ffprobe once: first video stream, container format and the side data of the first frame (HDR10 mastering
+    display and content light level metadata are often only in the frames).
+
+    Returns:
+    - ProbeResult, raises ValueError if the file has no video stream or cannot be read
+    """
+    cmd = [
+        'ffprobe',
+        '-v', 'error',
+        '-select_streams', 'v:0',
+        '-show_streams',
+        '-show_format',
+        '-show_frames',
+        '-read_intervals', '%+#1',
+        '-print_format', 'json',
+        video_path
+    ]
+    result = subprocess.run(cmd, stdout=subprocess.PIPE, stderr=subprocess.PIPE, universal_newlines=True)
+    try:
+        ffprobe_output = json.loads(result.stdout)
+        stream = ffprobe_output['streams'][0]
+    except (json.JSONDecodeError, KeyError, IndexError):
+        raise ValueError(f"Could not probe {video_path}: {result.stderr.strip()}")
+
+    frames = ffprobe_output.get('frames', [])
+    side_data = stream.get('side_data_list', []) + (frames[0].get('side_data_list', []) if frames else [])
+    mastering = next((d for d in side_data if d.get('side_data_type') == 'Mastering display metadata'), None)
+    light_level = next((d for d in side_data if d.get('side_data_type') == 'Content light level metadata'), None)
+
+    duration = _number(stream.get('duration')) or _number(ffprobe_output.get('format', {}).get('duration'))
+    fps = _rate(stream.get('avg_frame_rate')) or _rate(stream.get('r_frame_rate'))
+    frame_count = _number(stream.get('nb_frames'), int)
+    if frame_count is None and duration and fps:
+        # webm/mkv do not store the frame count
+        frame_count = int(round(duration * fps))
+
+    _, mtime, size = file_identity(video_path)
+    return ProbeResult(
+        path=video_path,
+        mtime=mtime,
+        size=size,
+        codec=stream.get('codec_name'),
+        width=int(stream['width']),
+        height=int(stream['height']),
+        pix_fmt=stream.get('pix_fmt'),
+        bit_depth=_bit_depth(stream),
+        color_range=stream.get('color_range'),
+        color_space=stream.get('color_space'),
+        color_transfer=stream.get('color_transfer'),
+        color_primaries=stream.get('color_primaries'),
+        frame_count=frame_count,
+        duration=duration,
+        fps=fps,
+        mastering_display={k: v for k, v in mastering.items() if k != 'side_data_type'} if mastering else None,
+        max_cll=light_level.get('max_content') if light_level else None,
+        max_fall=light_level.get('max_average') if light_level else None,
+    )
+
+#-------------------------------------------------**********-------------------------------------------------#
+class ProbeCache:
+    """
+    Persistent sidecar cache of the probe results, append-only JSONL file where the last entry of a file wins.
+    An entry is valid while the mtime and size of the file are unchanged.
+
+    Parameters:
+    - path: str, cache file, created if it does not exist
+    """
+    def __init__(self, path):
+        self.path = path
+        self.entries = {}
+        self._lock = threading.Lock()
+        if os.path.exists(path):
+            end = 0
+            with open(path, 'rb') as f:
+                for line in f:
+                    if not line.endswith(b'\n'):
+                        # last line cut by a crash
+                        break
+                    end += len(line)
+                    try:
+                        entry = json.loads(line)
+                    except json.JSONDecodeError:
+                        continue
+                    self.entries[os.path.abspath(entry['path'])] = entry
+            if end < os.path.getsize(path):
+                # drop the cut line, so that the next entry starts on a line of its own
+                with open(path, 'r+b') as f:
+                    f.truncate(end)
+
+    def get(self, identity):
+        """
+        ProbeResult of the file identity (see file_identity), or None if it was never probed or changed since.
+        """
+        path, mtime, size = identity
+        entry = self.entries.get(path)
+        if entry is None or entry['mtime'] != mtime or entry['size'] != size:
+            return None
+        return ProbeResult.from_dict(entry)
+
+    def add(self, info):
+        entry = info.to_dict()
+        with self._lock:
+            self.entries[os.path.abspath(info.path)] = entry
+            with open(self.path, 'a', encoding='utf-8') as f:
+                f.write(json.dumps(entry) + '\n')
+
+
+_memo = {}
+_memo_lock = threading.Lock()
+
+def probe(video_path, cache=None):
+    """
+    Metadata of a video, ffprobe only runs for files not probed yet (or modified since).
+
+    Parameters:
+    - video_path: str, path to the video file
+    - cache: ProbeCache, optional persistent cache, read before and updated after ffprobe
+
+    Returns:
+    - ProbeResult, raises ValueError if the file cannot be probed
+    """
+    identity = file_identity(video_path)
+    with _memo_lock:
+        info = _memo.get(identity)
+    if info is None and cache is not None:
+        info = cache.get(identity)
+    if info is None:
+        info = run_ffprobe(video_path)
+        if cache is not None:
+            cache.add(info)
+    with _memo_lock:
+        _memo[identity] = info
+    return info
@@ -61,5 +61,7 @@ async def main():
         index += 1
         print(f'{index} - {video["title"]}')
 
+    await clientPool.aclose()
+
 
 asyncio.run(main())
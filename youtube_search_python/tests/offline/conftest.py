@@ -0,0 +1,24 @@
+'''
+Offline tests of the library (no network): requests are answered by a mock transport, parsing is tested on
+synthetic renderers.
+
+    python -m pytest youtube_search_python/tests/offline
+'''
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..'))
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+from renderers import makeVideoRenderer, makeCommentRenderer
+
+
+@pytest.fixture
+def videoRenderer() -> dict:
+    return makeVideoRenderer(7)
+
+
+@pytest.fixture
+def commentRenderer() -> dict:
+    return makeCommentRenderer()
@@ -0,0 +1,51 @@
+'''
+Synthetic renderers and search responses of the offline tests.
+'''
+import json
+
+
+def makeVideoRenderer(i: int = 0) -> dict:
+    videoId = 'vid%08d' % i
+    return {
+        'videoId': videoId,
+        'thumbnail': {'thumbnails': [{'url': f'https://i.ytimg.com/vi/{videoId}/hq720.jpg', 'width': 360, 'height': 202},
+                                     {'url': f'https://i.ytimg.com/vi/{videoId}/hq720_2.jpg', 'width': 720, 'height': 404}]},
+        'title': {'runs': [{'text': f'Video {i}'}], 'accessibility': {'accessibilityData': {'label': f'Video {i} by Channel 2 minutes'}}},
+        'publishedTimeText': {'simpleText': '2 years ago'},
+        'lengthText': {'accessibility': {'accessibilityData': {'label': '2 minutes, 7 seconds'}}, 'simpleText': '2:07'},
+        'viewCountText': {'simpleText': '{:,} views'.format(i * 1000)},
+        'shortViewCountText': {'simpleText': f'{i}K views'},
+        'ownerText': {'runs': [{'text': 'Channel', 'navigationEndpoint': {'browseEndpoint': {'browseId': 'UC%d' % i}}}]},
+        'richThumbnail': {'movingThumbnailRenderer': {'movingThumbnailDetails': {'thumbnails': [{'url': 'https://i.ytimg.com/an_webp/x.webp', 'width': 320, 'height': 180}]}}},
+        'detailedMetadataSnippets': [{'snippetText': {'runs': [{'text': 'Description '}, {'text': 'of the video', 'bold': True}]}}],
+        'channelThumbnailSupportedRenderers': {'channelThumbnailWithLinkRenderer': {'thumbnail': {'thumbnails': [{'url': 'https://yt3.ggpht.com/c', 'width': 68, 'height': 68}]}}},
+    }
+
+
+def makeCommentRenderer() -> dict:
+    return {
+        'commentId': 'comment0',
+        'authorText': {'simpleText': 'Author'},
+        'authorThumbnail': {'thumbnails': [{'url': 'https://yt3.ggpht.com/a', 'width': 48, 'height': 48}]},
+        'authorEndpoint': {'browseEndpoint': {'browseId': 'UCauthor'}},
+        'contentText': {'runs': [{'text': 'Nice video'}]},
+        'publishedTimeText': {'runs': [{'text': '1 day ago'}]},
+        'isLiked': False,
+        'authorIsChannelOwner': False,
+        'voteStatus': 'INDIFFERENT',
+        'voteCount': {'simpleText': '1.2K', 'accessibility': {'accessibilityData': {'label': '1,200 likes'}}},
+        'replyCount': 3,
+    }
+
+
+def makeSearchResponse(n: int = 20, token: str = 'next', overhead: bool = True) -> bytes:
+    items = [{'videoRenderer': makeVideoRenderer(i)} for i in range(n)]
+    contents = [{'itemSectionRenderer': {'contents': items}}]
+    if token:
+        contents.append({'continuationItemRenderer': {'continuationEndpoint': {'continuationCommand': {'token': token}}}})
+    response = {'contents': {'twoColumnSearchResultsRenderer': {'primaryContents': {'sectionListRenderer': {'contents': contents}}}}}
+    if overhead:
+        # subtrees decoded by the full parse only, placed before the contents as in real responses
+        response = dict({'responseContext': {'serviceTrackingParams': [{'service': 'GFEEDBACK'}]}, 'estimatedResults': '1000',
+                         'refinements': ['hdr', '4k']}, **response)
+    return json.dumps(response).encode('utf-8')
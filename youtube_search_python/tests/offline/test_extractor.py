@@ -0,0 +1,126 @@
+import pytest
+
+from youtubesearchpython.core.extractor import (compilePath, getValue, videoSchema, channelSchema, playlistSchema,
+                                                shelfSchema, commentSchema, playlistVideoSchema, extractVideo,
+                                                extractChannel, extractPlaylist, extractShelf, extractComment,
+                                                extractPlaylistVideo)
+from youtubesearchpython.handlers.componenthandler import ComponentHandler
+from youtubesearchpython.legacy import LegacyComponentHandler
+
+
+def walkValue(source, path, default=None):
+    # the interpretive getValue walk replaced by the compiled extractors
+    value = source
+    for key in path:
+        if type(key) is str:
+            if key in value.keys():
+                value = value[key]
+            else:
+                return default
+        elif type(key) is int:
+            if len(value) != 0:
+                value = value[key]
+            else:
+                return default
+    return value
+
+
+def walkComponent(schema, source):
+    if isinstance(schema, dict):
+        return {key: walkComponent(value, source) for key, value in schema.items()}
+    if isinstance(schema, list):
+        return walkValue(source, schema)
+    return schema
+
+
+SOURCES = [
+    {'a': {'b': [{'c': 'value'}]}},
+    {'a': {'b': []}},
+    {'a': {}},
+    {},
+    {'a': {'b': [{'c': None}]}},
+    {'a': {'b': [{'c': 0}]}},
+    {'a': {'b': [{'c': ''}]}},
+    {'a': {'b': [{'c': []}]}},
+]
+
+
+@pytest.mark.parametrize('source', SOURCES)
+def test_getValue_matches_walk(source):
+    path = ['a', 'b', 0, 'c']
+    assert getValue(source, path) == walkValue(source, path)
+    assert compilePath(path)(source) == walkValue(source, path)
+
+
+@pytest.mark.parametrize('source', SOURCES)
+def test_default_only_replaces_missing_values(source):
+    path = ['a', 'b', 0, 'c']
+    assert compilePath(path, 'LIVE')(source) == walkValue(source, path, 'LIVE')
+
+
+def test_present_null_is_not_replaced_by_default():
+    assert compilePath(['a', 'b'], 'LIVE')({'a': {'b': None}}) is None
+    assert compilePath(['a', 'b'], 'LIVE')({'a': {}}) == 'LIVE'
+
+
+def test_index_out_of_range_raises():
+    # a non-empty list shorter than the index raises, as with the walk
+    source = {'a': [{'c': 1}]}
+    with pytest.raises(IndexError):
+        walkValue(source, ['a', 1, 'c'])
+    with pytest.raises(IndexError):
+        getValue(source, ['a', 1, 'c'])
+    with pytest.raises(IndexError):
+        compilePath(['a', 1, 'c'], 'LIVE')(source)
+
+
+def test_null_inside_path_gives_none():
+    # the walk raised on a null value in the middle of a path, the extractors give None (or the default)
+    assert getValue({'a': None}, ['a', 'b']) is None
+    assert getValue({'a': None}, ['a', 0]) is None
+    assert compilePath(['a', 'b'], 'LIVE')({'a': None}) is None
+
+
+def test_path_is_compiled_once():
+    assert compilePath(['a', 'b']) is compilePath(['a', 'b'])
+    assert compilePath(['a', 'b'], 'LIVE') is not compilePath(['a', 'b'])
+
+
+SCHEMAS = [
+    (videoSchema, extractVideo),
+    (channelSchema, extractChannel),
+    (playlistSchema, extractPlaylist),
+    (shelfSchema, extractShelf),
+    (commentSchema, extractComment),
+    (playlistVideoSchema, extractPlaylistVideo),
+]
+
+
+@pytest.mark.parametrize('schema, extract', SCHEMAS)
+def test_schema_matches_walk(schema, extract, videoRenderer, commentRenderer):
+    sparse = {'videoId': 'x', 'title': {'runs': []}, 'thumbnail': {'thumbnails': []}, 'ownerText': {'runs': []},
+              'detailedMetadataSnippets': [], 'voteCount': {}}
+    for renderer in [videoRenderer, commentRenderer, sparse, {}]:
+        assert extract(renderer) == walkComponent(schema, renderer)
+
+
+def test_video_component(videoRenderer):
+    component = ComponentHandler()._getVideoComponent({'videoRenderer': videoRenderer}, 'Shelf')
+    expected = walkComponent(videoSchema, videoRenderer)
+    expected['link'] = 'https://www.youtube.com/watch?v=vid00000007'
+    expected['channel']['link'] = 'https://www.youtube.com/channel/UC7'
+    expected['shelfTitle'] = 'Shelf'
+    assert component == expected
+
+
+def test_legacy_component(videoRenderer):
+    handler = LegacyComponentHandler()
+    handler.index = 0
+    del videoRenderer['publishedTimeText']
+    videoRenderer['lengthText'] = None
+    component = handler._getVideoComponent({'videoRenderer': videoRenderer})
+    assert component['title'] == 'Video 7'
+    assert component['views'] == 7000
+    # a missing value is 'LIVE', a null value stays None
+    assert component['publishTime'] == 'LIVE'
+    assert component['duration'] is None
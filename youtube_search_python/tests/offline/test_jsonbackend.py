@@ -0,0 +1,43 @@
+import pytest
+
+from youtubesearchpython.core import jsonbackend
+from youtubesearchpython.core.jsonbackend import setJsonBackend, getJsonBackend, loads
+from renderers import makeSearchResponse
+
+
+@pytest.fixture
+def restoreBackend():
+    backend = getJsonBackend()
+    yield
+    setJsonBackend(backend)
+
+
+@pytest.mark.parametrize('backend', ['orjson', 'msgspec', 'json'])
+def test_backends_decode_equal_objects(backend, restoreBackend):
+    pytest.importorskip(backend)
+    response = makeSearchResponse(5)
+    text = '{"title": "caf\\u00e9 \\ud83c\\udfa5", "views": 12345678901234, "ratio": 0.5, "live": false, "badges": null}'
+    setJsonBackend('json')
+    expected = loads(response), loads(text), loads(text.encode('utf-8'))
+    setJsonBackend(backend)
+    assert getJsonBackend() == backend
+    assert (loads(response), loads(text), loads(text.encode('utf-8'))) == expected
+
+
+def test_auto_picks_the_fastest_installed(restoreBackend):
+    setJsonBackend('auto')
+    installed = [name for name in ['orjson', 'msgspec'] if getattr(jsonbackend, 'is%sInstalled' % name.capitalize())]
+    assert getJsonBackend() == (installed[0] if installed else 'json')
+
+
+def test_unknown_backend_is_rejected(restoreBackend):
+    backend = getJsonBackend()
+    with pytest.raises(Exception, match='Unknown JSON backend'):
+        setJsonBackend('ujson')
+    assert getJsonBackend() == backend
+
+
+def test_missing_backend_is_rejected(restoreBackend, monkeypatch):
+    monkeypatch.delitem(jsonbackend._decoders, 'orjson', raising=False)
+    with pytest.raises(Exception, match='not installed'):
+        setJsonBackend('orjson')
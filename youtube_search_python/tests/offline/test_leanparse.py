@@ -0,0 +1,86 @@
+import json
+
+import pytest
+
+from youtubesearchpython.core.constants import contentAnchor
+from youtubesearchpython.core.leanparse import selectValue
+from youtubesearchpython.handlers import requesthandler
+from youtubesearchpython.handlers.requesthandler import RequestHandler
+from renderers import makeSearchResponse
+
+
+class Page(RequestHandler):
+    def __init__(self, response, lean, continuationKey=None):
+        self.response = response
+        self.lean = lean
+        self.responseSource = None
+        self.continuationKey = continuationKey
+
+
+def parse(response, lean, continuationKey=None):
+    page = Page(response, lean, continuationKey)
+    page._parseSource()
+    return page.responseSource, page.continuationKey
+
+
+def test_selectValue_decodes_the_anchored_value():
+    response = makeSearchResponse(3)
+    expected = json.loads(response)['contents']['twoColumnSearchResultsRenderer']['primaryContents']['sectionListRenderer']['contents']
+    assert selectValue(response, contentAnchor) == expected
+    assert selectValue(response.decode('utf-8'), contentAnchor) == expected
+
+
+def test_selectValue_allows_whitespace():
+    response = json.dumps(json.loads(makeSearchResponse(2)), indent=2)
+    assert selectValue(response, contentAnchor) == selectValue(makeSearchResponse(2), contentAnchor)
+
+
+@pytest.mark.parametrize('response', [
+    b'{"contents": {}}',
+    # the anchor keys must each be the first key of their parent
+    b'{"primaryContents": {"other": 1, "sectionListRenderer": {"contents": []}}}',
+    # not followed by a valid JSON value
+    b'{"primaryContents": {"sectionListRenderer": {"contents": [{"a": ',
+])
+def test_selectValue_not_found(response):
+    assert selectValue(response, contentAnchor) is None
+
+
+def test_lean_parse_matches_full():
+    response = makeSearchResponse(20, token='page2')
+    source, continuationKey = parse(response, True)
+    assert (source, continuationKey) == parse(response, False)
+    assert len(source) == 20
+    assert continuationKey == 'page2'
+
+
+def test_lean_parse_continuation():
+    items = [{'itemSectionRenderer': {'contents': [{'videoRenderer': {'videoId': 'a'}}]}},
+             {'continuationItemRenderer': {'continuationEndpoint': {'continuationCommand': {'token': 'page3'}}}}]
+    response = json.dumps({'responseContext': {}, 'onResponseReceivedCommands': [{'appendContinuationItemsAction': {'continuationItems': items}}]}).encode('utf-8')
+    assert parse(response, True, 'page2') == parse(response, False, 'page2') == ([{'videoRenderer': {'videoId': 'a'}}], 'page3')
+
+
+def test_lean_parse_falls_back_to_full_decode():
+    # anchor not found in lean mode: the response is decoded in full
+    contents = [{'itemSectionRenderer': {'contents': [{'videoRenderer': {'videoId': 'a'}}]}}]
+    response = json.dumps({'contents': {'twoColumnSearchResultsRenderer': {'primaryContents': {
+        'targetId': 'search', 'sectionListRenderer': {'trackingParams': 'x', 'contents': contents}}}}}).encode('utf-8')
+    assert parse(response, True) == parse(response, False) == ([{'videoRenderer': {'videoId': 'a'}}], None)
+
+
+def test_lean_parse_rich_grid():
+    contents = [{'richItemRenderer': {'content': {'videoRenderer': {'videoId': 'a'}}}},
+                {'continuationItemRenderer': {'continuationEndpoint': {'continuationCommand': {'token': 'page2'}}}}]
+    response = json.dumps({'contents': {'twoColumnSearchResultsRenderer': {'primaryContents': {'richGridRenderer': {'contents': contents}}}}}).encode('utf-8')
+    assert parse(response, True) == parse(response, False) == (contents, 'page2')
+
+
+def test_lean_parse_scans_the_response_once(monkeypatch):
+    # the rich grid response is decoded after the first anchor is missed, the fallback reuses the decoded tree
+    scans = []
+    monkeypatch.setattr(requesthandler, 'selectValue', lambda response, anchor: scans.append(anchor) or selectValue(response, anchor))
+    contents = [{'richItemRenderer': {'content': {'videoRenderer': {'videoId': 'a'}}}}]
+    response = json.dumps({'contents': {'twoColumnSearchResultsRenderer': {'primaryContents': {'richGridRenderer': {'contents': contents}}}}}).encode('utf-8')
+    parse(response, True)
+    assert scans == [contentAnchor]
@@ -0,0 +1,59 @@
+import pytest
+
+from youtubesearchpython.core.extractor import compileProjection, checkFields, fieldSchemas
+from youtubesearchpython.handlers.componenthandler import ComponentHandler
+
+
+def flatten(component, prefix=''):
+    flat = {}
+    for key, value in component.items():
+        if isinstance(value, dict) and key not in ('richThumbnail',):
+            flat.update(flatten(value, prefix + key + '.'))
+        else:
+            flat[prefix + key] = value
+    return flat
+
+
+def projected(fields, element, shelfTitle=None):
+    handler = ComponentHandler()
+    handler.fields = tuple(fields)
+    return handler._getVideoComponent(element, shelfTitle)
+
+
+def test_projection_matches_full_component(videoRenderer):
+    element = {'videoRenderer': videoRenderer}
+    full = flatten(ComponentHandler()._getVideoComponent(element, 'Shelf'))
+    fields = list(fieldSchemas['video'])
+    assert projected(fields, element, 'Shelf') == {field: full[field] for field in fields}
+
+
+def test_projection_is_flat_and_ordered(videoRenderer):
+    component = projected(['link', 'id', 'channel.id', 'duration'], {'videoRenderer': videoRenderer})
+    assert component == {'link': 'https://www.youtube.com/watch?v=vid00000007', 'id': 'vid00000007', 'channel.id': 'UC7', 'duration': '2:07'}
+    assert list(component) == ['link', 'id', 'channel.id', 'duration']
+
+
+def test_projection_missing_values():
+    component = compileProjection('video', ('id', 'title', 'link', 'channel.link'))({'title': {'runs': []}})
+    assert component == {'id': None, 'title': None, 'link': None, 'channel.link': None}
+
+
+def test_fields_of_other_kinds_are_none(videoRenderer):
+    assert projected(['id', 'subscribers'], {'videoRenderer': videoRenderer}) == {'id': 'vid00000007', 'subscribers': None}
+
+
+def test_channel_and_playlist_projection():
+    handler = ComponentHandler()
+    handler.fields = ('id', 'link')
+    assert handler._getChannelComponent({'channelRenderer': {'channelId': 'UC1'}}) == {'id': 'UC1', 'link': 'https://www.youtube.com/channel/UC1'}
+    assert handler._getPlaylistComponent({'playlistRenderer': {'playlistId': 'PL1'}}) == {'id': 'PL1', 'link': 'https://www.youtube.com/playlist?list=PL1'}
+
+
+def test_projection_is_compiled_once():
+    assert compileProjection('video', ('id', 'title')) is compileProjection('video', ('id', 'title'))
+
+
+def test_unknown_fields():
+    checkFields(['id', 'channel.id', 'subscribers'])
+    with pytest.raises(Exception, match='Unknown fields'):
+        checkFields(['id', 'viewcount'])
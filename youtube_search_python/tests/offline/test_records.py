@@ -0,0 +1,75 @@
+import json
+
+import pytest
+
+from youtubesearchpython.core.extractor import extractComment
+from youtubesearchpython.core.records import VideoRecord, extractCommentRecord, toDict
+from youtubesearchpython.handlers.componenthandler import ComponentHandler
+
+
+def components(element, method, *args):
+    handler = ComponentHandler()
+    full = getattr(handler, method)(element, *args)
+    handler.records = True
+    return full, getattr(handler, method)(element, *args)
+
+
+@pytest.mark.parametrize('renderer', ['full', 'sparse'])
+def test_video_record_matches_component(videoRenderer, renderer):
+    if renderer == 'sparse':
+        # the dict component needs the video and channel ids for its links
+        videoRenderer = {'videoId': 'x', 'title': {'runs': []}, 'thumbnail': {'thumbnails': []},
+                         'ownerText': {'runs': [{'navigationEndpoint': {'browseEndpoint': {'browseId': 'UC1'}}}]}}
+    full, record = components({'videoRenderer': videoRenderer}, '_getVideoComponent', 'Shelf')
+    assert isinstance(record, VideoRecord)
+    assert record.to_dict() == full
+    assert record.to_json() == json.dumps(full)
+
+
+def test_channel_and_playlist_records_match_components():
+    channel = {'channelId': 'UC1', 'title': {'simpleText': 'Channel'}, 'thumbnail': {'thumbnails': [{'url': '//yt3', 'width': 88, 'height': 88}]},
+               'descriptionSnippet': {'runs': [{'text': 'About'}]}, 'subscriberCountText': {'simpleText': '1K subscribers'}}
+    full, record = components({'channelRenderer': channel}, '_getChannelComponent')
+    assert record.to_dict() == full
+    playlist = {'playlistId': 'PL1', 'title': {'simpleText': 'Playlist'}, 'videoCount': '12',
+                'shortBylineText': {'runs': [{'text': 'Channel', 'navigationEndpoint': {'browseEndpoint': {'browseId': 'UC1'}}}]},
+                'thumbnails': [{'thumbnails': [{'url': 'https://i.ytimg.com/p', 'width': 480, 'height': 270}]}]}
+    full, record = components({'playlistRenderer': playlist}, '_getPlaylistComponent')
+    assert record.to_dict() == full
+
+
+def test_comment_record_matches_component(commentRenderer):
+    assert extractCommentRecord(commentRenderer).to_dict() == extractComment(commentRenderer)
+
+
+def test_thumbnails_and_runs_are_packed(videoRenderer):
+    record = ComponentHandler()
+    record.records = True
+    record = record._getVideoComponent({'videoRenderer': videoRenderer})
+    assert record.thumbnails[0] == ('https://i.ytimg.com/vi/vid00000007/hq720.jpg', 360, 202)
+    # runs with formatting are kept as they are
+    assert record.descriptionSnippet == [{'text': 'Description '}, {'text': 'of the video', 'bold': True}]
+    assert not hasattr(record, '__dict__')
+
+
+def test_unpackable_thumbnails_are_kept(videoRenderer):
+    videoRenderer['thumbnail']['thumbnails'][0]['extra'] = 1
+    full, record = components({'videoRenderer': videoRenderer}, '_getVideoComponent')
+    assert record.to_dict() == full
+
+
+def test_record_get(videoRenderer):
+    _, record = components({'videoRenderer': videoRenderer}, '_getVideoComponent')
+    assert record.get('id') == 'vid00000007'
+    assert record.get('channel.id') == 'UC7'
+    assert record.get('link') == 'https://www.youtube.com/watch?v=vid00000007'
+    assert record.get('viewCount') == {'text': '7,000 views', 'short': '7K views'}
+    assert record.get('shelfTitle', 'none') == 'none'
+    assert record.get('thumbnails') == record.to_dict()['thumbnails']
+
+
+def test_records_json_default(videoRenderer):
+    full, record = components({'videoRenderer': videoRenderer}, '_getVideoComponent')
+    assert json.dumps({'result': [record]}, default=toDict) == json.dumps({'result': [full]})
+    with pytest.raises(TypeError):
+        json.dumps(object(), default=toDict)
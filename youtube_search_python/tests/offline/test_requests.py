@@ -0,0 +1,137 @@
+import asyncio
+
+import httpx
+import pytest
+
+from youtubesearchpython.core import requests
+from youtubesearchpython.core.requests import ClientPool
+from youtubesearchpython.core.hashtag import HashtagCore
+
+
+class Responses:
+    '''Mock transport answering with the next status code of `statusCodes` (the last one is repeated).'''
+
+    def __init__(self, *statusCodes):
+        self.statusCodes = list(statusCodes)
+        self.requests = []
+
+    def __call__(self, request: httpx.Request) -> httpx.Response:
+        self.requests.append(request)
+        status = self.statusCodes.pop(0) if len(self.statusCodes) > 1 else self.statusCodes[0]
+        if status is None:
+            raise httpx.ConnectError('connection refused', request=request)
+        return httpx.Response(status, content=b'{}')
+
+
+def mockPool(responses: Responses, retries: int = 0) -> ClientPool:
+    pool = ClientPool(retries=retries, backoffFactor=0)
+    clientOptions = pool._clientOptions
+    pool._clientOptions = lambda proxy: dict(clientOptions(proxy), transport=httpx.MockTransport(responses))
+    return pool
+
+
+def test_sync_clients_are_pooled_per_proxy():
+    pool = mockPool(Responses(200))
+    client = pool.getSyncClient({})
+    assert pool.getSyncClient({}) is client
+    assert pool.getSyncClient({'https://': 'http://proxy:8080'}) is not client
+    pool.close()
+    assert client.is_closed
+    assert pool.getSyncClient({}) is not client
+
+
+def test_async_clients_are_pooled_per_loop():
+    pool = mockPool(Responses(200))
+
+    async def clients():
+        return pool.getAsyncClient({}), pool.getAsyncClient({})
+
+    first, again = asyncio.run(clients())
+    assert first is again
+    second, _ = asyncio.run(clients())
+    assert second is not first
+
+
+@pytest.mark.parametrize('statusCodes, retries, status, sent', [
+    ((200,), 2, 200, 1),
+    ((503, 429, 200), 2, 200, 3),
+    ((503,), 2, 503, 3),
+    ((404, 200), 2, 404, 1),
+    ((None, 200), 1, 200, 2),
+])
+def test_request_retries(statusCodes, retries, status, sent):
+    responses = Responses(*statusCodes)
+    pool = mockPool(responses, retries)
+    assert pool.request('GET', 'https://www.youtube.com/', {}).status_code == status
+    assert len(responses.requests) == sent
+    assert pool.metrics.snapshot()['requests'] == sent
+    assert pool.metrics.snapshot()['retries'] == sent - 1
+
+
+@pytest.mark.parametrize('statusCodes, retries, status, sent', [
+    ((503, 429, 200), 2, 200, 3),
+    ((503,), 1, 503, 2),
+    ((None, 200), 1, 200, 2),
+])
+def test_arequest_retries(statusCodes, retries, status, sent):
+    responses = Responses(*statusCodes)
+    pool = mockPool(responses, retries)
+    response = asyncio.run(pool.arequest('POST', 'https://www.youtube.com/', {}, json={}))
+    assert response.status_code == status
+    assert len(responses.requests) == sent
+
+
+def test_connection_errors_are_raised_after_the_retries():
+    pool = mockPool(Responses(None), retries=2)
+    with pytest.raises(httpx.ConnectError):
+        pool.request('GET', 'https://www.youtube.com/', {})
+    assert pool.metrics.snapshot()['errors'] == 3
+    with pytest.raises(httpx.ConnectError):
+        asyncio.run(pool.arequest('GET', 'https://www.youtube.com/', {}))
+
+
+def test_close_releases_the_async_clients():
+    pool = mockPool(Responses(200))
+
+    async def closeInLoop():
+        client = pool.getAsyncClient({})
+        # a sync close from a running loop closes its clients in a task
+        pool.close()
+        for _ in range(3):
+            await asyncio.sleep(0)
+        return client
+
+    assert asyncio.run(closeInLoop()).is_closed
+    assert pool._asyncClients == {}
+
+    async def getClient():
+        return pool.getAsyncClient({})
+
+    # the loop of this client is closed: it is dropped from the pool
+    asyncio.run(getClient())
+    assert len(pool._asyncClients) == 1
+    pool.close()
+    assert pool._asyncClients == {}
+
+
+def test_aclose_awaits_the_clients_of_the_running_loop():
+    pool = mockPool(Responses(200))
+
+    async def main():
+        async with pool:
+            await pool.arequest('GET', 'https://www.youtube.com/', {})
+            client = pool.getAsyncClient({})
+        return client
+
+    assert asyncio.run(main()).is_closed
+    assert pool._asyncClients == {}
+
+
+def test_async_hashtag_requests_raise_on_http_errors(monkeypatch):
+    monkeypatch.setattr(requests, 'clientPool', mockPool(Responses(404)))
+    hashtag = HashtagCore('hdr', 20, 'en', 'US', None)
+    with pytest.raises(Exception, match='Could not make request'):
+        asyncio.run(hashtag._asyncGetParams())
+    hashtag.params = 'params'
+    with pytest.raises(Exception, match='Could not make request'):
+        asyncio.run(hashtag._asyncMakeRequest())
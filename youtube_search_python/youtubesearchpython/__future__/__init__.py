@@ -1,8 +1,12 @@
 from youtubesearchpython.__future__.search import Search, VideosSearch, ChannelsSearch, PlaylistsSearch, CustomSearch, ChannelSearch
+from youtubesearchpython.__future__.batchsearch import BatchSearch
 from youtubesearchpython.__future__.extras import Video, Playlist, Suggestions, Hashtag, Comments, Transcript, Channel
 from youtubesearchpython.__future__.streamurlfetcher import StreamURLFetcher
 from youtubesearchpython.core.utils import *
 from youtubesearchpython.core.constants import *
+from youtubesearchpython.core.requests import ClientPool, clientPool
+from youtubesearchpython.core.jsonbackend import setJsonBackend, getJsonBackend
+from youtubesearchpython.core.records import VideoRecord, ChannelRecord, PlaylistRecord, CommentRecord
 
 
 __title__        = 'youtube-search-python'
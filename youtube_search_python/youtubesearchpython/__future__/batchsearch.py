@@ -0,0 +1,103 @@
+import asyncio
+from typing import Any, AsyncIterator, Dict, Iterable, Iterator, List, Optional
+
+from youtubesearchpython.__future__.search import CustomSearch
+
+
+class BatchSearch:
+    '''Searches many keywords concurrently in YouTube with a search filter or sorting order.
+
+    Keywords are consumed lazily by `workers` keyword pipelines. Each pipeline pages through the
+    continuations of its own `CustomSearch` until `limit` results are collected or YouTube has no
+    more results, while at most `concurrency` requests are in flight across all pipelines.
+    Pages are yielded by `stream` as soon as they arrive, so results of different keywords interleave.
+
+    Args:
+        keywords (Iterable[str]): Sets the search queries. Consumed lazily, may be a generator.
+        searchPreferences (str): Sets the `sp` query parameter in the YouTube search request e.g. `VideoFeatures.CC_HDR`.
+        limit (int, optional): Sets limit to the number of results per keyword. Defaults to 20.
+        extraKeyword (str, optional): Appended to every keyword in the query e.g. ' #shorts'. Defaults to ''.
+        workers (int, optional): Sets the number of keyword pipelines running concurrently. Defaults to 10.
+        concurrency (int, optional): Sets the maximum number of requests in flight. Defaults to 10.
+        language (str, optional): Sets the result language. Defaults to 'en'.
+        region (str, optional): Sets the result region. Defaults to 'US'.
+        checkpoints (Dict[str, dict], optional): Resumes keywords from a saved state with keys `page`, `count` (results
+            received so far) and `continuationKey`, as reported by the pages of a previous run. Defaults to None.
+        lean (bool, optional): Decodes only the result items of the responses, see `CustomSearch`. Defaults to False.
+        fields (List[str], optional): Extracts only these fields of the results, see `CustomSearch`. Defaults to None.
+        records (bool, optional): Yields the results as compact records, see `CustomSearch`. Defaults to False.
+
+    Examples:
+        Every yielded page holds the keyword, the page index and the results of that page, along with the
+        `continuationKey` to resume from and `done` once the keyword is complete.
+        `error` is set instead of `result` when the search of a keyword failed.
+
+        >>> batch = BatchSearch(['LG OLED', 'Dolby Vision'], VideoFeatures.CC_HDR, limit = 40)
+        >>> async for page in batch.stream():
+        ...     print(page['keyword'], page['page'], len(page['result']), page['error'])
+        Dolby Vision 0 20 None
+        LG OLED 0 20 None
+        LG OLED 1 20 None
+        Dolby Vision 1 20 None
+    '''
+    def __init__(self, keywords: Iterable[str], searchPreferences: str, limit: int = 20, extraKeyword: str = '', workers: int = 10, concurrency: int = 10, language: str = 'en', region: str = 'US', timeout: Optional[int] = None, checkpoints: Optional[Dict[str, Dict[str, Any]]] = None, lean: bool = False, fields: Optional[List[str]] = None, records: bool = False):
+        self.keywords = keywords
+        self.searchPreferences = searchPreferences
+        self.limit = limit
+        self.extraKeyword = extraKeyword
+        self.workers = workers
+        self.concurrency = concurrency
+        self.language = language
+        self.region = region
+        self.timeout = timeout
+        self.checkpoints = checkpoints or {}
+        self.lean = lean
+        self.fields = fields
+        self.records = records
+
+    async def stream(self) -> AsyncIterator[Dict[str, Any]]:
+        '''Runs the keyword pipelines and yields the pages in the order they arrive.'''
+        keywords = iter(self.keywords)
+        semaphore = asyncio.Semaphore(self.concurrency)
+        pages: asyncio.Queue = asyncio.Queue(maxsize=self.workers * 2)
+        workers = [asyncio.ensure_future(self._worker(keywords, semaphore, pages)) for _ in range(self.workers)]
+        running = len(workers)
+        try:
+            while running:
+                page = await pages.get()
+                if page is None:
+                    running -= 1
+                    continue
+                yield page
+        finally:
+            for worker in workers:
+                worker.cancel()
+            await asyncio.gather(*workers, return_exceptions=True)
+
+    async def _worker(self, keywords: Iterator[str], semaphore: asyncio.Semaphore, pages: asyncio.Queue) -> None:
+        # All pipelines share the same keyword iterator, `next` never yields to the event loop.
+        for keyword in keywords:
+            await self._searchKeyword(keyword, semaphore, pages)
+        await pages.put(None)
+
+    async def _searchKeyword(self, keyword: str, semaphore: asyncio.Semaphore, pages: asyncio.Queue) -> None:
+        checkpoint = self.checkpoints.get(keyword, {})
+        search = CustomSearch(keyword + self.extraKeyword, self.searchPreferences, limit=self.limit, language=self.language, region=self.region, timeout=self.timeout, continuationKey=checkpoint.get('continuationKey'), lean=self.lean, fields=self.fields, records=self.records)
+        count = checkpoint.get('count', 0)
+        page = checkpoint.get('page', 0)
+        while count < self.limit:
+            continuationKey = search.continuationKey
+            try:
+                async with semaphore:
+                    result = (await search.next())['result']
+            except Exception as e:
+                await pages.put({'keyword': keyword, 'page': page, 'count': count, 'result': [], 'continuationKey': continuationKey, 'done': False, 'error': str(e)})
+                return
+            result = result[:self.limit - count]
+            count += len(result)
+            # The previous token is kept when a response has no continuation, do not request the same page twice.
+            done = count >= self.limit or not result or search.continuationKey in (None, continuationKey)
+            await pages.put({'keyword': keyword, 'page': page, 'count': count, 'result': result, 'continuationKey': search.continuationKey, 'done': done, 'error': None})
+            page += 1
+            if done:
+                return
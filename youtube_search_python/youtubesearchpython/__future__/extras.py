@@ -1853,13 +1853,14 @@ class Comments:
     hasMoreComments = True
     __comments = None
 
-    def __init__(self, playlistLink: str, timeout: int = None):
+    def __init__(self, playlistLink: str, timeout: int = None, records: bool = False):
         self.timeout = timeout
         self.playlistLink = playlistLink
+        self.records = records
 
     async def getNextComments(self) -> None:
         if self.__comments is None:
-            self.__comments = CommentsCore(self.playlistLink)
+            self.__comments = CommentsCore(self.playlistLink, self.records)
             await self.__comments.async_create()
         else:
             await self.__comments.async_create_next()
@@ -1867,8 +1868,8 @@ class Comments:
         self.hasMoreComments = self.__comments.continuationKey is not None
 
     @staticmethod
-    async def get(playlistLink: str) -> Union[dict, str, None]:
-        pc = CommentsCore(playlistLink)
+    async def get(playlistLink: str, records: bool = False) -> Union[dict, str, None]:
+        pc = CommentsCore(playlistLink, records)
         await pc.async_create()
         return pc.commentsComponent
 
@@ -1,4 +1,4 @@
-from typing import Any, Dict, Optional
+from typing import Any, Dict, List, Optional
 
 from youtubesearchpython.core.channelsearch import ChannelSearchCore
 from youtubesearchpython.core.constants import *
@@ -13,6 +13,9 @@ class Search(SearchCore):
         limit (int, optional): Sets limit to the number of results. Defaults to 20.
         language (str, optional): Sets the result language. Defaults to 'en'.
         region (str, optional): Sets the result region. Defaults to 'US'.
+        lean (bool, optional): Decodes only the result items of the responses instead of the whole responses, lowers the memory and CPU per page of large crawls. Defaults to False.
+        fields (List[str], optional): Extracts only these fields of the results, nested fields joined with dots e.g. ['id', 'title', 'duration', 'link', 'channel.id']. The results are then flat dicts keyed by the field names. Defaults to None, all the fields.
+        records (bool, optional): Returns the results as compact records (`VideoRecord`, `ChannelRecord`, `PlaylistRecord`) with `to_dict()` and `to_json()`, instead of dicts. Defaults to False.
 
     Examples:
         Calling `result` method gives the search result.
@@ -71,9 +74,9 @@ class Search(SearchCore):
             ]
         }
     '''
-    def __init__(self, query: str, limit: int = 20, language: str = 'en', region: str = 'US', timeout: Optional[int] = None):
+    def __init__(self, query: str, limit: int = 20, language: str = 'en', region: str = 'US', timeout: Optional[int] = None, lean: bool = False, fields: Optional[List[str]] = None, records: bool = False):
         self.searchMode = (True, True, True)
-        super().__init__(query, limit, language, region, None, timeout)  # type: ignore
+        super().__init__(query, limit, language, region, None, timeout, lean, fields, records)  # type: ignore
 
     async def next(self) -> Dict[str, Any]:
         return await self._nextAsync()  # type: ignore
@@ -87,6 +90,9 @@ class VideosSearch(SearchCore):
         limit (int, optional): Sets limit to the number of results. Defaults to 20.
         language (str, optional): Sets the result language. Defaults to 'en'.
         region (str, optional): Sets the result region. Defaults to 'US'.
+        lean (bool, optional): Decodes only the result items of the responses instead of the whole responses, lowers the memory and CPU per page of large crawls. Defaults to False.
+        fields (List[str], optional): Extracts only these fields of the results, nested fields joined with dots e.g. ['id', 'title', 'duration', 'link', 'channel.id']. The results are then flat dicts keyed by the field names. Defaults to None, all the fields.
+        records (bool, optional): Returns the results as compact records (`VideoRecord`, `ChannelRecord`, `PlaylistRecord`) with `to_dict()` and `to_json()`, instead of dicts. Defaults to False.
 
     Examples:
         Calling `result` method gives the search result.
@@ -145,9 +151,9 @@ class VideosSearch(SearchCore):
             ]
         }
     '''
-    def __init__(self, query: str, limit: int = 20, language: str = 'en', region: str = 'US', timeout: Optional[int] = None):
+    def __init__(self, query: str, limit: int = 20, language: str = 'en', region: str = 'US', timeout: Optional[int] = None, lean: bool = False, fields: Optional[List[str]] = None, records: bool = False):
         self.searchMode = (True, False, False)
-        super().__init__(query, limit, language, region, SearchMode.videos, timeout)  # type: ignore
+        super().__init__(query, limit, language, region, SearchMode.videos, timeout, lean, fields, records)  # type: ignore
 
     async def next(self) -> Dict[str, Any]:
         return await self._nextAsync()  # type: ignore
@@ -161,6 +167,7 @@ class ChannelsSearch(SearchCore):
         limit (int, optional): Sets limit to the number of results. Defaults to 20.
         language (str, optional): Sets the result language. Defaults to 'en'.
         region (str, optional): Sets the result region. Defaults to 'US'.
+        lean (bool, optional): Decodes only the result items of the responses instead of the whole responses, lowers the memory and CPU per page of large crawls. Defaults to False.
 
     Examples:
         Calling `result` method gives the search result.
@@ -194,9 +201,9 @@ class ChannelsSearch(SearchCore):
             ]
         }
     '''
-    def __init__(self, query: str, limit: int = 20, language: str = 'en', region: str = 'US', timeout: Optional[int] = None):
+    def __init__(self, query: str, limit: int = 20, language: str = 'en', region: str = 'US', timeout: Optional[int] = None, lean: bool = False):
         self.searchMode = (False, True, False)
-        super().__init__(query, limit, language, region, SearchMode.channels, timeout)  # type: ignore
+        super().__init__(query, limit, language, region, SearchMode.channels, timeout, lean)  # type: ignore
 
     async def next(self) -> Dict[str, Any]:
         return await self._nextAsync()  # type: ignore
@@ -210,6 +217,7 @@ class PlaylistsSearch(SearchCore):
         limit (int, optional): Sets limit to the number of results. Defaults to 20.
         language (str, optional): Sets the result language. Defaults to 'en'.
         region (str, optional): Sets the result region. Defaults to 'US'.
+        lean (bool, optional): Decodes only the result items of the responses instead of the whole responses, lowers the memory and CPU per page of large crawls. Defaults to False.
 
     Examples:
         Calling `result` method gives the search result.
@@ -256,9 +264,9 @@ class PlaylistsSearch(SearchCore):
             ]
         }
     '''
-    def __init__(self, query: str, limit: int = 20, language: str = 'en', region: str = 'US', timeout: Optional[int] = None):
+    def __init__(self, query: str, limit: int = 20, language: str = 'en', region: str = 'US', timeout: Optional[int] = None, lean: bool = False):
         self.searchMode = (False, False, True)
-        super().__init__(query, limit, language, region, SearchMode.playlists, timeout)  # type: ignore
+        super().__init__(query, limit, language, region, SearchMode.playlists, timeout, lean)  # type: ignore
 
     async def next(self) -> Dict[str, Any]:
         return await self._nextAsync()  # type: ignore
@@ -282,6 +290,10 @@ class CustomSearch(SearchCore):
         limit (int, optional): Sets limit to the number of results. Defaults to 20.
         language (str, optional): Sets the result language. Defaults to 'en'.
         region (str, optional): Sets the result region. Defaults to 'US'.
+        continuationKey (str, optional): Resumes a search from the `continuationKey` saved from a previous search, the first request then fetches the following page. Defaults to None.
+        lean (bool, optional): Decodes only the result items of the responses instead of the whole responses, lowers the memory and CPU per page of large crawls. Defaults to False.
+        fields (List[str], optional): Extracts only these fields of the results, nested fields joined with dots e.g. ['id', 'title', 'duration', 'link', 'channel.id']. The results are then flat dicts keyed by the field names. Defaults to None, all the fields.
+        records (bool, optional): Returns the results as compact records (`VideoRecord`, `ChannelRecord`, `PlaylistRecord`) with `to_dict()` and `to_json()`, instead of dicts. Defaults to False.
     
     Examples:
         Calling `result` method gives the search result.
@@ -340,9 +352,10 @@ class CustomSearch(SearchCore):
             ]
         }
     '''
-    def __init__(self, query: str, searchPreferences: str, limit: int = 20, language: str = 'en', region: str = 'US', timeout: Optional[int] = None):
+    def __init__(self, query: str, searchPreferences: str, limit: int = 20, language: str = 'en', region: str = 'US', timeout: Optional[int] = None, continuationKey: Optional[str] = None, lean: bool = False, fields: Optional[List[str]] = None, records: bool = False):
         self.searchMode = (True, True, True)
-        super().__init__(query, limit, language, region, searchPreferences, timeout)  # type: ignore
+        super().__init__(query, limit, language, region, searchPreferences, timeout, lean, fields, records)  # type: ignore
+        self.continuationKey = continuationKey
 
     async def next(self) -> Dict[str, Any]:
         return await self._nextAsync()  # type: ignore
@@ -5,6 +5,9 @@ from youtubesearchpython.extras import Video, Playlist, Suggestions, Hashtag, Co
 from youtubesearchpython.streamurlfetcher import StreamURLFetcher
 from youtubesearchpython.core.constants import *
 from youtubesearchpython.core.utils import *
+from youtubesearchpython.core.requests import ClientPool, clientPool
+from youtubesearchpython.core.jsonbackend import setJsonBackend, getJsonBackend
+from youtubesearchpython.core.records import VideoRecord, ChannelRecord, PlaylistRecord, CommentRecord
 
 
 __title__        = 'youtube-search-python'
@@ -4,6 +4,7 @@ from typing import Union, List
 from urllib.parse import urlencode
 
 from youtubesearchpython.core.constants import *
+from youtubesearchpython.core.jsonbackend import loads
 from youtubesearchpython.core.requests import RequestCore
 from youtubesearchpython.core.componenthandler import getValue, getVideoId
 
@@ -38,7 +39,7 @@ class ChannelCore(RequestCore):
         }
 
     def parse_response(self):
-        response = self.data.json()
+        response = loads(self.data.content)
 
         thumbnails = []
         try:
@@ -104,7 +105,7 @@ class ChannelCore(RequestCore):
         }
 
     def parse_next_response(self):
-        response = self.data.json()
+        response = loads(self.data.content)
 
         self.continuation = None
 
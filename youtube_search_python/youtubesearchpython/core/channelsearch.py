@@ -6,6 +6,7 @@ from urllib.parse import urlencode
 from youtubesearchpython.core.requests import RequestCore
 from youtubesearchpython.handlers.componenthandler import ComponentHandler
 from youtubesearchpython.core.constants import *
+from youtubesearchpython.core.jsonbackend import loads
 
 
 class ChannelSearchCore(RequestCore, ComponentHandler):
@@ -69,7 +70,7 @@ class ChannelSearchCore(RequestCore, ComponentHandler):
 
         request = self.syncPostRequest()
         try:
-            self.response = request.json()
+            self.response = loads(request.content)
         except:
             raise Exception('ERROR: Could not make request.')
 
@@ -79,7 +80,7 @@ class ChannelSearchCore(RequestCore, ComponentHandler):
 
         request = await self.asyncPostRequest()
         try:
-            self.response = request.json()
+            self.response = loads(request.content)
         except:
             raise Exception('ERROR: Could not make request.')
 
@@ -7,7 +7,10 @@ from urllib.parse import urlencode
 from urllib.request import Request, urlopen
 
 from youtubesearchpython.core.componenthandler import getVideoId, getValue
+from youtubesearchpython.core.extractor import extractComment
+from youtubesearchpython.core.records import extractCommentRecord, toDict
 from youtubesearchpython.core.constants import *
+from youtubesearchpython.core.jsonbackend import loads
 from youtubesearchpython.core.requests import RequestCore
 
 K = TypeVar("K")
@@ -19,12 +22,14 @@ class CommentsCore(RequestCore):
     continuationKey = None
     isNextRequest = False
     response = None
+    responseJson = None
 
-    def __init__(self, videoLink: str):
+    def __init__(self, videoLink: str, records: bool = False):
         super().__init__()
         self.commentsComponent = {"result": []}
         self.responseSource = None
         self.videoLink = videoLink
+        self.records = records
 
     def prepare_continuation_request(self):
         self.data = {
@@ -40,7 +45,7 @@ class CommentsCore(RequestCore):
         }
 
     def parse_source(self):
-        self.responseSource = getValue(self.response.json(), [
+        self.responseSource = getValue(self.responseJson, [
             "onResponseReceivedEndpoints",
             0 if self.isNextRequest else 1,
             "appendContinuationItemsAction" if self.isNextRequest else "reloadContinuationItemsCommand",
@@ -49,7 +54,7 @@ class CommentsCore(RequestCore):
 
     def parse_continuation_source(self):
         self.continuationKey = getValue(
-            self.response.json(),
+            self.responseJson,
             [
                 "contents",
                 "twoColumnWatchNextResults",
@@ -71,12 +76,14 @@ class CommentsCore(RequestCore):
         self.prepare_comments_request()
         self.response = self.syncPostRequest()
         if self.response.status_code == 200:
+            self.responseJson = loads(self.response.content)
             self.parse_source()
 
     def sync_make_continuation_request(self):
         self.prepare_continuation_request()
         self.response = self.syncPostRequest()
         if self.response.status_code == 200:
+            self.responseJson = loads(self.response.content)
             self.parse_continuation_source()
             if not self.continuationKey:
                 raise Exception("Could not retrieve continuation token")
@@ -87,12 +94,14 @@ class CommentsCore(RequestCore):
         self.prepare_comments_request()
         self.response = await self.asyncPostRequest()
         if self.response.status_code == 200:
+            self.responseJson = loads(self.response.content)
             self.parse_source()
 
     async def async_make_continuation_request(self):
         self.prepare_continuation_request()
         self.response = await self.asyncPostRequest()
         if self.response.status_code == 200:
+            self.responseJson = loads(self.response.content)
             self.parse_continuation_source()
             if not self.continuationKey:
                 raise Exception("Could not retrieve continuation token")
@@ -125,24 +134,7 @@ class CommentsCore(RequestCore):
             comment = getValue(comment, ["commentThreadRenderer", "comment", "commentRenderer"])
             #print(json.dumps(comment, indent=4))
             try:
-                j = {
-                    "id": self.__getValue(comment, ["commentId"]),
-                    "author": {
-                        "id": self.__getValue(comment, ["authorEndpoint", "browseEndpoint", "browseId"]),
-                        "name": self.__getValue(comment, ["authorText", "simpleText"]),
-                        "thumbnails": self.__getValue(comment, ["authorThumbnail", "thumbnails"])
-                    },
-                    "content": self.__getValue(comment, ["contentText", "runs", 0, "text"]),
-                    "published": self.__getValue(comment, ["publishedTimeText", "runs", 0, "text"]),
-                    "isLiked": self.__getValue(comment, ["isLiked"]),
-                    "authorIsChannelOwner": self.__getValue(comment, ["authorIsChannelOwner"]),
-                    "voteStatus": self.__getValue(comment, ["voteStatus"]),
-                    "votes": {
-                        "simpleText": self.__getValue(comment, ["voteCount", "simpleText"]),
-                        "label": self.__getValue(comment, ["voteCount", "accessibility", "accessibilityData", "label"])
-                    },
-                    "replyCount": self.__getValue(comment, ["replyCount"]),
-                }
+                j = extractCommentRecord(comment) if self.records else extractComment(comment)
                 comments.append(j)
             except:
                 pass
@@ -154,24 +146,10 @@ class CommentsCore(RequestCore):
         if mode == ResultMode.dict:
             return self.commentsComponent
         elif mode == ResultMode.json:
-            return json.dumps(self.commentsComponent, indent=4)
+            return json.dumps(self.commentsComponent, indent=4, default=toDict)
 
     def __getValue(self, source: dict, path: Iterable[str]) -> Union[str, int, dict, None]:
-        value = source
-        for key in path:
-            if type(key) is str:
-                if key in value.keys():
-                    value = value[key]
-                else:
-                    value = None
-                    break
-            elif type(key) is int:
-                if len(value) != 0:
-                    value = value[key]
-                else:
-                    value = None
-                    break
-        return value
+        return getValue(source, path)
 
     def __getAllWithKey(self, source: Iterable[Mapping[K, T]], key: K) -> Iterable[T]:
         for item in source:
@@ -1,22 +1,4 @@
-from typing import Union, List
-
-
-def getValue(source: dict, path: List[str]) -> Union[str, int, dict, None]:
-    value = source
-    for key in path:
-        if type(key) is str:
-            if key in value.keys():
-                value = value[key]
-            else:
-                value = None
-                break
-        elif type(key) is int:
-            if len(value) != 0:
-                value = value[key]
-            else:
-                value = None
-                break
-    return value
+from youtubesearchpython.core.extractor import getValue
 
 
 def getVideoId(videoLink: str) -> str:
@@ -0,0 +1,285 @@
+'''
+Compiled path extractors.
+
+A path is a list of keys walked from a renderer dict, strings index dicts and integers index lists:
+    ['title', 'runs', 0, 'text']
+A missing key, or an empty list, gives None (the value of `default`) for the whole path. A key present with a null
+value gives None, also when a `default` is given (as the legacy walk: the default only replaces missing values).
+
+A schema is a nested dict of output keys to paths, other values are constants:
+    {'type': 'video', 'id': ['videoId'], 'channel': {'name': ['ownerText', 'runs', 0, 'text']}}
+A `Prefixed` path gives its value appended to a constant, e.g. the link of a video from its id.
+
+Paths and schemas are compiled once into Python functions, straight-line code without any loop over the keys or
+type checks, where the common prefixes of the paths of a schema are walked only once.
+'''
+from functools import lru_cache
+from typing import Any, Callable, Dict, List, Tuple, Union
+
+
+class Prefixed:
+    '''A path whose value is appended to `prefix`, None if the path is missing.'''
+    def __init__(self, prefix: str, path: List[Union[str, int]]):
+        self.prefix = prefix
+        self.path = path
+
+
+# missing key or empty list, only told apart from a null value when the paths have a default
+_missing = object()
+
+
+class _Compiler:
+    def __init__(self, default: Any):
+        self.default = default
+        self.lines = []
+        self.nodes = {(): 'source'}
+
+    def node(self, path: Tuple[Union[str, int], ...]) -> str:
+        if path in self.nodes:
+            return self.nodes[path]
+        parent = self.node(path[:-1])
+        key = path[-1]
+        variable = f'_{len(self.nodes)}'
+        if self.default is not None:
+            self.lines.append(f'    {variable} = {self._missingNode(parent, key)}')
+            self.nodes[path] = variable
+            return variable
+        # the source itself is not checked: a None renderer raises, as with getValue
+        guard = '' if parent == 'source' else f' if {parent} is not None else None'
+        if type(key) is int:
+            guard = f' if {parent} else None'
+            self.lines.append(f'    {variable} = {parent}[{key}]{guard}')
+        else:
+            self.lines.append(f'    {variable} = {parent}.get({key!r}){guard}')
+        self.nodes[path] = variable
+        return variable
+
+    def _missingNode(self, parent: str, key: Union[str, int]) -> str:
+        # with a default, a missing key or an empty list gives `missing` and a null value None, both carried to the end
+        if type(key) is int:
+            value = f'({parent}[{key}] if {parent} else missing)'
+        else:
+            value = f'{parent}.get({key!r}, missing)'
+        if parent == 'source':
+            return value
+        return f'{value} if {parent} is not None and {parent} is not missing else {parent}'
+
+    def value(self, path: Tuple[Union[str, int], ...]) -> str:
+        variable = self.node(path)
+        if self.default is None:
+            return variable
+        return f'(default if {variable} is missing else {variable})'
+
+    def build(self, schema: Any) -> str:
+        if isinstance(schema, dict):
+            return '{' + ', '.join(f'{key!r}: {self.build(value)}' for key, value in schema.items()) + '}'
+        if isinstance(schema, (list, tuple)):
+            return self.value(tuple(schema))
+        if isinstance(schema, Prefixed):
+            variable = self.node(tuple(schema.path))
+            if self.default is None:
+                return f'({schema.prefix!r} + {variable} if {variable} is not None else default)'
+            return f'({schema.prefix!r} + {variable} if {variable} is not None and {variable} is not missing else {self.value(tuple(schema.path))})'
+        return repr(schema)
+
+    def function(self, expression: str, **names: Any) -> Callable[[dict], Any]:
+        code = 'def extract(source):\n' + '\n'.join(self.lines + [f'    return {expression}']) + '\n'
+        namespace = dict(names, default=self.default, missing=_missing)
+        exec(code, namespace)
+        extract = namespace['extract']
+        extract.code = code
+        return extract
+
+
+@lru_cache(maxsize=None)
+def _compilePath(path: Tuple[Union[str, int], ...], default: Any) -> Callable[[dict], Any]:
+    compiler = _Compiler(default)
+    return compiler.function(compiler.value(path))
+
+
+def compilePath(path: List[Union[str, int]], default: Any = None) -> Callable[[dict], Any]:
+    '''
+    Returns a function extracting the value at `path` from a dict, compiled once per path.
+    '''
+    return _compilePath(tuple(path), default)
+
+
+def compileSchema(schema: dict, default: Any = None) -> Callable[[dict], dict]:
+    '''
+    Returns a function building the nested dict of `schema` from a renderer dict.
+    Compile the schema once (module level) and call the returned function for every renderer.
+    '''
+    compiler = _Compiler(default)
+    return compiler.function(compiler.build(schema))
+
+
+def getValue(source: dict, path: List[Union[str, int]]) -> Union[str, int, dict, None]:
+    return _compilePath(tuple(path), None)(source)
+
+
+'''
+Renderer schemas.
+'''
+
+videoSchema = {
+    'type':                           'video',
+    'id':                              ['videoId'],
+    'title':                           ['title', 'runs', 0, 'text'],
+    'publishedTime':                   ['publishedTimeText', 'simpleText'],
+    'duration':                        ['lengthText', 'simpleText'],
+    'viewCount': {
+        'text':                        ['viewCountText', 'simpleText'],
+        'short':                       ['shortViewCountText', 'simpleText'],
+    },
+    'thumbnails':                      ['thumbnail', 'thumbnails'],
+    'richThumbnail':                   ['richThumbnail', 'movingThumbnailRenderer', 'movingThumbnailDetails', 'thumbnails', 0],
+    'descriptionSnippet':              ['detailedMetadataSnippets', 0, 'snippetText', 'runs'],
+    'channel': {
+        'name':                        ['ownerText', 'runs', 0, 'text'],
+        'id':                          ['ownerText', 'runs', 0, 'navigationEndpoint', 'browseEndpoint', 'browseId'],
+        'thumbnails':                  ['channelThumbnailSupportedRenderers', 'channelThumbnailWithLinkRenderer', 'thumbnail', 'thumbnails'],
+    },
+    'accessibility': {
+        'title':                       ['title', 'accessibility', 'accessibilityData', 'label'],
+        'duration':                    ['lengthText', 'accessibility', 'accessibilityData', 'label'],
+    },
+}
+
+channelSchema = {
+    'type':                           'channel',
+    'id':                              ['channelId'],
+    'title':                           ['title', 'simpleText'],
+    'thumbnails':                      ['thumbnail', 'thumbnails'],
+    'videoCount':                      ['videoCountText', 'runs', 0, 'text'],
+    'descriptionSnippet':              ['descriptionSnippet', 'runs'],
+    'subscribers':                     ['subscriberCountText', 'simpleText'],
+}
+
+playlistSchema = {
+    'type':                           'playlist',
+    'id':                             ['playlistId'],
+    'title':                          ['title', 'simpleText'],
+    'videoCount':                     ['videoCount'],
+    'channel': {
+        'name':                       ['shortBylineText', 'runs', 0, 'text'],
+        'id':                         ['shortBylineText', 'runs', 0, 'navigationEndpoint', 'browseEndpoint', 'browseId'],
+    },
+    'thumbnails':                     ['thumbnailRenderer', 'playlistVideoThumbnailRenderer', 'thumbnail', 'thumbnails'],
+}
+
+shelfSchema = {
+    'title':                           ['title', 'simpleText'],
+    'elements':                        ['content', 'verticalListRenderer', 'items'],
+}
+
+commentSchema = {
+    'id':                              ['commentId'],
+    'author': {
+        'id':                          ['authorEndpoint', 'browseEndpoint', 'browseId'],
+        'name':                        ['authorText', 'simpleText'],
+        'thumbnails':                  ['authorThumbnail', 'thumbnails'],
+    },
+    'content':                         ['contentText', 'runs', 0, 'text'],
+    'published':                       ['publishedTimeText', 'runs', 0, 'text'],
+    'isLiked':                         ['isLiked'],
+    'authorIsChannelOwner':            ['authorIsChannelOwner'],
+    'voteStatus':                      ['voteStatus'],
+    'votes': {
+        'simpleText':                  ['voteCount', 'simpleText'],
+        'label':                       ['voteCount', 'accessibility', 'accessibilityData', 'label'],
+    },
+    'replyCount':                      ['replyCount'],
+}
+
+# 'link' is the relative URL of the video, completed by the caller
+playlistVideoSchema = {
+    'id':                              ['videoId'],
+    'thumbnails':                      ['thumbnail', 'thumbnails'],
+    'title':                           ['title', 'runs', 0, 'text'],
+    'channel': {
+        'name':                        ['shortBylineText', 'runs', 0, 'text'],
+        'id':                          ['shortBylineText', 'runs', 0, 'navigationEndpoint', 'browseEndpoint', 'browseId'],
+        'link':                        ['shortBylineText', 'runs', 0, 'navigationEndpoint', 'browseEndpoint', 'canonicalBaseUrl'],
+    },
+    'duration':                        ['lengthText', 'simpleText'],
+    'accessibility': {
+        'title':                       ['title', 'accessibility', 'accessibilityData', 'label'],
+        'duration':                    ['lengthText', 'accessibility', 'accessibilityData', 'label'],
+    },
+    'link':                            ['navigationEndpoint', 'commandMetadata', 'webCommandMetadata', 'url'],
+    'isPlayable':                      ['isPlayable'],
+}
+
+extractVideo = compileSchema(videoSchema)
+extractChannel = compileSchema(channelSchema)
+extractPlaylist = compileSchema(playlistSchema)
+extractShelf = compileSchema(shelfSchema)
+extractComment = compileSchema(commentSchema)
+extractPlaylistVideo = compileSchema(playlistVideoSchema)
+
+
+'''
+Field projections.
+
+The fields of a component are the keys of its schema, nested keys joined with dots ('channel.id'), plus the links
+built by the component handler. A projection extracts only the requested fields into a flat dict keyed by the field
+names, e.g. ('id', 'title', 'channel.id') gives {'id': ..., 'title': ..., 'channel.id': ...}.
+'''
+
+def flattenSchema(schema: dict, prefix: str = '') -> Dict[str, Any]:
+    fields = {}
+    for key, value in schema.items():
+        if isinstance(value, dict):
+            fields.update(flattenSchema(value, prefix + key + '.'))
+        else:
+            fields[prefix + key] = value
+    return fields
+
+
+fieldSchemas = {
+    'video': dict(flattenSchema(videoSchema), **{
+        'link':                        Prefixed('https://www.youtube.com/watch?v=', videoSchema['id']),
+        'channel.link':                Prefixed('https://www.youtube.com/channel/', videoSchema['channel']['id']),
+        # set by the component handler
+        'shelfTitle':                  None,
+    }),
+    'channel': dict(flattenSchema(channelSchema), **{
+        'link':                        Prefixed('https://www.youtube.com/channel/', channelSchema['id']),
+    }),
+    'playlist': dict(flattenSchema(playlistSchema), **{
+        'link':                        Prefixed('https://www.youtube.com/playlist?list=', playlistSchema['id']),
+        'channel.link':                Prefixed('https://www.youtube.com/channel/', playlistSchema['channel']['id']),
+    }),
+    'comment': flattenSchema(commentSchema),
+}
+
+
+def checkFields(fields: List[str]) -> None:
+    '''
+    Raises if a field is not a field of any search result component.
+    '''
+    known = set().union(fieldSchemas['video'], fieldSchemas['channel'], fieldSchemas['playlist'])
+    unknown = [field for field in fields if field not in known]
+    if unknown:
+        raise Exception(f'ERROR: Unknown fields {unknown}, use some of {sorted(known)}.')
+
+
+@lru_cache(maxsize=None)
+def compileProjection(kind: str, fields: Tuple[str, ...]) -> Callable[[dict], dict]:
+    '''
+    Returns a function extracting only `fields` of a renderer of `kind` ('video', 'channel' or 'playlist'), compiled
+    once per field set. Fields of other kinds of components are None.
+    '''
+    schema = fieldSchemas[kind]
+    return compileSchema({field: schema.get(field) for field in fields})
+
+
+def compileRecord(record: type, kind: str) -> Callable[[dict], Any]:
+    '''
+    Returns a function building `record(*values)` from a renderer of `kind`, the values of the fields `record.fields`
+    passed positionally (see core/records.py).
+    '''
+    schema = fieldSchemas[kind]
+    compiler = _Compiler(None)
+    values = ', '.join(compiler.build(schema[field]) for field in record.fields)
+    return compiler.function(f'record({values})', record=record)
@@ -2,19 +2,19 @@ import copy
 import json
 from typing import Union
 from urllib.parse import urlencode
-from urllib.request import Request, urlopen
-
-import httpx
 
 from youtubesearchpython.core.constants import *
+from youtubesearchpython.core.jsonbackend import loads
+from youtubesearchpython.core.requests import RequestCore
 from youtubesearchpython.handlers.componenthandler import ComponentHandler
 
 
-class HashtagCore(ComponentHandler):
+class HashtagCore(RequestCore, ComponentHandler):
     response = None
     resultComponents = []
 
     def __init__(self, hashtag: str, limit: int, language: str, region: str, timeout: int):
+        super().__init__()
         self.hashtag = hashtag
         self.limit = limit
         self.language = language
@@ -54,67 +54,46 @@ class HashtagCore(ComponentHandler):
             return True
         return False
 
-    def _getParams(self) -> None:
+    def _getParamsRequestBody(self) -> None:
         requestBody = copy.deepcopy(requestPayload)
         requestBody['query'] = "#" + self.hashtag
         requestBody['client'] = {
             'hl': self.language,
             'gl': self.region,
         }
-        requestBodyBytes = json.dumps(requestBody).encode('utf_8')
-        request = Request(
-            'https://www.youtube.com/youtubei/v1/search' + '?' + urlencode({
-                'key': searchKey,
-            }),
-            data = requestBodyBytes,
-            headers = {
-                'Content-Type': 'application/json; charset=utf-8',
-                'Content-Length': len(requestBodyBytes),
-                'User-Agent': userAgent,
-            }
-        )
-        try:
-            response = urlopen(request, timeout=self.timeout).read().decode('utf_8')
-        except:
-            raise Exception('ERROR: Could not make request.')
-        content = self._getValue(json.loads(response), contentPath)
+        self.url = 'https://www.youtube.com/youtubei/v1/search' + '?' + urlencode({
+            'key': searchKey,
+        })
+        self.data = requestBody
+
+    def _parseParams(self, response: dict) -> None:
+        content = self._getValue(response, contentPath)
         for item in self._getValue(content, [0, 'itemSectionRenderer', 'contents']):
             if hashtagElementKey in item.keys():
                 self.params = self._getValue(item[hashtagElementKey], ['onTapCommand', 'browseEndpoint', 'params'])
                 return
 
+    def _getParams(self) -> None:
+        self._getParamsRequestBody()
+        try:
+            response = self.syncPostRequest()
+            response.raise_for_status()
+            response = response.content
+        except:
+            raise Exception('ERROR: Could not make request.')
+        self._parseParams(loads(response))
+
     async def _asyncGetParams(self) -> None:
-        requestBody = copy.deepcopy(requestPayload)
-        requestBody['query'] = "#" + self.hashtag
-        requestBody['client'] = {
-            'hl': self.language,
-            'gl': self.region,
-        }
+        self._getParamsRequestBody()
         try:
-            async with httpx.AsyncClient() as client:
-                response = await client.post(
-                    'https://www.youtube.com/youtubei/v1/search',
-                    params = {
-                        'key': searchKey,
-                    },
-                    headers = {
-                        'User-Agent': userAgent,
-                    },
-                    json = requestBody,
-                    timeout = self.timeout
-                )
-                response = response.json()
+            response = await self.asyncPostRequest()
+            response.raise_for_status()
+            response = loads(response.content)
         except:
             raise Exception('ERROR: Could not make request.')
-        content = self._getValue(response, contentPath)
-        for item in self._getValue(content, [0, 'itemSectionRenderer', 'contents']):
-            if hashtagElementKey in item.keys():
-                self.params = self._getValue(item[hashtagElementKey], ['onTapCommand', 'browseEndpoint', 'params'])
-                return
+        self._parseParams(response)
 
-    def _makeRequest(self) -> None:
-        if self.params == None:
-            return
+    def _getRequestBody(self) -> None:
         requestBody = copy.deepcopy(requestPayload)
         requestBody['browseId'] = hashtagBrowseKey
         requestBody['params'] = self.params
@@ -124,49 +103,30 @@ class HashtagCore(ComponentHandler):
         }
         if self.continuationKey:
             requestBody['continuation'] = self.continuationKey
-        requestBodyBytes = json.dumps(requestBody).encode('utf_8')
-        request = Request(
-            'https://www.youtube.com/youtubei/v1/browse' + '?' + urlencode({
-                'key': searchKey,
-            }),
-            data = requestBodyBytes,
-            headers = {
-                'Content-Type': 'application/json; charset=utf-8',
-                'Content-Length': len(requestBodyBytes),
-                'User-Agent': userAgent,
-            }
-        )
+        self.url = 'https://www.youtube.com/youtubei/v1/browse' + '?' + urlencode({
+            'key': searchKey,
+        })
+        self.data = requestBody
+
+    def _makeRequest(self) -> None:
+        if self.params == None:
+            return
+        self._getRequestBody()
         try:
-            self.response = urlopen(request, timeout=self.timeout).read().decode('utf_8')
+            response = self.syncPostRequest()
+            response.raise_for_status()
+            self.response = response.content
         except:
             raise Exception('ERROR: Could not make request.')
 
     async def _asyncMakeRequest(self) -> None:
         if self.params == None:
             return
-        requestBody = copy.deepcopy(requestPayload)
-        requestBody['browseId'] = hashtagBrowseKey
-        requestBody['params'] = self.params
-        requestBody['client'] = {
-            'hl': self.language,
-            'gl': self.region,
-        }
-        if self.continuationKey:
-            requestBody['continuation'] = self.continuationKey
+        self._getRequestBody()
         try:
-            async with httpx.AsyncClient() as client:
-                response = await client.post(
-                    'https://www.youtube.com/youtubei/v1/browse',
-                    params = {
-                        'key': searchKey,
-                    },
-                    headers = {
-                        'User-Agent': userAgent,
-                    },
-                    json = requestBody,
-                    timeout = self.timeout
-                )
-                self.response = response.content
+            response = await self.asyncPostRequest()
+            response.raise_for_status()
+            self.response = response.content
         except:
             raise Exception('ERROR: Could not make request.')
 
@@ -175,10 +135,11 @@ class HashtagCore(ComponentHandler):
             return
         self.resultComponents = []
         try:
+            responseJson = loads(self.response)
             if not self.continuationKey:
-                responseSource = self._getValue(json.loads(self.response), hashtagVideosPath)
+                responseSource = self._getValue(responseJson, hashtagVideosPath)
             else:
-                responseSource = self._getValue(json.loads(self.response), hashtagContinuationVideosPath)
+                responseSource = self._getValue(responseJson, hashtagContinuationVideosPath)
             if responseSource:
                 for element in responseSource:
                     if richItemKey in element.keys():
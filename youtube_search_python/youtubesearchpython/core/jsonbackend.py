@@ -0,0 +1,62 @@
+import json
+from typing import Any, Union
+
+try:
+    import orjson
+    isOrjsonInstalled = True
+except ImportError:
+    isOrjsonInstalled = False
+
+try:
+    import msgspec
+    isMsgspecInstalled = True
+except ImportError:
+    isMsgspecInstalled = False
+
+
+'''
+JSON decoder used for every YouTube response.
+
+The fastest installed backend is used by default: orjson, then msgspec, then the standard library json module.
+All backends return the same Python objects (dict, list, str, int, float, bool, None).
+'''
+
+jsonBackends = ['auto', 'orjson', 'msgspec', 'json']
+
+_decoders = {'json': json.loads}
+if isOrjsonInstalled:
+    _decoders['orjson'] = orjson.loads
+if isMsgspecInstalled:
+    _decoders['msgspec'] = msgspec.json.Decoder().decode
+
+_backend = None
+_loads = None
+
+
+def setJsonBackend(backend: str = 'auto') -> None:
+    '''Sets the JSON decoder of all the responses.
+
+    Args:
+        backend (str, optional): 'orjson', 'msgspec', 'json' or 'auto' (fastest installed). Defaults to 'auto'.
+    '''
+    global _backend, _loads
+    if backend not in jsonBackends:
+        raise Exception(f'ERROR: Unknown JSON backend {backend}, use one of {jsonBackends}.')
+    if backend == 'auto':
+        backend = next(name for name in ['orjson', 'msgspec', 'json'] if name in _decoders)
+    if backend not in _decoders:
+        raise Exception(f'ERROR: JSON backend {backend} is not installed.')
+    _backend = backend
+    _loads = _decoders[backend]
+
+
+def getJsonBackend() -> str:
+    return _backend
+
+
+def loads(data: Union[str, bytes]) -> Any:
+    '''Decodes a response (bytes, as received, or str) with the selected backend.'''
+    return _loads(data)
+
+
+setJsonBackend()
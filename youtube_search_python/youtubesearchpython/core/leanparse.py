@@ -0,0 +1,46 @@
+'''
+Selective decoding of YouTube responses.
+
+A search response carries large subtrees which are never read: responseContext, estimatedResults, topbar,
+refinements, tracking params. In lean mode only the value of the needed path is decoded: the raw response is
+scanned for the anchor keys of the path (the last keys of the path, each one the first key of its parent), and the
+value following them is decoded by the scanner of the json module, which stops at the end of that value.
+Nothing else of the response is materialized.
+
+An anchor is a list of keys, e.g. ['primaryContents', 'sectionListRenderer', 'contents'] matches
+    "primaryContents": {"sectionListRenderer": {"contents": [...]
+'''
+import json
+import re
+from functools import lru_cache
+from typing import Any, List, Pattern, Union
+
+
+_decoder = json.JSONDecoder()
+
+
+@lru_cache(maxsize=None)
+def _compileAnchor(keys: tuple) -> Pattern:
+    return re.compile(r'\s*:\s*\{\s*'.join(re.escape(json.dumps(key)) for key in keys) + r'\s*:\s*')
+
+
+def selectValue(response: Union[str, bytes], anchor: List[str]) -> Any:
+    '''Decodes only the value following the first occurrence of the anchor keys in a raw response.
+
+    Args:
+        response (Union[str, bytes]): Raw response, as received.
+        anchor (List[str]): Keys leading to the value, each one the first key of its parent object.
+
+    Returns:
+        Any: The decoded value, None if the anchor is not found or is not followed by a valid JSON value.
+    '''
+    if isinstance(response, bytes):
+        response = response.decode('utf-8')
+    match = _compileAnchor(tuple(anchor)).search(response)
+    if match is None:
+        return None
+    try:
+        value, end = _decoder.raw_decode(response, match.end())
+    except ValueError:
+        return None
+    return value
@@ -8,7 +8,9 @@ from urllib.parse import urlencode
 from urllib.request import Request, urlopen
 
 from youtubesearchpython.core.constants import *
+from youtubesearchpython.core.jsonbackend import loads
 from youtubesearchpython.core.requests import RequestCore
+from youtubesearchpython.core.extractor import getValue, extractPlaylistVideo
 
 
 K = TypeVar("K")
@@ -99,13 +101,13 @@ class PlaylistCore(RequestCore):
     def __makeRequest(self) -> int:
         self.prepare_first_request()
         request = self.syncPostRequest()
-        self.response = request.text
+        self.response = request.content
         return request.status_code
     
     async def __makeAsyncRequest(self) -> int:
         self.prepare_first_request()
         request = await self.asyncPostRequest()
-        self.response = request.text
+        self.response = request.content
         return request.status_code
 
     def prepare_next_request(self):
@@ -119,14 +121,14 @@ class PlaylistCore(RequestCore):
     def __makeNextRequest(self) -> int:
         response = self.syncPostRequest()
         try:
-            self.response = response.text
+            self.response = response.content
             return response.status_code
         except:
             raise Exception('ERROR: Could not make request.')
 
     def __parseSource(self) -> None:
         try:
-            self.responseSource = json.loads(self.response)
+            self.responseSource = loads(self.response)
         except:
             raise Exception('ERROR: Could not parse YouTube response.')
 
@@ -140,24 +142,8 @@ class PlaylistCore(RequestCore):
         videos = []
         for video in videorenderer:
             try:
-                video = video["playlistVideoRenderer"]
-                j = {
-                    "id": self.__getValue(video, ["videoId"]),
-                    "thumbnails": self.__getValue(video, ["thumbnail", "thumbnails"]),
-                    "title": self.__getValue(video, ["title", "runs", 0, "text"]),
-                    "channel": {
-                        "name": self.__getValue(video, ["shortBylineText", "runs", 0, "text"]),
-                        "id": self.__getValue(video, ["shortBylineText", "runs", 0, "navigationEndpoint", "browseEndpoint", "browseId"]),
-                        "link": self.__getValue(video, ["shortBylineText", "runs", 0, "navigationEndpoint", "browseEndpoint", "canonicalBaseUrl"]),
-                    },
-                    "duration": self.__getValue(video, ["lengthText", "simpleText"]),
-                    "accessibility": {
-                        "title": self.__getValue(video, ["title", "accessibility", "accessibilityData", "label"]),
-                        "duration": self.__getValue(video, ["lengthText", "accessibility", "accessibilityData", "label"]),
-                    },
-                    "link": "https://www.youtube.com" + self.__getValue(video, ["navigationEndpoint", "commandMetadata", "webCommandMetadata", "url"]),
-                    "isPlayable": self.__getValue(video, ["isPlayable"]),
-                }
+                j = extractPlaylistVideo(video["playlistVideoRenderer"])
+                j["link"] = "https://www.youtube.com" + j["link"]
                 videos.append(j)
             except:
                 pass
@@ -310,21 +296,7 @@ class PlaylistCore(RequestCore):
             return json.dumps(self.playlistComponent, indent=4)
 
     def __getValue(self, source: dict, path: Iterable[str]) -> Union[str, int, dict, None]:
-        value = source
-        for key in path:
-            if type(key) is str:
-                if key in value.keys():
-                    value = value[key]
-                else:
-                    value = None
-                    break
-            elif type(key) is int:
-                if len(value) != 0:
-                    value = value[key]
-                else:
-                    value = None
-                    break
-        return value
+        return getValue(source, path)
 
     def __getAllWithKey(self, source: Iterable[Mapping[K, T]], key: K) -> Iterable[T]:
         for item in source:
@@ -0,0 +1,291 @@
+'''
+Compact result records.
+
+A record stores the fields of a video, channel, playlist or comment in __slots__, without the nested dicts of the
+components: thumbnails are kept as tuples of (url, width, height), text runs as tuples of their texts, and the links
+are built from the ids when read.
+`to_dict()` gives the same dict as the component of the handlers, `to_json()` its JSON, both built on demand.
+
+Records are built directly from the renderers by compiled extractors (see core/extractor.py).
+'''
+import json
+from typing import Any, List, Optional, Tuple, Union
+
+from youtubesearchpython.core.extractor import compileRecord
+
+
+_thumbnailKeys = {'url', 'width', 'height'}
+
+
+def _pack(thumbnails: Optional[List[dict]]) -> Union[Tuple[tuple, ...], List[dict], None]:
+    # thumbnails with other keys than url, width and height are kept as they are
+    if thumbnails is None:
+        return None
+    packed = []
+    for thumbnail in thumbnails:
+        if thumbnail.keys() != _thumbnailKeys:
+            return thumbnails
+        packed.append((thumbnail['url'], thumbnail['width'], thumbnail['height']))
+    return tuple(packed)
+
+
+def _unpack(thumbnails: Union[Tuple[tuple, ...], List[dict], None]) -> Optional[List[dict]]:
+    if not isinstance(thumbnails, tuple):
+        return thumbnails
+    return [{'url': url, 'width': width, 'height': height} for url, width, height in thumbnails]
+
+
+def _packOne(thumbnail: Optional[dict]) -> Union[tuple, dict, None]:
+    if thumbnail is None or thumbnail.keys() != _thumbnailKeys:
+        return thumbnail
+    return (thumbnail['url'], thumbnail['width'], thumbnail['height'])
+
+
+def _unpackOne(thumbnail: Union[tuple, dict, None]) -> Optional[dict]:
+    if not isinstance(thumbnail, tuple):
+        return thumbnail
+    url, width, height = thumbnail
+    return {'url': url, 'width': width, 'height': height}
+
+
+def _packRuns(runs: Optional[List[dict]]) -> Union[Tuple[str, ...], List[dict], None]:
+    # runs with formatting (bold, links...) are kept as they are
+    if runs is None:
+        return None
+    packed = []
+    for run in runs:
+        if len(run) != 1 or 'text' not in run:
+            return runs
+        packed.append(run['text'])
+    return tuple(packed)
+
+
+def _unpackRuns(runs: Union[Tuple[str, ...], List[dict], None]) -> Optional[List[dict]]:
+    if not isinstance(runs, tuple):
+        return runs
+    return [{'text': text} for text in runs]
+
+
+def _link(prefix: str, id: Optional[str]) -> Optional[str]:
+    return prefix + id if id is not None else None
+
+
+class Record:
+    '''Base of the records. `fields` are the fields (core/extractor.py) stored in the slots, in the same order,
+    `views` the functions giving the dict view of the packed slots.'''
+    __slots__ = ()
+    fields = ()
+    views = {}
+
+    def to_dict(self) -> dict:
+        raise NotImplementedError
+
+    def to_json(self, indent: Optional[int] = None) -> str:
+        return json.dumps(self.to_dict(), indent=indent)
+
+    def get(self, key: str, default: Any = None) -> Any:
+        '''Value of a key of the dict view ('id', 'viewCount', 'channel'...), or of a nested field ('channel.id').'''
+        if key in self.fields:
+            name = self.__slots__[self.fields.index(key)]
+            value = getattr(self, name)
+            if name in self.views:
+                value = self.views[name](value)
+        elif isinstance(getattr(type(self), key, None), property):
+            value = getattr(self, key)
+        else:
+            return self.to_dict().get(key, default)
+        return default if value is None else value
+
+    def __eq__(self, other: Any) -> bool:
+        return type(self) is type(other) and all(getattr(self, name) == getattr(other, name) for name in self.__slots__)
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({', '.join(f'{name}={getattr(self, name)!r}' for name in self.__slots__)})"
+
+
+class VideoRecord(Record):
+    __slots__ = ('id', 'title', 'publishedTime', 'duration', 'viewCountText', 'viewCountShort', 'thumbnails',
+                 'richThumbnail', 'descriptionSnippet', 'channelName', 'channelId', 'channelThumbnails',
+                 'accessibilityTitle', 'accessibilityDuration', 'shelfTitle')
+    fields = ('id', 'title', 'publishedTime', 'duration', 'viewCount.text', 'viewCount.short', 'thumbnails',
+              'richThumbnail', 'descriptionSnippet', 'channel.name', 'channel.id', 'channel.thumbnails',
+              'accessibility.title', 'accessibility.duration', 'shelfTitle')
+    views = {'thumbnails': _unpack, 'richThumbnail': _unpackOne, 'descriptionSnippet': _unpackRuns, 'channelThumbnails': _unpack}
+
+    def __init__(self, id, title, publishedTime, duration, viewCountText, viewCountShort, thumbnails, richThumbnail,
+                 descriptionSnippet, channelName, channelId, channelThumbnails, accessibilityTitle,
+                 accessibilityDuration, shelfTitle=None):
+        self.id = id
+        self.title = title
+        self.publishedTime = publishedTime
+        self.duration = duration
+        self.viewCountText = viewCountText
+        self.viewCountShort = viewCountShort
+        self.thumbnails = _pack(thumbnails)
+        self.richThumbnail = _packOne(richThumbnail)
+        self.descriptionSnippet = _packRuns(descriptionSnippet)
+        self.channelName = channelName
+        self.channelId = channelId
+        self.channelThumbnails = _pack(channelThumbnails)
+        self.accessibilityTitle = accessibilityTitle
+        self.accessibilityDuration = accessibilityDuration
+        self.shelfTitle = shelfTitle
+
+    @property
+    def link(self) -> Optional[str]:
+        return _link('https://www.youtube.com/watch?v=', self.id)
+
+    @property
+    def channelLink(self) -> Optional[str]:
+        return _link('https://www.youtube.com/channel/', self.channelId)
+
+    def to_dict(self) -> dict:
+        return {
+            'type': 'video',
+            'id': self.id,
+            'title': self.title,
+            'publishedTime': self.publishedTime,
+            'duration': self.duration,
+            'viewCount': {
+                'text': self.viewCountText,
+                'short': self.viewCountShort,
+            },
+            'thumbnails': _unpack(self.thumbnails),
+            'richThumbnail': _unpackOne(self.richThumbnail),
+            'descriptionSnippet': _unpackRuns(self.descriptionSnippet),
+            'channel': {
+                'name': self.channelName,
+                'id': self.channelId,
+                'thumbnails': _unpack(self.channelThumbnails),
+                'link': self.channelLink,
+            },
+            'accessibility': {
+                'title': self.accessibilityTitle,
+                'duration': self.accessibilityDuration,
+            },
+            'link': self.link,
+            'shelfTitle': self.shelfTitle,
+        }
+
+
+class ChannelRecord(Record):
+    __slots__ = ('id', 'title', 'thumbnails', 'videoCount', 'descriptionSnippet', 'subscribers')
+    fields = ('id', 'title', 'thumbnails', 'videoCount', 'descriptionSnippet', 'subscribers')
+    views = {'thumbnails': _unpack, 'descriptionSnippet': _unpackRuns}
+
+    def __init__(self, id, title, thumbnails, videoCount, descriptionSnippet, subscribers):
+        self.id = id
+        self.title = title
+        self.thumbnails = _pack(thumbnails)
+        self.videoCount = videoCount
+        self.descriptionSnippet = _packRuns(descriptionSnippet)
+        self.subscribers = subscribers
+
+    @property
+    def link(self) -> Optional[str]:
+        return _link('https://www.youtube.com/channel/', self.id)
+
+    def to_dict(self) -> dict:
+        return {
+            'type': 'channel',
+            'id': self.id,
+            'title': self.title,
+            'thumbnails': _unpack(self.thumbnails),
+            'videoCount': self.videoCount,
+            'descriptionSnippet': _unpackRuns(self.descriptionSnippet),
+            'subscribers': self.subscribers,
+            'link': self.link,
+        }
+
+
+class PlaylistRecord(Record):
+    __slots__ = ('id', 'title', 'videoCount', 'channelName', 'channelId', 'thumbnails')
+    fields = ('id', 'title', 'videoCount', 'channel.name', 'channel.id', 'thumbnails')
+    views = {'thumbnails': _unpack}
+
+    def __init__(self, id, title, videoCount, channelName, channelId, thumbnails):
+        self.id = id
+        self.title = title
+        self.videoCount = videoCount
+        self.channelName = channelName
+        self.channelId = channelId
+        self.thumbnails = _pack(thumbnails)
+
+    @property
+    def link(self) -> Optional[str]:
+        return _link('https://www.youtube.com/playlist?list=', self.id)
+
+    @property
+    def channelLink(self) -> Optional[str]:
+        return _link('https://www.youtube.com/channel/', self.channelId)
+
+    def to_dict(self) -> dict:
+        return {
+            'type': 'playlist',
+            'id': self.id,
+            'title': self.title,
+            'videoCount': self.videoCount,
+            'channel': {
+                'name': self.channelName,
+                'id': self.channelId,
+                'link': self.channelLink,
+            },
+            'thumbnails': _unpack(self.thumbnails),
+            'link': self.link,
+        }
+
+
+class CommentRecord(Record):
+    __slots__ = ('id', 'authorId', 'authorName', 'authorThumbnails', 'content', 'published', 'isLiked',
+                 'authorIsChannelOwner', 'voteStatus', 'votesSimpleText', 'votesLabel', 'replyCount')
+    fields = ('id', 'author.id', 'author.name', 'author.thumbnails', 'content', 'published', 'isLiked',
+              'authorIsChannelOwner', 'voteStatus', 'votes.simpleText', 'votes.label', 'replyCount')
+    views = {'authorThumbnails': _unpack}
+
+    def __init__(self, id, authorId, authorName, authorThumbnails, content, published, isLiked, authorIsChannelOwner,
+                 voteStatus, votesSimpleText, votesLabel, replyCount):
+        self.id = id
+        self.authorId = authorId
+        self.authorName = authorName
+        self.authorThumbnails = _pack(authorThumbnails)
+        self.content = content
+        self.published = published
+        self.isLiked = isLiked
+        self.authorIsChannelOwner = authorIsChannelOwner
+        self.voteStatus = voteStatus
+        self.votesSimpleText = votesSimpleText
+        self.votesLabel = votesLabel
+        self.replyCount = replyCount
+
+    def to_dict(self) -> dict:
+        return {
+            'id': self.id,
+            'author': {
+                'id': self.authorId,
+                'name': self.authorName,
+                'thumbnails': _unpack(self.authorThumbnails),
+            },
+            'content': self.content,
+            'published': self.published,
+            'isLiked': self.isLiked,
+            'authorIsChannelOwner': self.authorIsChannelOwner,
+            'voteStatus': self.voteStatus,
+            'votes': {
+                'simpleText': self.votesSimpleText,
+                'label': self.votesLabel,
+            },
+            'replyCount': self.replyCount,
+        }
+
+
+def toDict(value: Any) -> Any:
+    '''`default` of json.dumps for results holding records.'''
+    if isinstance(value, Record):
+        return value.to_dict()
+    raise TypeError(f'Object of type {type(value).__name__} is not JSON serializable')
+
+
+extractVideoRecord = compileRecord(VideoRecord, 'video')
+extractChannelRecord = compileRecord(ChannelRecord, 'channel')
+extractPlaylistRecord = compileRecord(PlaylistRecord, 'playlist')
+extractCommentRecord = compileRecord(CommentRecord, 'comment')
@@ -1,8 +1,245 @@
-import httpx
+import asyncio
 import os
+import socket
+import threading
+import time
+from http.cookiejar import CookieJar, DefaultCookiePolicy
+from typing import Dict, Optional, Tuple
+
+import httpx
 
 from youtubesearchpython.core.constants import userAgent
 
+
+retryStatusCodes = (429, 500, 502, 503, 504)
+
+
+class TransportMetrics:
+    '''Counters collected by `ClientPool` for every request made by the package.'''
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self) -> None:
+        with self._lock:
+            self.requests = 0
+            self.retries = 0
+            self.errors = 0
+            self.bytesReceived = 0
+            self.elapsed = 0.0
+
+    def record(self, elapsed: float, response: Optional[httpx.Response] = None, retried: bool = False) -> None:
+        with self._lock:
+            self.requests += 1
+            self.elapsed += elapsed
+            if retried:
+                self.retries += 1
+            if response is None:
+                self.errors += 1
+            else:
+                self.bytesReceived += len(response.content)
+
+    def snapshot(self) -> dict:
+        with self._lock:
+            return {
+                'requests': self.requests,
+                'retries': self.retries,
+                'errors': self.errors,
+                'bytesReceived': self.bytesReceived,
+                'elapsed': self.elapsed,
+            }
+
+
+class ClientPool:
+    '''Process-wide pool of keep-alive httpx clients shared by every `RequestCore`.
+
+    One client is kept per proxy configuration (and, for async clients, per event loop), so
+    consecutive requests to www.youtube.com reuse established TCP/TLS connections instead of
+    performing a new handshake for every page.
+
+    Every request of the package goes through `request` / `arequest`, which retry failed
+    requests and update `metrics`.
+
+    Args:
+        maxConnections (int, optional): Maximum number of concurrent connections. Defaults to 100.
+        maxKeepaliveConnections (int, optional): Maximum number of idle connections kept open. Defaults to 20.
+        keepaliveExpiry (float, optional): Seconds an idle connection is kept open. Defaults to 30.
+        retries (int, optional): Number of retries on connection errors and 429/5xx responses. Defaults to 0.
+        backoffFactor (float, optional): Retry `n` waits `backoffFactor * 2 ** n` seconds. Defaults to 0.5.
+
+    Examples:
+        Clients are created lazily on the first request, closing the pool releases the sockets.
+
+        >>> clientPool.setLimits(maxConnections = 50, maxKeepaliveConnections = 50)
+        >>> with clientPool:
+        ...     search = VideosSearch('NoCopyrightSounds')
+
+        >>> async with clientPool:
+        ...     result = await VideosSearch('NoCopyrightSounds').next()
+    '''
+
+    def __init__(self, maxConnections: int = 100, maxKeepaliveConnections: int = 20, keepaliveExpiry: float = 30.0, retries: int = 0, backoffFactor: float = 0.5):
+        self.limits = httpx.Limits(
+            max_connections=maxConnections,
+            max_keepalive_connections=maxKeepaliveConnections,
+            keepalive_expiry=keepaliveExpiry,
+        )
+        self._syncClients: Dict[Tuple, httpx.Client] = {}
+        self._asyncClients: Dict[Tuple, Tuple[asyncio.AbstractEventLoop, httpx.AsyncClient]] = {}
+        self._lock = threading.Lock()
+        self._pid = os.getpid()
+        self.retries = retries
+        self.backoffFactor = backoffFactor
+        self.metrics = TransportMetrics()
+
+    def setRetries(self, retries: int, backoffFactor: Optional[float] = None) -> None:
+        '''Changes the number of retries (and optionally the backoff factor) for every subsequent request.'''
+        self.retries = retries
+        if backoffFactor is not None:
+            self.backoffFactor = backoffFactor
+
+    def setLimits(self, maxConnections: Optional[int] = None, maxKeepaliveConnections: Optional[int] = None, keepaliveExpiry: Optional[float] = None) -> None:
+        '''Changes the pool limits. Open clients are closed (see `close`) so that the new limits take effect on the next request.'''
+        self.limits = httpx.Limits(
+            max_connections=self.limits.max_connections if maxConnections is None else maxConnections,
+            max_keepalive_connections=self.limits.max_keepalive_connections if maxKeepaliveConnections is None else maxKeepaliveConnections,
+            keepalive_expiry=self.limits.keepalive_expiry if keepaliveExpiry is None else keepaliveExpiry,
+        )
+        self.close()
+
+    def _clientOptions(self, proxy: dict) -> dict:
+        # Cookies set by YouTube are not persisted between requests, every request starts with a clean jar
+        # exactly like the former one-shot `httpx.post` / `httpx.get` calls did.
+        return {
+            'limits': self.limits,
+            'proxies': dict(proxy) or None,
+            'cookies': CookieJar(policy=DefaultCookiePolicy(allowed_domains=[])),
+        }
+
+    def _checkFork(self) -> None:
+        # Sockets must not be shared with a forked worker (e.g. joblib / multiprocessing), start from scratch there.
+        if self._pid != os.getpid():
+            self._pid = os.getpid()
+            self._lock = threading.Lock()
+            self._syncClients = {}
+            self._asyncClients = {}
+
+    def getSyncClient(self, proxy: dict) -> httpx.Client:
+        self._checkFork()
+        key = tuple(sorted(proxy.items()))
+        with self._lock:
+            client = self._syncClients.get(key)
+            if client is None or client.is_closed:
+                client = httpx.Client(**self._clientOptions(proxy))
+                self._syncClients[key] = client
+            return client
+
+    def getAsyncClient(self, proxy: dict) -> httpx.AsyncClient:
+        self._checkFork()
+        loop = asyncio.get_running_loop()
+        key = (id(loop),) + tuple(sorted(proxy.items()))
+        with self._lock:
+            entry = self._asyncClients.get(key)
+            if entry is None or entry[0] is not loop or entry[1].is_closed:
+                entry = (loop, httpx.AsyncClient(**self._clientOptions(proxy)))
+                self._asyncClients[key] = entry
+            return entry[1]
+
+    def request(self, method: str, url: str, proxy: dict, **kwargs) -> httpx.Response:
+        '''Sends a request through the pooled sync client, retrying on connection errors and 429/5xx responses.'''
+        client = self.getSyncClient(proxy)
+        for attempt in range(self.retries + 1):
+            start = time.perf_counter()
+            try:
+                response = client.request(method, url, **kwargs)
+            except httpx.TransportError:
+                self.metrics.record(time.perf_counter() - start, retried=attempt > 0)
+                if attempt == self.retries:
+                    raise
+            else:
+                self.metrics.record(time.perf_counter() - start, response, retried=attempt > 0)
+                if response.status_code not in retryStatusCodes or attempt == self.retries:
+                    return response
+            time.sleep(self.backoffFactor * 2 ** attempt)
+
+    async def arequest(self, method: str, url: str, proxy: dict, **kwargs) -> httpx.Response:
+        '''Async counterpart of `request`, using the pooled async client of the running event loop.'''
+        client = self.getAsyncClient(proxy)
+        for attempt in range(self.retries + 1):
+            start = time.perf_counter()
+            try:
+                response = await client.request(method, url, **kwargs)
+            except httpx.TransportError:
+                self.metrics.record(time.perf_counter() - start, retried=attempt > 0)
+                if attempt == self.retries:
+                    raise
+            else:
+                self.metrics.record(time.perf_counter() - start, response, retried=attempt > 0)
+                if response.status_code not in retryStatusCodes or attempt == self.retries:
+                    return response
+            await asyncio.sleep(self.backoffFactor * 2 ** attempt)
+
+    def close(self) -> None:
+        '''Closes every client of the pool.
+
+        Async clients are closed on their event loop: a running loop closes them in a task (`aclose` awaits them instead).
+        The connections of an async client whose loop is stopped or closed can not be closed gracefully, their sockets
+        are shut down and the client is dropped.
+        '''
+        with self._lock:
+            syncClients = list(self._syncClients.values())
+            asyncClients = list(self._asyncClients.values())
+            self._syncClients = {}
+            self._asyncClients = {}
+        for client in syncClients:
+            client.close()
+        for loop, client in asyncClients:
+            if loop.is_running():
+                asyncio.run_coroutine_threadsafe(client.aclose(), loop)
+            else:
+                self._shutdownConnections(client)
+
+    @staticmethod
+    def _shutdownConnections(client: httpx.AsyncClient) -> None:
+        # Closing an async connection needs its event loop: shutting the socket down releases the connection
+        # (the peer sees it closed), the file descriptor is released when the client is garbage collected.
+        for transport in [client._transport] + list(client._mounts.values()):
+            for connection in getattr(getattr(transport, '_pool', None), 'connections', ()):
+                stream = getattr(getattr(connection, '_connection', None), '_network_stream', None)
+                sock = stream.get_extra_info('socket') if stream is not None else None
+                if sock is not None:
+                    try:
+                        sock.shutdown(socket.SHUT_RDWR)
+                    except OSError:
+                        pass
+
+    async def aclose(self) -> None:
+        '''Closes every client of the pool, the async clients bound to the running event loop are awaited.'''
+        loop = asyncio.get_running_loop()
+        with self._lock:
+            asyncClients = [entry[1] for entry in self._asyncClients.values() if entry[0] is loop]
+            self._asyncClients = {key: entry for key, entry in self._asyncClients.items() if entry[0] is not loop}
+        for client in asyncClients:
+            await client.aclose()
+        self.close()
+
+    def __enter__(self) -> 'ClientPool':
+        return self
+
+    def __exit__(self, *args) -> None:
+        self.close()
+
+    async def __aenter__(self) -> 'ClientPool':
+        return self
+
+    async def __aexit__(self, *args) -> None:
+        await self.aclose()
+
+
+clientPool = ClientPool()
+
+
 class RequestCore:
     def __init__(self):
         self.url = None
@@ -17,23 +254,13 @@ class RequestCore:
             self.proxy["https://"] = https_proxy
 
     def syncPostRequest(self) -> httpx.Response:
-        return httpx.post(
-            self.url,
-            headers={"User-Agent": userAgent},
-            json=self.data,
-            timeout=self.timeout,
-            proxies=self.proxy
-        )
+        return clientPool.request('POST', self.url, self.proxy, headers={"User-Agent": userAgent}, json=self.data, timeout=self.timeout)
 
     async def asyncPostRequest(self) -> httpx.Response:
-        async with httpx.AsyncClient(proxies=self.proxy) as client:
-            r = await client.post(self.url, headers={"User-Agent": userAgent}, json=self.data, timeout=self.timeout)
-            return r
+        return await clientPool.arequest('POST', self.url, self.proxy, headers={"User-Agent": userAgent}, json=self.data, timeout=self.timeout)
 
     def syncGetRequest(self) -> httpx.Response:
-        return httpx.get(self.url, headers={"User-Agent": userAgent}, timeout=self.timeout, cookies={'CONSENT': 'YES+1'}, proxies=self.proxy)
+        return clientPool.request('GET', self.url, self.proxy, headers={"User-Agent": userAgent, "Cookie": "CONSENT=YES+1"}, timeout=self.timeout)
 
     async def asyncGetRequest(self) -> httpx.Response:
-        async with httpx.AsyncClient(proxies=self.proxy) as client:
-            r = await client.get(self.url, headers={"User-Agent": userAgent}, timeout=self.timeout, cookies={'CONSENT': 'YES+1'})
-            return r
+        return await clientPool.arequest('GET', self.url, self.proxy, headers={"User-Agent": userAgent, "Cookie": "CONSENT=YES+1"}, timeout=self.timeout)
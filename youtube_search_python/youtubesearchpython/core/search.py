@@ -1,11 +1,13 @@
 import copy
-from typing import Union
+from typing import List, Union
 from urllib.parse import urlencode
 
 from youtubesearchpython.core.requests import RequestCore
 from youtubesearchpython.handlers.componenthandler import ComponentHandler
 from youtubesearchpython.handlers.requesthandler import RequestHandler
 from youtubesearchpython.core.constants import *
+from youtubesearchpython.core.extractor import checkFields
+from youtubesearchpython.core.records import toDict
 
 import json
 
@@ -15,7 +17,7 @@ class SearchCore(RequestCore, RequestHandler, ComponentHandler):
     responseSource = None
     resultComponents = []
 
-    def __init__(self, query: str, limit: int, language: str, region: str, searchPreferences: str, timeout: int):
+    def __init__(self, query: str, limit: int, language: str, region: str, searchPreferences: str, timeout: int, lean: bool = False, fields: List[str] = None, records: bool = False):
         super().__init__()
         self.query = query
         self.limit = limit
@@ -23,6 +25,13 @@ class SearchCore(RequestCore, RequestHandler, ComponentHandler):
         self.region = region
         self.searchPreferences = searchPreferences
         self.timeout = timeout
+        self.lean = lean
+        if fields:
+            if records:
+                raise Exception('ERROR: fields and records can not be used together.')
+            checkFields(fields)
+            self.fields = tuple(fields)
+        self.records = records
         self.continuationKey = None
 
     def sync_create(self):
@@ -50,7 +59,7 @@ class SearchCore(RequestCore, RequestHandler, ComponentHandler):
         self._getRequestBody()
         request = self.syncPostRequest()
         try:
-            self.response = request.text
+            self.response = request.content
         except:
             raise Exception('ERROR: Could not make request.')
 
@@ -58,7 +67,7 @@ class SearchCore(RequestCore, RequestHandler, ComponentHandler):
         self._getRequestBody()
         request = await self.asyncPostRequest()
         try:
-            self.response = request.text
+            self.response = request.content
         except:
             raise Exception('ERROR: Could not make request.')
 
@@ -72,7 +81,7 @@ class SearchCore(RequestCore, RequestHandler, ComponentHandler):
             Union[str, dict]: Returns JSON or dictionary.
         '''
         if mode == ResultMode.json:
-            return json.dumps({'result': self.resultComponents}, indent=4)
+            return json.dumps({'result': self.resultComponents}, indent=4, default=toDict)
         elif mode == ResultMode.dict:
             return {'result': self.resultComponents}
 
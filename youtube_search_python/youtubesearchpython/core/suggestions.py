@@ -6,6 +6,7 @@ from urllib.request import Request, urlopen
 import httpx
 
 from youtubesearchpython.core.constants import ResultMode, userAgent
+from youtubesearchpython.core.jsonbackend import loads
 from youtubesearchpython.core.requests import RequestCore
 
 
@@ -89,7 +90,7 @@ class SuggestionsCore(RequestCore):
 
     def __parseSource(self) -> None:
         try:
-            self.responseSource = json.loads(self.response[self.response.index('(') + 1: self.response.index(')')])
+            self.responseSource = loads(self.response[self.response.index('(') + 1: self.response.index(')')])
         except:
             raise Exception('ERROR: Could not parse YouTube response.')
 
@@ -4,6 +4,7 @@ from typing import Union, List
 from urllib.parse import urlencode
 
 from youtubesearchpython.core.constants import *
+from youtubesearchpython.core.jsonbackend import loads
 from youtubesearchpython.core.requests import RequestCore
 from youtubesearchpython.core.componenthandler import getValue, getVideoId
 
@@ -24,7 +25,7 @@ class TranscriptCore(RequestCore):
         self.data["videoId"] = getVideoId(self.videoLink)
 
     def extract_continuation_key(self, r):
-        j = r.json()
+        j = loads(r.content)
         panels = getValue(j, ["engagementPanels"])
         if not panels:
             raise Exception("Failed to create first request - No engagementPanels is present.")
@@ -60,7 +61,7 @@ class TranscriptCore(RequestCore):
         }
     
     def extract_transcript(self):
-        response = self.data.json()
+        response = loads(self.data.content)
         transcripts = getValue(response, ["actions", 0, "updateEngagementPanelAction", "content", "transcriptRenderer", "content", "transcriptSearchPanelRenderer", "body", "transcriptSegmentListRenderer", "initialSegments"])
         segments = []
         languages = []
@@ -4,6 +4,7 @@ from typing import Union, List
 from urllib.parse import urlencode
 
 from youtubesearchpython.core.constants import *
+from youtubesearchpython.core.jsonbackend import loads
 from youtubesearchpython.core.requests import RequestCore
 from youtubesearchpython.core.componenthandler import getValue, getVideoId
 
@@ -84,7 +85,7 @@ class VideoCore(RequestCore):
     async def async_create(self):
         self.prepare_innertube_request()
         response = await self.asyncPostRequest()
-        self.response = response.text
+        self.response = response.content
         if response.status_code == 200:
             self.post_request_processing()
         else:
@@ -93,7 +94,7 @@ class VideoCore(RequestCore):
     def sync_create(self):
         self.prepare_innertube_request()
         response = self.syncPostRequest()
-        self.response = response.text
+        self.response = response.content
         if response.status_code == 200:
             self.post_request_processing()
         else:
@@ -111,16 +112,16 @@ class VideoCore(RequestCore):
     def sync_html_create(self):
         self.prepare_html_request()
         response = self.syncPostRequest()
-        self.HTMLresponseSource = response.json()
+        self.HTMLresponseSource = loads(response.content)
 
     async def async_html_create(self):
         self.prepare_html_request()
         response = await self.asyncPostRequest()
-        self.HTMLresponseSource = response.json()
+        self.HTMLresponseSource = loads(response.content)
 
     def __parseSource(self) -> None:
         try:
-            self.responseSource = json.loads(self.response)
+            self.responseSource = loads(self.response)
         except Exception as e:
             raise Exception('ERROR: Could not parse YouTube response.')
 
@@ -1802,9 +1802,9 @@ class Comments:
     comments = []
     hasMoreComments = False
 
-    def __init__(self, playlistLink: str, timeout: int = None):
+    def __init__(self, playlistLink: str, timeout: int = None, records: bool = False):
         self.timeout = timeout
-        self.__comments = CommentsCore(playlistLink)
+        self.__comments = CommentsCore(playlistLink, records)
         self.__comments.sync_create()
         self.comments = self.__comments.commentsComponent
         self.hasMoreComments = self.__comments.continuationKey is not None
@@ -1815,8 +1815,8 @@ class Comments:
         self.hasMoreComments = self.__comments.continuationKey is not None
 
     @staticmethod
-    def get(playlistLink: str) -> Union[dict, str, None]:
-        pc = CommentsCore(playlistLink)
+    def get(playlistLink: str, records: bool = False) -> Union[dict, str, None]:
+        pc = CommentsCore(playlistLink, records)
         pc.sync_create()
         return pc.commentsComponent
 
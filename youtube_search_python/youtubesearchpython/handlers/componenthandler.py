@@ -1,65 +1,46 @@
 from typing import List, Union
 from youtubesearchpython.core.constants import *
+from youtubesearchpython.core.extractor import getValue, extractVideo, extractChannel, extractPlaylist, extractShelf, compileProjection
+from youtubesearchpython.core.records import extractVideoRecord, extractChannelRecord, extractPlaylistRecord
 
 
 class ComponentHandler:
+    ''' Projection of the components on these fields (see core/extractor.py), full components if None. '''
+    fields = None
+    ''' Compact records (core/records.py) instead of the component dicts. '''
+    records = False
+
     def _getVideoComponent(self, element: dict, shelfTitle: str = None) -> dict:
-        video = element[videoElementKey]
-        component = {
-            'type':                           'video',
-            'id':                              self._getValue(video, ['videoId']),
-            'title':                           self._getValue(video, ['title', 'runs', 0, 'text']),
-            'publishedTime':                   self._getValue(video, ['publishedTimeText', 'simpleText']),
-            'duration':                        self._getValue(video, ['lengthText', 'simpleText']),
-            'viewCount': {
-                'text':                        self._getValue(video, ['viewCountText', 'simpleText']),
-                'short':                       self._getValue(video, ['shortViewCountText', 'simpleText']),
-            },
-            'thumbnails':                      self._getValue(video, ['thumbnail', 'thumbnails']),
-            'richThumbnail':                   self._getValue(video, ['richThumbnail', 'movingThumbnailRenderer', 'movingThumbnailDetails', 'thumbnails', 0]),
-            'descriptionSnippet':              self._getValue(video, ['detailedMetadataSnippets', 0, 'snippetText', 'runs']),
-            'channel': {
-                'name':                        self._getValue(video, ['ownerText', 'runs', 0, 'text']),
-                'id':                          self._getValue(video, ['ownerText', 'runs', 0, 'navigationEndpoint', 'browseEndpoint', 'browseId']),
-                'thumbnails':                  self._getValue(video, ['channelThumbnailSupportedRenderers', 'channelThumbnailWithLinkRenderer', 'thumbnail', 'thumbnails']),
-            },
-            'accessibility': {
-                'title':                       self._getValue(video, ['title', 'accessibility', 'accessibilityData', 'label']),
-                'duration':                    self._getValue(video, ['lengthText', 'accessibility', 'accessibilityData', 'label']),
-            },
-        }
+        if self.records:
+            record = extractVideoRecord(element[videoElementKey])
+            record.shelfTitle = shelfTitle
+            return record
+        if self.fields is not None:
+            component = compileProjection('video', self.fields)(element[videoElementKey])
+            if 'shelfTitle' in component:
+                component['shelfTitle'] = shelfTitle
+            return component
+        component = extractVideo(element[videoElementKey])
         component['link'] = 'https://www.youtube.com/watch?v=' + component['id']
         component['channel']['link'] = 'https://www.youtube.com/channel/' + component['channel']['id']
         component['shelfTitle'] = shelfTitle
         return component
 
     def _getChannelComponent(self, element: dict) -> dict:
-        channel = element[channelElementKey]
-        component = {
-            'type':                           'channel',
-            'id':                              self._getValue(channel, ['channelId']),
-            'title':                           self._getValue(channel, ['title', 'simpleText']),
-            'thumbnails':                      self._getValue(channel, ['thumbnail', 'thumbnails']),
-            'videoCount':                      self._getValue(channel, ['videoCountText', 'runs', 0, 'text']),
-            'descriptionSnippet':              self._getValue(channel, ['descriptionSnippet', 'runs']),
-            'subscribers':                     self._getValue(channel, ['subscriberCountText', 'simpleText']),
-        }
+        if self.records:
+            return extractChannelRecord(element[channelElementKey])
+        if self.fields is not None:
+            return compileProjection('channel', self.fields)(element[channelElementKey])
+        component = extractChannel(element[channelElementKey])
         component['link'] = 'https://www.youtube.com/channel/' + component['id']
         return component
 
     def _getPlaylistComponent(self, element: dict) -> dict:
-        playlist = element[playlistElementKey]
-        component = {
-            'type':                           'playlist',
-            'id':                             self._getValue(playlist, ['playlistId']),
-            'title':                          self._getValue(playlist, ['title', 'simpleText']),
-            'videoCount':                     self._getValue(playlist, ['videoCount']),
-            'channel': {
-                'name':                       self._getValue(playlist, ['shortBylineText', 'runs', 0, 'text']),
-                'id':                         self._getValue(playlist, ['shortBylineText', 'runs', 0, 'navigationEndpoint', 'browseEndpoint', 'browseId']),
-            },
-            'thumbnails':                     self._getValue(playlist, ['thumbnailRenderer', 'playlistVideoThumbnailRenderer', 'thumbnail', 'thumbnails']),
-        }
+        if self.records:
+            return extractPlaylistRecord(element[playlistElementKey])
+        if self.fields is not None:
+            return compileProjection('playlist', self.fields)(element[playlistElementKey])
+        component = extractPlaylist(element[playlistElementKey])
         component['link'] = 'https://www.youtube.com/playlist?list=' + component['id']
         component['channel']['link'] = 'https://www.youtube.com/channel/' + component['channel']['id']
         return component
@@ -159,25 +140,7 @@ class ComponentHandler:
         return channelsearch
 
     def _getShelfComponent(self, element: dict) -> dict:
-        shelf = element[shelfElementKey]
-        return {
-            'title':                           self._getValue(shelf, ['title', 'simpleText']),
-            'elements':                        self._getValue(shelf, ['content', 'verticalListRenderer', 'items']),
-        }
+        return extractShelf(element[shelfElementKey])
 
     def _getValue(self, source: dict, path: List[str]) -> Union[str, int, dict, None]:
-        value = source
-        for key in path:
-            if type(key) is str:
-                if key in value.keys():
-                    value = value[key]
-                else:
-                    value = None
-                    break
-            elif type(key) is int:
-                if len(value) != 0:
-                    value = value[key]
-                else:
-                    value = None
-                    break
-        return value
+        return getValue(source, path)
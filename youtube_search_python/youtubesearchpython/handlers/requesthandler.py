@@ -1,12 +1,15 @@
-from urllib.request import Request, urlopen
 from urllib.parse import urlencode
-import json
 import copy
 from youtubesearchpython.handlers.componenthandler import ComponentHandler
 from youtubesearchpython.core.constants import *
+from youtubesearchpython.core.jsonbackend import loads
+from youtubesearchpython.core.leanparse import selectValue
 
 
 class RequestHandler(ComponentHandler):
+    '''Search request mixin, expects to be combined with `RequestCore` which provides the shared transport.'''
+    lean = False
+
     def _makeRequest(self) -> None:
         ''' Fixes #47 '''
         requestBody = copy.deepcopy(requestPayload)
@@ -19,29 +22,32 @@ class RequestHandler(ComponentHandler):
             requestBody['params'] = self.searchPreferences
         if self.continuationKey:
             requestBody['continuation'] = self.continuationKey
-        requestBodyBytes = json.dumps(requestBody).encode('utf_8')
-        request = Request(
-            'https://www.youtube.com/youtubei/v1/search' + '?' + urlencode({
-                'key': searchKey,
-            }),
-            data = requestBodyBytes,
-            headers = {
-                'Content-Type': 'application/json; charset=utf-8',
-                'Content-Length': len(requestBodyBytes),
-                'User-Agent': userAgent,
-            }
-        )
+        self.url = 'https://www.youtube.com/youtubei/v1/search' + '?' + urlencode({
+            'key': searchKey,
+        })
+        self.data = requestBody
         try:
-            self.response = urlopen(request, timeout=self.timeout).read().decode('utf_8')
+            response = self.syncPostRequest()
+            response.raise_for_status()
+            self.response = response.content
         except:
             raise Exception('ERROR: Could not make request.')
     
     def _parseSource(self) -> None:
         try:
-            if not self.continuationKey:
-                responseContent = self._getValue(json.loads(self.response), contentPath)
-            else:
-                responseContent = self._getValue(json.loads(self.response), continuationContentPath)
+            # the response is decoded once, the parsed tree is used by every branch
+            # in lean mode, only the items of the content path are decoded (see core/leanparse.py),
+            # the whole response is decoded when their anchor is not found
+            responseJson = None
+            responseContent = None
+            if self.lean:
+                responseContent = selectValue(self.response, continuationContentAnchor if self.continuationKey else contentAnchor)
+            if responseContent is None:
+                responseJson = loads(self.response)
+                if not self.continuationKey:
+                    responseContent = self._getValue(responseJson, contentPath)
+                else:
+                    responseContent = self._getValue(responseJson, continuationContentPath)
             if responseContent:
                 for element in responseContent:
                     if itemSectionKey in element.keys():
@@ -49,7 +55,12 @@ class RequestHandler(ComponentHandler):
                     if continuationItemKey in element.keys():
                         self.continuationKey = self._getValue(element, continuationKeyPath)
             else:
-                self.responseSource = self._getValue(json.loads(self.response), fallbackContentPath)
+                # the fallback anchor is only scanned for when the response is not decoded yet
+                self.responseSource = selectValue(self.response, fallbackContentAnchor) if self.lean and responseJson is None else None
+                if self.responseSource is None:
+                    if responseJson is None:
+                        responseJson = loads(self.response)
+                    self.responseSource = self._getValue(responseJson, fallbackContentPath)
                 self.continuationKey = self._getValue(self.responseSource[-1], continuationKeyPath)
         except:
             raise Exception('ERROR: Could not parse YouTube response.')
@@ -1,8 +1,10 @@
 from typing import List, Union
 import json
+from youtubesearchpython.core.requests import RequestCore
 from youtubesearchpython.handlers.componenthandler import ComponentHandler
 from youtubesearchpython.handlers.requesthandler import RequestHandler
 from youtubesearchpython.core.constants import *
+from youtubesearchpython.core.extractor import compilePath
 
 
 def overrides(interface_class):
@@ -72,28 +74,15 @@ class LegacyComponentHandler(RequestHandler, ComponentHandler):
         }
 
     def __getValue(self, component: dict, path: List[str]) -> Union[str, int, dict]:
-        value = component
-        for key in path:
-            if type(key) is str:
-                if key in value.keys():
-                    value = value[key]
-                else:
-                    value = 'LIVE'
-                    break
-            elif type(key) is int:
-                if len(value) != 0:
-                    value = value[key]
-                else:
-                    value = 'LIVE'
-                    break
-        return value
-
-class LegacySearchInternal(LegacyComponentHandler):
+        return compilePath(path, 'LIVE')(component)
+
+class LegacySearchInternal(RequestCore, LegacyComponentHandler):
     exception = False
     resultComponents = []
     responseSource = []
 
     def __init__(self, keyword, offset, mode, max_results, language, region):
+        super().__init__()
         self.page = offset
         self.query = keyword
         self.mode = mode
@@ -1,3 +1,4 @@
+from typing import List
 from youtubesearchpython.core.constants import *
 from youtubesearchpython.core.search import SearchCore
 from youtubesearchpython.core.channelsearch import ChannelSearchCore
@@ -11,6 +12,9 @@ class Search(SearchCore):
         limit (int, optional): Sets limit to the number of results. Defaults to 20.
         language (str, optional): Sets the result language. Defaults to 'en'.
         region (str, optional): Sets the result region. Defaults to 'US'.
+        lean (bool, optional): Decodes only the result items of the responses instead of the whole responses, lowers the memory and CPU per page of large crawls. Defaults to False.
+        fields (List[str], optional): Extracts only these fields of the results, nested fields joined with dots e.g. ['id', 'title', 'duration', 'link', 'channel.id']. The results are then flat dicts keyed by the field names. Defaults to None, all the fields.
+        records (bool, optional): Returns the results as compact records (`VideoRecord`, `ChannelRecord`, `PlaylistRecord`) with `to_dict()` and `to_json()`, instead of dicts. Defaults to False.
 
     Examples:
         Calling `result` method gives the search result.
@@ -68,9 +72,9 @@ class Search(SearchCore):
             ]
         }
     '''
-    def __init__(self, query: str, limit: int = 20, language: str = 'en', region: str = 'US', timeout: int = None):
+    def __init__(self, query: str, limit: int = 20, language: str = 'en', region: str = 'US', timeout: int = None, lean: bool = False, fields: List[str] = None, records: bool = False):
         self.searchMode = (True, True, True)
-        super().__init__(query, limit, language, region, None, timeout)
+        super().__init__(query, limit, language, region, None, timeout, lean, fields, records)
         self.sync_create()
         self._getComponents(*self.searchMode)
 
@@ -85,6 +89,9 @@ class VideosSearch(SearchCore):
         limit (int, optional): Sets limit to the number of results. Defaults to 20.
         language (str, optional): Sets the result language. Defaults to 'en'.
         region (str, optional): Sets the result region. Defaults to 'US'.
+        lean (bool, optional): Decodes only the result items of the responses instead of the whole responses, lowers the memory and CPU per page of large crawls. Defaults to False.
+        fields (List[str], optional): Extracts only these fields of the results, nested fields joined with dots e.g. ['id', 'title', 'duration', 'link', 'channel.id']. The results are then flat dicts keyed by the field names. Defaults to None, all the fields.
+        records (bool, optional): Returns the results as compact records (`VideoRecord`, `ChannelRecord`, `PlaylistRecord`) with `to_dict()` and `to_json()`, instead of dicts. Defaults to False.
 
     Examples:
         Calling `result` method gives the search result.
@@ -142,9 +149,9 @@ class VideosSearch(SearchCore):
             ]
         }
     '''
-    def __init__(self, query: str, limit: int = 20, language: str = 'en', region: str = 'US', timeout: int = None):
+    def __init__(self, query: str, limit: int = 20, language: str = 'en', region: str = 'US', timeout: int = None, lean: bool = False, fields: List[str] = None, records: bool = False):
         self.searchMode = (True, False, False)
-        super().__init__(query, limit, language, region, SearchMode.videos, timeout)
+        super().__init__(query, limit, language, region, SearchMode.videos, timeout, lean, fields, records)
         self.sync_create()
         self._getComponents(*self.searchMode)
 
@@ -160,6 +167,7 @@ class ChannelsSearch(SearchCore):
         limit (int, optional): Sets limit to the number of results. Defaults to 20.
         language (str, optional): Sets the result language. Defaults to 'en'.
         region (str, optional): Sets the result region. Defaults to 'US'.
+        lean (bool, optional): Decodes only the result items of the responses instead of the whole responses, lowers the memory and CPU per page of large crawls. Defaults to False.
 
     Examples:
         Calling `result` method gives the search result.
@@ -192,9 +200,9 @@ class ChannelsSearch(SearchCore):
             ]
         }
     '''
-    def __init__(self, query: str, limit: int = 20, language: str = 'en', region: str = 'US', timeout: int = None):
+    def __init__(self, query: str, limit: int = 20, language: str = 'en', region: str = 'US', timeout: int = None, lean: bool = False):
         self.searchMode = (False, True, False)
-        super().__init__(query, limit, language, region, SearchMode.channels, timeout)
+        super().__init__(query, limit, language, region, SearchMode.channels, timeout, lean)
         self.sync_create()
         self._getComponents(*self.searchMode)
 
@@ -210,6 +218,7 @@ class PlaylistsSearch(SearchCore):
         limit (int, optional): Sets limit to the number of results. Defaults to 20.
         language (str, optional): Sets the result language. Defaults to 'en'.
         region (str, optional): Sets the result region. Defaults to 'US'.
+        lean (bool, optional): Decodes only the result items of the responses instead of the whole responses, lowers the memory and CPU per page of large crawls. Defaults to False.
 
     Examples:
         Calling `result` method gives the search result.
@@ -255,9 +264,9 @@ class PlaylistsSearch(SearchCore):
             ]
         }
     '''
-    def __init__(self, query: str, limit: int = 20, language: str = 'en', region: str = 'US', timeout: int = None):
+    def __init__(self, query: str, limit: int = 20, language: str = 'en', region: str = 'US', timeout: int = None, lean: bool = False):
         self.searchMode = (False, False, True)
-        super().__init__(query, limit, language, region, SearchMode.playlists, timeout)
+        super().__init__(query, limit, language, region, SearchMode.playlists, timeout, lean)
         self.sync_create()
         self._getComponents(*self.searchMode)
 
@@ -362,6 +371,10 @@ class CustomSearch(SearchCore):
         limit (int, optional): Sets limit to the number of results. Defaults to 20.
         language (str, optional): Sets the result language. Defaults to 'en'.
         region (str, optional): Sets the result region. Defaults to 'US'.
+        continuationKey (str, optional): Resumes a search from the `continuationKey` saved from a previous search, the first request then fetches the following page. Defaults to None.
+        lean (bool, optional): Decodes only the result items of the responses instead of the whole responses, lowers the memory and CPU per page of large crawls. Defaults to False.
+        fields (List[str], optional): Extracts only these fields of the results, nested fields joined with dots e.g. ['id', 'title', 'duration', 'link', 'channel.id']. The results are then flat dicts keyed by the field names. Defaults to None, all the fields.
+        records (bool, optional): Returns the results as compact records (`VideoRecord`, `ChannelRecord`, `PlaylistRecord`) with `to_dict()` and `to_json()`, instead of dicts. Defaults to False.
     
     Examples:
         Calling `result` method gives the search result.
@@ -419,9 +432,10 @@ class CustomSearch(SearchCore):
             ]
         }
     '''
-    def __init__(self, query: str, searchPreferences: str, limit: int = 200, language: str = 'en', region: str = 'US', timeout: int = None):
+    def __init__(self, query: str, searchPreferences: str, limit: int = 200, language: str = 'en', region: str = 'US', timeout: int = None, continuationKey: str = None, lean: bool = False, fields: List[str] = None, records: bool = False):
         self.searchMode = (True, True, True)
-        super().__init__(query, limit, language, region, searchPreferences, timeout)
+        super().__init__(query, limit, language, region, searchPreferences, timeout, lean, fields, records)
+        self.continuationKey = continuationKey
         self.sync_create()
         self._getComponents(*self.searchMode)
     
@@ -4,30 +4,168 @@ import pandas as pd
 import numpy as np
 from tqdm import tqdm
 import argparse
+import asyncio
 
 import warnings
 warnings.filterwarnings('ignore')
 
 from youtube_search_python.youtubesearchpython.search import * 
+from youtube_search_python.youtubesearchpython.__future__ import BatchSearch, clientPool
+from result_writers import open_writer, RESULT_COLUMNS
+from id_index import open_index
+from search_checkpoint import CheckpointJournal
 
 #--------------------------------------------------------------*****--------------------------------------------------------------#
-def verify_merge(df_temp, df, df_prev, keyword): 
-    #now compare the IDs are unique or not
-    for k in range(len(df_temp)):
-        if df_temp['id'][k] in df['id'].values:
-            print('ID already exists: ',df_temp['id'][k])
-            df_temp.drop(k, inplace=True)
-        #remove is exists in previously collected data/csv
-        elif len(df_temp)!=0:
-            if df_temp['id'][k] in df_prev:
-                print('ID already exists in previous csv: ',df_temp['id'][k])
-                df_temp.drop(k, inplace=True)    
-        # adding keyword column
-        df_temp['keyword'] = keyword
+def to_frame(results):
+    """ 
+        Page of results as a DataFrame, records (--records) only give their ID column
+    """
+    if results and not isinstance(results[0], dict):
+        return pd.DataFrame({'id': [r.id for r in results]})
+    return pd.DataFrame(results)
+
+def verify_merge(df_temp, id_index, keyword): 
+    """ 
+        Drop the results whose ID was already collected (in this run or in previous csv files) and repeated IDs within the page.
+        The whole page is filtered at once with a boolean mask.
+    """
+    if len(df_temp) == 0:
+        return df_temp
+    duplicated = id_index.contains(df_temp['id']) | df_temp['id'].duplicated().values
+    if duplicated.any():
+        print('IDs already exist: ',duplicated.sum())
+    df_temp = df_temp[~duplicated].copy()
+    # adding keyword column
+    df_temp['keyword'] = keyword
 
     return df_temp
 
-def search_YT(csv_file, extra_keyword, batch_size, limit, filter_criterion, searched_csv_root='./searched_csv/'):
+def write_page(writer, results, df_temp, id_index, keyword):
+    """ 
+        Append the results kept by verify_merge to the writer and add their IDs to the index
+    """
+    rows = [results[k] for k in df_temp.index]
+    writer.write(rows, keyword=keyword)
+    id_index.add((row.get('id') for row in rows), keyword=keyword)
+
+def save_checkpoint(journal, writer, id_index, keyword, page, count, continuation_key, ids, done):
+    """ 
+        Record the progress of the keyword in the checkpoint journal.
+        Journal entries are persisted once the results of their page are on disk, the new IDs once every buffered result is.
+    """
+    journal.record(keyword, page, count, continuation_key, ids, done, rows=writer.count+len(writer.buffer))
+    journal.flush(writer.count)
+    if not writer.buffer:
+        id_index.flush()
+
+def search_batch(batch_keywords, extra_keyword, limit, filter_criterion, writer, id_index, journal, lean=False, fields=None, records=False):
+    """ 
+        Sequential search: one keyword at a time, paging with next() 
+    """
+    # Iterate over each keyword in the batch
+    for keyword in batch_keywords:      
+        # skip the keywords completed before the interruption (--resume)
+        if journal.is_done(keyword):
+            print('Already searched: ',keyword)
+            continue
+        print('Keyword: ',keyword)
+        # pages fetched, results received and token of the next page saved by an interrupted run
+        state = journal.state(keyword) or {'page': 0, 'count': 0, 'continuationKey': None}
+        page, count = state['page'], state['count']
+        
+        """ 
+            Core search function
+            return: search results in json format 
+        """
+        try: 
+            # Using getattr to access the filter attribute
+            selected_filter = getattr(VideoFeatures, filter_criterion)
+            # Initialize search object, resuming from the saved continuation token if any
+            search_HDR = CustomSearch(keyword+extra_keyword, selected_filter, limit = limit, continuationKey = state['continuationKey'], lean = lean, fields = fields, records = records)
+        except Exception as e:
+            print('Error occured: ',e)
+            print("keyword: ",keyword)
+            continue
+
+        # Check if the IDs are unique or not before merging
+        results = search_HDR.result()['result']
+        df_temp = to_frame(results)
+        df_temp = verify_merge(df_temp, id_index, keyword)
+        page, count = page + 1, count + len(results)
+
+        # if dataframe lenght zero skip updating. 
+        # a resumed keyword goes on: its first page may be the last one saved before the interruption
+        if len(df_temp) == 0 and (state['page'] == 0 or not results):
+            print('Length of the dataframe: ',len(df_temp))
+            save_checkpoint(journal, writer, id_index, keyword, page, count, search_HDR.continuationKey, [], done=True)
+            continue
+
+        #print 1 title
+        print('First result: ',search_HDR.result()['result'][0].get('title'))
+
+        #appending to the output file
+        write_page(writer, results, df_temp, id_index, keyword)
+        save_checkpoint(journal, writer, id_index, keyword, page, count, search_HDR.continuationKey, df_temp['id'], done=False)
+
+        #next set of 20 results with iteration
+        for i in tqdm(range(page,limit//20)):
+            try:
+                search_HDR.next()
+                results = search_HDR.result()['result']
+                df_temp = to_frame(results)
+            except:
+                print('Error occured: ',search_HDR.result())
+                print("keyword: ",keyword)
+                continue
+                
+            # Check if the IDs are unique or not
+            df_temp = verify_merge(df_temp, id_index, keyword)
+            page, count = page + 1, count + len(results)
+
+            # if dataframe lenght zero break the loop 
+            if len(df_temp) == 0:
+                print('Length of the dataframe: ',len(df_temp))
+                break
+
+            # Append to the output file
+            write_page(writer, results, df_temp, id_index, keyword)
+            save_checkpoint(journal, writer, id_index, keyword, page, count, search_HDR.continuationKey, df_temp['id'], done=False)
+            #print('Next results: ',search_HDR.result()['result'][0]['title'])
+
+        # keyword complete
+        save_checkpoint(journal, writer, id_index, keyword, page, count, search_HDR.continuationKey, [], done=True)
+
+def search_batch_async(batch_keywords, extra_keyword, limit, filter_criterion, writer, id_index, journal, n_workers, max_concurrency, lean=False, fields=None, records=False):
+    """ 
+        Concurrent search: n_workers keyword pipelines page through their continuations concurrently,
+        with at most max_concurrency requests in flight. Pages are merged as soon as they arrive.
+    """
+    selected_filter = getattr(VideoFeatures, filter_criterion)
+    # skip the keywords completed before the interruption (--resume), the others continue from their saved continuation token
+    keywords = [k for k in dict.fromkeys(batch_keywords) if not journal.is_done(k)]
+    checkpoints = {k: journal.state(k) for k in keywords if journal.state(k)}
+    print('Keywords to search: ',len(keywords), ' resumed: ',len(checkpoints))
+    batch = BatchSearch(keywords, selected_filter, limit = limit, extraKeyword = extra_keyword, workers = n_workers, concurrency = max_concurrency, checkpoints = checkpoints, lean = lean, fields = fields, records = records)
+
+    async def run():
+        # close the pooled connections of this event loop once the batch is done
+        async with clientPool:
+            async for page in batch.stream():
+                if page['error']:
+                    print('Error occured: ',page['error'])
+                    print("keyword: ",page['keyword'])
+                    continue
+
+                # Check if the IDs are unique or not before merging
+                df_temp = verify_merge(to_frame(page['result']), id_index, page['keyword'])
+                if len(df_temp) != 0:
+                    write_page(writer, page['result'], df_temp, id_index, page['keyword'])
+                ids = df_temp['id'] if len(df_temp) != 0 else []
+                save_checkpoint(journal, writer, id_index, page['keyword'], page['page'] + 1, page['count'], page['continuationKey'], ids, page['done'])
+
+    asyncio.run(run())
+
+def search_YT(csv_file, extra_keyword, batch_size, limit, filter_criterion, searched_csv_root='./searched_csv/', engine='sync', n_workers=10, max_concurrency=10, output_format='csv', flush_every=1000, id_index_file=None, seen_db=None, resume=False, lean=False, fields=None, records=False, typed=False):
     
     # Create directory for saving csv file batches
     keyword_batch_root = searched_csv_root+csv_file.split("/")[-1].split(".")[0]
@@ -41,12 +179,17 @@ def search_YT(csv_file, extra_keyword, batch_size, limit, filter_criterion, sear
 
     """ 
         Check the previous generated csv files and remove searches if ID already exists
-        NOTE: Checking previous search results. 
+        NOTE: IDs of previous search results are loaded once into the index (or read from id_index_file / seen_db) and updated after every page.
     """
-    df_prev = []
-    for i in os.listdir(searched_csv_root):
-        if os.path.isfile(searched_csv_root+i):
-            df_prev += pd.read_csv(searched_csv_root+i)['id'].values.to_list()
+    id_index = open_index(searched_csv_root, id_index_file, seen_db, filter_criterion, rescan=resume)
+
+    """ 
+        Checkpoint journal: pages fetched, continuation token and saved IDs of every keyword.
+        With resume, completed keywords are skipped and interrupted ones continue from their last saved page.
+        A crash between writing the rows of a page and its journal entry fetches the page again on resume: its rows are
+        dropped as duplicates, since the index is rebuilt from the result files (rescan), so every result is saved once.
+    """
+    journal = CheckpointJournal(keyword_batch_root+'/checkpoint_'+filter_criterion+"_"+extra_keyword.split(" ")[-1]+'.jsonl', resume=resume)
 
     """ 
         NOTE: Divide keywords in batches and save the csv file after each batch to avoid losing collected data due to long run time or system stalls
@@ -56,72 +199,24 @@ def search_YT(csv_file, extra_keyword, batch_size, limit, filter_criterion, sear
         print('Current Batch: ',b/batch_size)
         batch_keywords = keywords[b:b+batch_size]
 
-        # Save the batch of keywords to csv file; can be used to resume the search
+        # Save the batch of keywords to csv file
         pd.DataFrame(batch_keywords).to_csv(keyword_batch_root+'/batch_'+ str(int(b/batch_size))+'.csv', index=False)
 
-        # Empty dataframe with columns for storing search results
-        df = pd.DataFrame(columns=['type', 'id', 'title', 'publishedTime', 'duration', 'viewCount', 'thumbnails', 'richThumbnail', 'descriptionSnippet', 'channel', 'accessibility', 'link', 'shelfTitle'])
-
-        # Iterate over each keyword in the batch
-        for keyword in batch_keywords:      
-            print('Keyword: ',keyword)
-            
-            """ 
-                Core search function
-                return: search results in json format 
-            """
-            try: 
-                # Using getattr to access the filter attribute
-                selected_filter = getattr(VideoFeatures, filter_criterion)
-                # Initialize search object
-                search_HDR = CustomSearch(keyword+extra_keyword, selected_filter, limit = limit)
-            except:
-                print('Error occured: ',search_HDR.result())
-                print("keyword: ",keyword)
-                continue
-
-            # Check if the IDs are unique or not before merging
-            df_temp = pd.DataFrame(search_HDR.result()['result'])
-            df_temp = verify_merge(df_temp, df, df_prev, keyword)
-
-            # if dataframe lenght zero skip updating. 
-            if len(df_temp) == 0:
-                print('Length of the dataframe: ',len(df_temp))
-                continue
-
-            #print 1 title
-            print('First result: ',search_HDR.result()['result'][0]['title'])
-
-            #appending in the dataframe df 
-            df = df.append(df_temp)
-
-            #next set of 20 results with iteration
-            for i in tqdm(range(1,limit//20)):
-                try:
-                    search_HDR.next()
-                    df_temp = pd.DataFrame(search_HDR.result()['result'])
-                except:
-                    print('Error occured: ',search_HDR.result())
-                    print("keyword: ",keyword)
-                    continue
-                    
-                # Check if the IDs are unique or not
-                df_temp = verify_merge(df_temp, df, df_prev, keyword)
-
-                # if dataframe lenght zero break the loop 
-                if len(df_temp) == 0:
-                    print('Length of the dataframe: ',len(df_temp))
-                    break
-
-                # Merge the dataframes
-                df = df.append(df_temp)
-                #print('Next results: ',search_HDR.result()['result'][0]['title'])
+        """ 
+            Results are streamed to the output file and flushed every flush_every rows; only the collected IDs are kept in memory
+        """
+        output_path = searched_csv_root+filter_criterion+"_"+extra_keyword.split(" ")[-1]+"_"+csv_file.split(".")[0].split("/")[-1]+'_batch_'+str(int(b/batch_size))+'.'+output_format
+        columns = fields+['keyword'] if fields else RESULT_COLUMNS
+        with open_writer(output_path, output_format, columns, flush_every=flush_every, typed=typed) as writer:
+            if engine == 'async':
+                search_batch_async(batch_keywords, extra_keyword, limit, filter_criterion, writer, id_index, journal, n_workers, max_concurrency, lean, fields, records)
+            else:
+                search_batch(batch_keywords, extra_keyword, limit, filter_criterion, writer, id_index, journal, lean, fields, records)
+        id_index.flush()
+        journal.flush()
 
-        # Saving as csv file after each batch
-        df.to_csv(searched_csv_root+filter_criterion+"_"+extra_keyword.split(" ")[-1]+"_"+csv_file.split(".")[0].split("/")[-1]+'_batch_'+str(int(b/batch_size))+'.csv', index=False)
-        # print the csv length and first 5 rows
-        print('CSV length: ',len(df))
-        print(df.head())
+        # print the number of saved results
+        print('Results saved: ',writer.count, output_path)
 
 
 #--------------------------------------------------------------*****--------------------------------------------------------------#
@@ -132,9 +227,30 @@ def main():
     parser.add_argument("--batch_size", type=int, default=10000, help="Batch size")
     parser.add_argument("--limit", type=int, default=10000, help="Irrespective of the limit, the results are always 20. Thus need to use next() to get the next 20 results and so on")
     parser.add_argument("--filter_criterion", default="CreativeCommons", help="Filter criterion")
+    parser.add_argument("--engine", default="sync", choices=["sync", "async"], help="sync: one keyword at a time; async: concurrent keyword pipelines")
+    parser.add_argument("--n_workers", type=int, default=10, help="Number of keywords searched concurrently (async engine)")
+    parser.add_argument("--max_concurrency", type=int, default=10, help="Maximum number of search requests in flight (async engine)")
+    parser.add_argument("--output_format", default="csv", choices=["csv", "jsonl", "parquet", "arrow"], help="Format of the saved search results (arrow: Arrow IPC with typed columns)")
+    parser.add_argument("--flush_every", type=int, default=1000, help="Number of results buffered before writing to disk")
+    parser.add_argument("--id_index_file", default=None, help="Append-only file of collected IDs; avoids re-reading previous csv files at startup")
+    parser.add_argument("--seen_db", default=None, help="SQLite seen-ID store shared across runs, processes and the download script (replaces --id_index_file)")
+    parser.add_argument("--resume", action="store_true", help="Continue an interrupted search from its checkpoint journal instead of starting over")
+    parser.add_argument("--lean_parse", action="store_true", help="Decode only the result items of every search response (lower memory and CPU per page)")
+    parser.add_argument("--fields", default=None, help="Comma separated fields kept for every result, e.g. id,title,duration,link,channel.id (must include id). All fields by default")
+    parser.add_argument("--records", action="store_true", help="Keep the results as compact records until they are written (lower memory per result)")
+    parser.add_argument("--typed_columns", action="store_true", help="Write parquet with typed columns (durationSeconds, viewCount as int64, channelId, thumbnail URL lists) instead of JSON strings")
     args = parser.parse_args()
+    fields = args.fields.split(',') if args.fields else None
+    if fields and 'id' not in fields:
+        parser.error("--fields must include id, results are de-duplicated on their ID")
+    if fields and args.records:
+        parser.error("--fields and --records can not be used together")
+    if args.typed_columns and args.output_format != 'parquet':
+        parser.error("--typed_columns requires --output_format parquet (arrow output is always typed)")
+    if fields and (args.typed_columns or args.output_format == 'arrow'):
+        parser.error("--fields can not be used with typed columns, they are built from the full results")
     
-    search_YT(args.csv_file, args.extra_keyword, args.batch_size, args.limit, args.filter_criterion)
+    search_YT(args.csv_file, args.extra_keyword, args.batch_size, args.limit, args.filter_criterion, engine=args.engine, n_workers=args.n_workers, max_concurrency=args.max_concurrency, output_format=args.output_format, flush_every=args.flush_every, id_index_file=args.id_index_file, seen_db=args.seen_db, resume=args.resume, lean=args.lean_parse, fields=fields, records=args.records, typed=args.typed_columns)
 
 #--------------------------------------------------------------*****--------------------------------------------------------------#
 if __name__ == "__main__":
@@ -144,6 +260,7 @@ if __name__ == "__main__":
 """"
 IMPORTANT: 
 
-For batchwise: check all batches of csv and drop duplicate ids as it was not handled in this batchwise code!!
+For batchwise: IDs are de-duplicated across batches and previous result files through the ID index.
+Result files written before the index was introduced may still contain duplicates between batches.
 
 """